@@ -2,21 +2,182 @@
 Concrete implementation of AIPort using OpenAI GPT-4o-mini + Instructor.
 """
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import Final
+
+import httpx  # type: ignore
 import instructor  # type: ignore
+import orjson  # type: ignore
+import tiktoken  # type: ignore
 from openai import AsyncOpenAI  # type: ignore
 
-from app.domain.models import AIEnrichment, ChatMessage, MissingSkillsExtraction, MockScorecard  # type: ignore
+from app.domain.models import (  # type: ignore
+    AIEnrichment,
+    BatchEnrichment,
+    ChatMessage,
+    MissingSkillsExtraction,
+    MockScorecard,
+)
 from app.ports.ai_port import AIPort  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# Batch prompting: jobs packed into one prompt. Kept small so each job still
+# gets enough attention and the request fits the context window.
+_PROMPT_BATCH_SIZE = 5
+
+# Max concurrent completions issued by generate_enrichment_batch
+_REALTIME_CONCURRENCY = 20
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    # gpt-4o / gpt-4o-mini tokenizer; loaded lazily (first use may download the BPE file)
+    return tiktoken.get_encoding("o200k_base")
+
+
+# Generous characters-per-token bound for o200k (English text averages ~4).
+# Text is cut to max_tokens * this many characters before tokenizing, so a
+# long document is never fully encoded just to be truncated.
+_MAX_CHARS_PER_TOKEN = 8
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to at most max_tokens model tokens (the pricing unit)."""
+    if len(text) <= max_tokens:
+        return text  # every token covers at least one character
+    head = text[: max_tokens * _MAX_CHARS_PER_TOKEN]
+    ids = _get_encoding().encode(head)
+    if len(ids) <= max_tokens:
+        return head
+    return _get_encoding().decode(ids[:max_tokens])
+
+
+@lru_cache(maxsize=1)
+def _enrichment_tool() -> dict:
+    # AIEnrichment's function-calling schema for Batch API lines; built once.
+    return {
+        "type": "function",
+        "function": {
+            "name": AIEnrichment.__name__,
+            "description": AIEnrichment.__doc__ or "",
+            "parameters": AIEnrichment.model_json_schema(),
+        },
+    }
+
+
+# ── System prompts ────────────────────────────────────────────
+# Kept byte-identical across calls with all per-request content placed after
+# them, so OpenAI's automatic prompt-prefix caching can hit.
+
+_SYS_ENRICHMENT: Final[str] = (
+    "You are an expert career coach. Given a specific job posting, "
+    "you MUST produce exactly 5 resume optimization bullet points, "
+    "exactly 5 technical interview questions, AND a list of the top 5-10 "
+    "technical skills required for the role based on the description. "
+    "For each interview question, provide a specific 'answer_strategy' "
+    "that explains EXACTLY what the interviewer is looking for and "
+    "what key technical concepts or experiences the candidate should highlight. "
+    "ALSO, identify and extract the required 'qualification' and 'experience' levels. "
+    "ALSO, estimate the annual salary range for this role (prefer INR/LPA format like '₹4 LPA - ₹7 LPA') "
+    "based on the description or standard market rates for this title/company. "
+    "Be HIGHLY SPECIFIC to this exact role and company — "
+    "reference the company name, role title, and specific "
+    "technologies/skills mentioned in the description. "
+    "Do NOT give generic advice."
+)
+
+_SYS_BATCH_ENRICHMENT: Final[str] = (
+    f"{_SYS_ENRICHMENT} "
+    "You will receive several separate job postings labelled [1], [2], ... "
+    "Return exactly one enrichment per job, in the same order."
+)
+
+_SYS_MISSING_SKILLS: Final[str] = (
+    "You are a strict technical recruiter. Compare the candidate's resume "
+    "against the required skills list. "
+    "Return ONLY the skills from the required list that are completely missing "
+    "or significantly weak in the resume. "
+    "Do not include soft skills. "
+    "Do not hallucinate skills not in the required list."
+)
+
+_SYS_CHAT: Final[str] = (
+    "You are a personalized career coach on Ottobon (jobs.ottobon.cloud). "
+    "You help candidates understand job requirements, identify skill gaps, "
+    "optimize their resumes, and prepare for interviews. "
+    "Be specific, actionable, and encouraging. "
+    "Reference the candidate's actual skills and experience when available."
+)
+
+_SYS_GAP: Final[str] = (
+    "You are a helpful career coach. You are analyzing the gap between a candidate's resume and a job description. "
+    "Identify the key missing skills or experiences that likely caused a lower match score. "
+    "Provide a brief, encouraging, but direct explanation (2-3 sentences max). "
+    "Do not list everything, just the most critical missing requirements. "
+    "Address the candidate directly as 'you'."
+)
+
+_SYS_TAILOR: Final[str] = (
+    "You are an expert ATS specialist and resume writer. "
+    "Your task is to REWRITE the candidate's resume to specifically target the provided job description. "
+    "1. Keep the candidate's truth - do not invent experiences they don't have. "
+    "2. Rephrase bullet points to use keywords from the JD (e.g., if JD says 'collaborated with cross-functional teams' and candidate says 'worked with others', update it). "
+    "3. Add a 'Targeted Professional Summary' at the top. "
+    "4. Output the result in clean Markdown format."
+)
+
+_SYS_BLOG: Final[str] = (
+    "You are an expert technical writer for the Ottobon Jobs blog. "
+    "Generate a high-quality, engaging blog post based on the user's prompt. "
+    "Output valid JSON with the following keys: "
+    "'slug' (URL-friendly string), "
+    "'title' (Catchy title), "
+    "'summary' (2-3 sentence teaser), "
+    "'content' (Full article in Markdown format). "
+    "Ensure the content is professional and insightful."
+)
+
+_SYS_MOCK_EVAL: Final[str] = (
+    "You are a senior technical interviewer evaluating a candidate's mock interview. "
+    "Assess their responses against the job description. "
+    "Score each dimension from 1-10: "
+    "technical_accuracy (correctness of technical answers), "
+    "clarity (how well they communicate their thoughts), "
+    "confidence (how composed and assertive they are). "
+    "Provide summary_notes with specific, constructive feedback "
+    "highlighting strengths and areas for improvement."
+)
+
 
 class OpenAIAdapter(AIPort):
     """Talks to OpenAI's chat completions API for structured + freeform output."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini") -> None:
-        self._raw_client = AsyncOpenAI(api_key=api_key, timeout=30.0)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        # http_client: optional pooled client shared with other OpenAI adapters
+        # so warm keep-alive connections are reused across calls.
+        self._raw_client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=http_client,
+            timeout=30.0,
+            max_retries=2,
+        )
         self._instructor_client = instructor.from_openai(self._raw_client)
         self._model = model
 
+    @property
+    def model(self) -> str:
+        """Default chat model; part of response-cache keys."""
+        return self._model
+
     async def generate_enrichment(
         self,
         description: str,
@@ -26,45 +187,184 @@ class OpenAIAdapter(AIPort):
     ) -> AIEnrichment:
         """Use Instructor to force GPT output into the AIEnrichment schema."""
 
-        skills_text = ", ".join(skills) if skills else "Not specified"
-        role_header = f"{title} at {company_name}" if title and company_name else (title or "this role")
-
         result = await self._instructor_client.chat.completions.create(
             model=self._model,
             response_model=AIEnrichment,
+            messages=self._enrichment_messages(description, skills, title, company_name),
+        )
+        return result
+
+    async def generate_enrichment_batch(self, jobs: list[dict]) -> list[AIEnrichment]:
+        """
+        Real-time enrichment of many jobs; results are returned in input order.
+
+        Jobs are packed _PROMPT_BATCH_SIZE to a prompt so the system
+        instructions are sent once per chunk, and chunks run concurrently
+        (at most _REALTIME_CONCURRENCY in flight). A chunk whose structured
+        output doesn't line up falls back to one generate_enrichment call per
+        job. For offline bulk work use submit_batch_enrichment() instead.
+        Each job dict uses 'description_raw', 'skills_required', 'title', 'company_name'.
+        """
+        sem = asyncio.Semaphore(_REALTIME_CONCURRENCY)
+
+        async def _single(job: dict) -> AIEnrichment:
+            async with sem:
+                return await self.generate_enrichment(
+                    job.get("description_raw") or "",
+                    job.get("skills_required") or [],
+                    title=job.get("title") or "",
+                    company_name=job.get("company_name") or "",
+                )
+
+        async def _chunk(chunk: list[dict]) -> list[AIEnrichment]:
+            if len(chunk) == 1:
+                return [await _single(chunk[0])]
+            try:
+                async with sem:
+                    return await self._enrich_prompt_batch(chunk)
+            except Exception as exc:
+                logger.warning("Batch-prompted enrichment failed (%s); enriching %d jobs individually", exc, len(chunk))
+                return list(await asyncio.gather(*(_single(job) for job in chunk)))
+
+        chunks = await asyncio.gather(*(
+            _chunk(jobs[start:start + _PROMPT_BATCH_SIZE])
+            for start in range(0, len(jobs), _PROMPT_BATCH_SIZE)
+        ))
+        return [item for chunk in chunks for item in chunk]
+
+    async def _enrich_prompt_batch(self, chunk: list[dict]) -> list[AIEnrichment]:
+        """Enrich up to _PROMPT_BATCH_SIZE jobs with a single prompt."""
+        sections = []
+        for i, job in enumerate(chunk, 1):
+            skills = job.get("skills_required") or []
+            title = job.get("title") or ""
+            company = job.get("company_name") or ""
+            role_header = f"{title} at {company}" if title and company else (title or "this role")
+            sections.append(
+                f"## Job [{i}]\n"
+                f"### Role: {role_header}\n\n"
+                f"### Job Description\n{job.get('description_raw') or ''}\n\n"
+                f"### Required Skills\n{', '.join(skills) if skills else 'Not specified'}"
+            )
+
+        batch = await self._instructor_client.chat.completions.create(
+            model=self._model,
+            response_model=BatchEnrichment,
             messages=[
                 {
                     "role": "system",
-                    "content": (
-                        "You are an expert career coach. Given a specific job posting, "
-                        "you MUST produce exactly 5 resume optimization bullet points, "
-                        "exactly 5 technical interview questions, AND a list of the top 5-10 "
-                        "technical skills required for the role based on the description. "
-                        "For each interview question, provide a specific 'answer_strategy' "
-                        "that explains EXACTLY what the interviewer is looking for and "
-                        "what key technical concepts or experiences the candidate should highlight. "
-                        "ALSO, identify and extract the required 'qualification' and 'experience' levels. "
-                        "ALSO, estimate the annual salary range for this role (prefer INR/LPA format like '₹4 LPA - ₹7 LPA') "
-                        "based on the description or standard market rates for this title/company. "
-                        "Be HIGHLY SPECIFIC to this exact role and company — "
-                        "reference the company name, role title, and specific "
-                        "technologies/skills mentioned in the description. "
-                        "Do NOT give generic advice."
-                    ),
+                    "content": _SYS_BATCH_ENRICHMENT,
                 },
                 {
                     "role": "user",
                     "content": (
-                        f"## Role: {role_header}\n\n"
-                        f"## Job Description\n{description}\n\n"
-                        f"## Required Skills\n{skills_text}\n\n"
-                        "Generate the resume guide and prep questions now. "
-                        "Make them specific to this exact role and company."
+                        "\n\n".join(sections)
+                        + f"\n\nGenerate exactly {len(chunk)} enrichments now, one per job in order [1]..[{len(chunk)}]."
                     ),
                 },
             ],
         )
-        return result
+        if len(batch.items) != len(chunk):
+            raise ValueError(
+                f"Batch enrichment returned {len(batch.items)} items for {len(chunk)} jobs"
+            )
+        return batch.items
+
+    @staticmethod
+    def _enrichment_messages(
+        description: str, skills: list[str], title: str, company_name: str
+    ) -> list[dict[str, str]]:
+        """Build the enrichment prompt shared by the realtime and Batch API paths."""
+        skills_text = ", ".join(skills) if skills else "Not specified"
+        role_header = f"{title} at {company_name}" if title and company_name else (title or "this role")
+
+        return [
+            {
+                "role": "system",
+                "content": _SYS_ENRICHMENT,
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"## Role: {role_header}\n\n"
+                    f"## Job Description\n{description}\n\n"
+                    f"## Required Skills\n{skills_text}\n\n"
+                    "Generate the resume guide and prep questions now. "
+                    "Make them specific to this exact role and company."
+                ),
+            },
+        ]
+
+    # ── OpenAI Batch API (non-interactive bulk enrichment) ────
+
+    async def submit_batch_enrichment(self, jobs: list[dict]) -> str:
+        """
+        Submit many job enrichments through OpenAI's Batch API.
+
+        The Batch API has a 24-hour completion window but costs ~50% less and
+        uses a separate rate-limit pool — ideal for scraper-driven enrichment.
+        Each job dict needs 'id' and 'description_raw'; 'skills_required',
+        'title' and 'company_name' are optional. Returns the batch ID.
+        """
+        tool = _enrichment_tool()
+        lines = []
+        for job in jobs:
+            body = {
+                "model": self._model,
+                "messages": self._enrichment_messages(
+                    job.get("description_raw") or "",
+                    job.get("skills_required") or [],
+                    job.get("title") or "",
+                    job.get("company_name") or "",
+                ),
+                "tools": [tool],
+                "tool_choice": {"type": "function", "function": {"name": AIEnrichment.__name__}},
+            }
+            lines.append(orjson.dumps({
+                "custom_id": str(job["id"]),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }))
+
+        input_file = await self._raw_client.files.create(
+            file=("enrichment_batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await self._raw_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def poll_batch(self, batch_id: str) -> dict[str, AIEnrichment] | None:
+        """
+        Check a submitted enrichment batch.
+
+        Returns None while the batch is still running, otherwise a mapping of
+        custom_id (job ID) → AIEnrichment for every line that parsed cleanly.
+        Raises RuntimeError if the batch failed, expired or was cancelled.
+        """
+        batch = await self._raw_client.batches.retrieve(batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+        if batch.status != "completed" or not batch.output_file_id:
+            return None
+
+        content = await self._raw_client.files.content(batch.output_file_id)
+        results: dict[str, AIEnrichment] = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = orjson.loads(line)
+                message = item["response"]["body"]["choices"][0]["message"]
+                arguments = message["tool_calls"][0]["function"]["arguments"]
+                results[item["custom_id"]] = AIEnrichment.model_validate_json(arguments)
+            except Exception as exc:
+                logger.warning("Skipping unparseable batch line in %s: %s", batch_id, exc)
+        return results
 
     async def extract_missing_skills(self, resume_text: str, required_skills: list[str]) -> list[str]:
         """Identify missing skills using structured output."""
@@ -80,20 +380,13 @@ class OpenAIAdapter(AIPort):
             messages=[
                 {
                     "role": "system",
-                    "content": (
-                        "You are a strict technical recruiter. Compare the candidate's resume "
-                        "against the required skills list. "
-                        "Return ONLY the skills from the required list that are completely missing "
-                        "or significantly weak in the resume. "
-                        "Do not include soft skills. "
-                        "Do not hallucinate skills not in the required list."
-                    ),
+                    "content": _SYS_MISSING_SKILLS,
                 },
                 {
                     "role": "user",
                     "content": (
                         f"## Required Skills\n{skills_text}\n\n"
-                        f"## Candidate Resume\n{resume_text[:3000]}\n\n" # type: ignore # Truncate for cost/speed
+                        f"## Candidate Resume\n{_truncate_tokens(resume_text, 800)}\n\n" # Truncate for cost/speed
                         "Extract the missing skills now."
                     ),
                 },
@@ -107,18 +400,40 @@ class OpenAIAdapter(AIPort):
     ) -> str:
         """Standard chat completion for the Control Tower AI mode."""
 
-        base_prompt = (
-            "You are a personalized career coach on Ottobon (jobs.ottobon.cloud). "
-            "You help candidates understand job requirements, identify skill gaps, "
-            "optimize their resumes, and prepare for interviews. "
-            "Be specific, actionable, and encouraging. "
-            "Reference the candidate's actual skills and experience when available."
+        response = await self._raw_client.chat.completions.create(
+            model=self._model,
+            messages=self._chat_messages(history, user_context),
+            max_tokens=512,
         )
+        return response.choices[0].message.content or ""
+
+    async def chat_stream(
+        self, history: list[ChatMessage], user_context: str = ""
+    ) -> AsyncIterator[str]:
+        """Streaming variant of chat(): yields content deltas as they arrive."""
+
+        stream = await self._raw_client.chat.completions.create(
+            model=self._model,
+            messages=self._chat_messages(history, user_context),
+            max_tokens=512,
+            stream=True,
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    @staticmethod
+    def _chat_messages(history: list[ChatMessage], user_context: str) -> list[dict[str, str]]:
+        """Build the coach system prompt + conversation for chat/chat_stream."""
 
+        # Per-user context goes after the fixed prompt so the prefix stays cacheable.
         if user_context:
-            system_content = f"{base_prompt}\n\n{user_context}"
+            system_content = f"{_SYS_CHAT}\n\n{user_context}"
         else:
-            system_content = base_prompt
+            system_content = _SYS_CHAT
 
         messages = [{"role": "system", "content": system_content}]
 
@@ -126,44 +441,85 @@ class OpenAIAdapter(AIPort):
             role = "user" if msg.role == "user" else "assistant"
             messages.append({"role": role, "content": msg.content})
 
-        response = await self._raw_client.chat.completions.create(
-            model=self._model,
-            messages=messages,
-            max_tokens=512,
-        )
-        return response.choices[0].message.content or ""
+        return messages
 
     async def analyze_gap(self, resume_text: str, job_description: str) -> str:
         """
         Generate a concise explanation of the skill gap.
         """
-        messages = [
+        response = await self._raw_client.chat.completions.create(
+            model=self._model,
+            messages=self._gap_messages(resume_text, job_description),
+            max_tokens=150,
+        )
+        return response.choices[0].message.content or "We identified some missing key requirements compared to the job description."
+
+    async def analyze_gap_stream(self, resume_text: str, job_description: str) -> AsyncIterator[str]:
+        """Streaming variant of analyze_gap(): yields content deltas as they arrive."""
+        stream = await self._raw_client.chat.completions.create(
+            model=self._model,
+            messages=self._gap_messages(resume_text, job_description),
+            max_tokens=150,
+            stream=True,
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    @staticmethod
+    def _gap_messages(resume_text: str, job_description: str) -> list[dict[str, str]]:
+        """Build the gap-analysis prompt for analyze_gap/analyze_gap_stream."""
+        return [
             {
                 "role": "system",
-                "content": (
-                    "You are a helpful career coach. You are analyzing the gap between a candidate's resume and a job description. "
-                    "Identify the key missing skills or experiences that likely caused a lower match score. "
-                    "Provide a brief, encouraging, but direct explanation (2-3 sentences max). "
-                    "Do not list everything, just the most critical missing requirements. "
-                    "Address the candidate directly as 'you'."
-                ),
+                "content": _SYS_GAP,
             },
             {
                 "role": "user",
                 "content": (
-                    f"## Job Description\n{job_description[:4000]}\n\n" # type: ignore
-                    f"## Candidate Resume\n{resume_text[:4000]}\n\n" # type: ignore
+                    f"## Job Description\n{_truncate_tokens(job_description, 1000)}\n\n"
+                    f"## Candidate Resume\n{_truncate_tokens(resume_text, 1000)}\n\n"
                     "Explain the gap briefly."
                 ),
             },
         ]
 
-        response = await self._raw_client.chat.completions.create(
-            model=self._model,
-            messages=messages,
-            max_tokens=150,
+    async def analyze_bundle(
+        self,
+        resume_text: str,
+        job_description: str,
+        required_skills: list[str],
+        tailor: bool = False,
+    ) -> tuple[list[str], str | None, str | None]:
+        """
+        Fan the independent resume-vs-job calls out with asyncio.gather so the
+        flow costs one OpenAI round-trip (the slowest) instead of the sum.
+        Each part fails independently and is logged rather than raised.
+        """
+        async def _skip(default):
+            return default
+
+        missing, gap, tailored = await asyncio.gather(
+            self.extract_missing_skills(resume_text, required_skills)
+            if required_skills else _skip([]),
+            self.analyze_gap(resume_text, job_description),
+            self.tailor_resume(resume_text, job_description) if tailor else _skip(None),
+            return_exceptions=True,
         )
-        return response.choices[0].message.content or "We identified some missing key requirements compared to the job description."
+
+        if isinstance(missing, BaseException):
+            logger.error("Skills extraction failed: %s", missing)
+            missing = []
+        if isinstance(gap, BaseException):
+            logger.error("Gap analysis failed: %s", gap)
+            gap = None
+        if isinstance(tailored, BaseException):
+            logger.error("Resume tailoring failed: %s", tailored)
+            tailored = None
+        return missing, gap, tailored
 
     async def tailor_resume(self, resume_text: str, job_description: str) -> str:
         """
@@ -172,20 +528,13 @@ class OpenAIAdapter(AIPort):
         messages = [
             {
                 "role": "system",
-                "content": (
-                    "You are an expert ATS specialist and resume writer. "
-                    "Your task is to REWRITE the candidate's resume to specifically target the provided job description. "
-                    "1. Keep the candidate's truth - do not invent experiences they don't have. "
-                    "2. Rephrase bullet points to use keywords from the JD (e.g., if JD says 'collaborated with cross-functional teams' and candidate says 'worked with others', update it). "
-                    "3. Add a 'Targeted Professional Summary' at the top. "
-                    "4. Output the result in clean Markdown format."
-                ),
+                "content": _SYS_TAILOR,
             },
             {
                 "role": "user",
                 "content": (
-                    f"## Target Job\n{job_description[:4000]}\n\n" # type: ignore
-                    f"## Current Resume\n{resume_text[:4000]}\n\n" # type: ignore
+                    f"## Target Job\n{_truncate_tokens(job_description, 1000)}\n\n"
+                    f"## Current Resume\n{_truncate_tokens(resume_text, 1000)}\n\n"
                     "Rewrite my resume now."
                 ),
             },
@@ -201,32 +550,14 @@ class OpenAIAdapter(AIPort):
         """
         Generate a structured blog post using OpenAI.
         """
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are an expert technical writer for the Ottobon Jobs blog. "
-                    "Generate a high-quality, engaging blog post based on the user's prompt. "
-                    "Output valid JSON with the following keys: "
-                    "'slug' (URL-friendly string), "
-                    "'title' (Catchy title), "
-                    "'summary' (2-3 sentence teaser), "
-                    "'content' (Full article in Markdown format). "
-                    "Ensure the content is professional and insightful."
-                ),
-            },
-            {"role": "user", "content": prompt},
-        ]
-
         response = await self._raw_client.chat.completions.create(
             model="gpt-4o",
-            messages=messages,
+            messages=self._blog_messages(prompt),
             response_format={"type": "json_object"},
         )
         
         try:
-            import json
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(response.choices[0].message.content)
         except Exception:
             return {
                 "slug": "ai-generated-post",
@@ -235,6 +566,29 @@ class OpenAIAdapter(AIPort):
                 "content": response.choices[0].message.content
             }
 
+    async def generate_blog_post_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Streaming variant of generate_blog_post(): yields raw JSON deltas."""
+
+        stream = await self._raw_client.chat.completions.create(
+            model="gpt-4o",
+            messages=self._blog_messages(prompt),
+            response_format={"type": "json_object"},
+            stream=True,
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    @staticmethod
+    def _blog_messages(prompt: str) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": _SYS_BLOG},
+            {"role": "user", "content": prompt},
+        ]
+
     async def evaluate_mock_interview(
         self, transcript: list[dict[str, str]], job_description: str
     ) -> MockScorecard:
@@ -254,21 +608,12 @@ class OpenAIAdapter(AIPort):
             messages=[
                 {
                     "role": "system",
-                    "content": (
-                        "You are a senior technical interviewer evaluating a candidate's mock interview. "
-                        "Assess their responses against the job description. "
-                        "Score each dimension from 1-10: "
-                        "technical_accuracy (correctness of technical answers), "
-                        "clarity (how well they communicate their thoughts), "
-                        "confidence (how composed and assertive they are). "
-                        "Provide summary_notes with specific, constructive feedback "
-                        "highlighting strengths and areas for improvement."
-                    ),
+                    "content": _SYS_MOCK_EVAL,
                 },
                 {
                     "role": "user",
                     "content": (
-                        f"## Job Description\n{job_description[:3000]}\n\n" # type: ignore
+                        f"## Job Description\n{_truncate_tokens(job_description, 800)}\n\n"
                         f"## Interview Transcript\n{formatted}\n\n"
                         "Evaluate this candidate now."
                     ),
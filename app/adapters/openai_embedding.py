@@ -1,11 +1,34 @@
 """
 Concrete implementation of EmbeddingPort using OpenAI text-embedding-3-small.
+
+Concurrent encode() calls are coalesced by a micro-batching worker: requests
+arriving within a short window are sent as one embeddings.create(input=[...])
+call and the response vectors are routed back to each awaiting caller.
+Identical texts in flight at the same time share one future, and recent
+results are kept briefly so hot job descriptions are not re-embedded.
 """
 
+import asyncio
+import hashlib
+from functools import partial
+
+import httpx  # type: ignore
+from cachetools import TTLCache  # type: ignore
 from openai import AsyncOpenAI
 
 from app.ports.embedding_port import EmbeddingPort
 
+# Truncate extremely long texts to stay within token limits
+_MAX_INPUT_CHARS = 8000
+
+# Micro-batching: flush after this many queued texts or this many seconds
+_BATCH_MAX_SIZE = 64
+_BATCH_WINDOW_S = 0.010
+
+# Recently computed vectors, keyed on the SHA-1 of the truncated input
+_RESULT_CACHE_SIZE = 1024
+_RESULT_CACHE_TTL_S = 300
+
 
 class OpenAIEmbeddingAdapter(EmbeddingPort):
     """Generates 384-dimension embeddings via OpenAI's embedding API."""
@@ -15,20 +38,111 @@ class OpenAIEmbeddingAdapter(EmbeddingPort):
         api_key: str,
         model: str = "text-embedding-3-small",
         dimensions: int = 384,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=http_client,
+            timeout=30.0,
+            max_retries=2,
+        )
         self._model = model
         self._dimensions = dimensions
 
+        # Batching worker is started lazily inside the running event loop
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+        # Request coalescing: one in-flight future per distinct input
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._results: TTLCache = TTLCache(maxsize=_RESULT_CACHE_SIZE, ttl=_RESULT_CACHE_TTL_S)
+
     async def encode(self, text: str) -> list[float]:
-        """Encode text into a 384-d float vector."""
+        """Encode text into a 384-d float vector (coalesced with concurrent calls)."""
+        truncated = text[:_MAX_INPUT_CHARS]
+        key = hashlib.sha1(truncated.encode()).hexdigest()
+
+        cached = self._results.get(key)
+        if cached is not None:
+            return list(cached)
 
-        # Truncate extremely long texts to stay within token limits
-        truncated = text[:8000]
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is None or future.get_loop() is not loop:
+            future = loop.create_future()
+            future.add_done_callback(partial(self._settle, key))
+            self._inflight[key] = future
+            self._ensure_worker().put_nowait((truncated, future))
+
+        # Shielded so one cancelled caller doesn't cancel the shared request
+        return list(await asyncio.shield(future))
+
+    def _settle(self, key: str, future: asyncio.Future) -> None:
+        """Drop the in-flight entry and remember a successful result."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled() and future.exception() is None:
+            self._results[key] = future.result()
+
+    async def encode_many(self, texts: list[str]) -> list[list[float]]:
+        """Encode several texts in a single API request, preserving input order."""
+        if not texts:
+            return []
 
         response = await self._client.embeddings.create(
-            input=truncated,
+            input=[t[:_MAX_INPUT_CHARS] for t in texts],
             model=self._model,
             dimensions=self._dimensions,
         )
-        return response.data[0].embedding
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return [item.embedding for item in ordered]
+
+    # ── Micro-batching ────────────────────────────────────────
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start (or restart on a new event loop) the batching worker."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._queue is None
+            or self._worker is None
+            or self._worker.done()
+            or self._worker.get_loop() is not loop
+        ):
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._drain(self._queue))
+        return self._queue
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Collect up to _BATCH_MAX_SIZE items or _BATCH_WINDOW_S, then flush."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _BATCH_WINDOW_S
+            while len(batch) < _BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Flush concurrently so the next batch can start filling immediately
+            task = loop.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Send one batched request and resolve each caller's future by index."""
+        try:
+            vectors = await self.encode_many([text for text, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
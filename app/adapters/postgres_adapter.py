@@ -0,0 +1,134 @@
+"""
+SupabaseAdapter with direct Postgres reads for the hot endpoints.
+
+User profile, job detail, the public job feed, the provider dashboard and
+the market-stats aggregate are served over an asyncpg pool — one
+binary-protocol round-trip instead of an HTTP hop through PostgREST. Writes,
+other RPCs and everything else still go through the inherited PostgREST
+paths, as do all reads until a pool is attached (Celery workers and scripts
+never attach one).
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import asyncpg  # type: ignore
+import httpx  # type: ignore
+import orjson  # type: ignore
+from supabase import Client  # type: ignore
+
+from app.adapters.supabase_adapter import SupabaseAdapter, _coerce_prep_guide  # type: ignore
+
+
+def _select_list(columns: tuple[str, ...] | None) -> str:
+    return ", ".join(f'"{c}"' for c in columns) if columns else "*"
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _row(record: asyncpg.Record | None) -> dict[str, Any] | None:
+    """Record → dict shaped like PostgREST's JSON (string UUIDs and timestamps)."""
+    if record is None:
+        return None
+    return {key: _jsonable(value) for key, value in record.items()}
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    # Decode json/jsonb columns to Python objects, as PostgREST would
+    for typ in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typ,
+            schema="pg_catalog",
+            encoder=lambda v: orjson.dumps(v).decode(),
+            decoder=orjson.loads,
+        )
+
+
+async def create_pool(dsn: str) -> asyncpg.Pool:
+    """Connection pool for PostgresAdapter (opened in the app lifespan)."""
+    return await asyncpg.create_pool(
+        dsn,
+        min_size=5,
+        max_size=20,
+        command_timeout=30,
+        # Supabase's pooler runs in transaction mode, where server-side
+        # prepared statements can't be reused across checkouts
+        statement_cache_size=0,
+        init=_init_connection,
+    )
+
+
+class PostgresAdapter(SupabaseAdapter):
+    """DatabasePort whose hot read paths bypass PostgREST once a pool is attached."""
+
+    def __init__(self, client: Client, http: httpx.AsyncClient | None = None) -> None:
+        super().__init__(client=client, http=http)
+        self._pool: asyncpg.Pool | None = None
+
+    def attach_pool(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+
+    def detach_pool(self) -> asyncpg.Pool | None:
+        pool, self._pool = self._pool, None
+        return pool
+
+    # ── Point reads (caching stays in SupabaseAdapter) ────────
+
+    async def _fetch_user(self, user_id: str) -> dict[str, Any] | None:
+        if self._pool is None:
+            return await super()._fetch_user(user_id)
+        return _row(await self._pool.fetchrow("SELECT * FROM users_jobs WHERE id = $1", user_id))
+
+    async def _fetch_job(
+        self, job_id: str, columns: tuple[str, ...] | None = None
+    ) -> dict[str, Any] | None:
+        if self._pool is None:
+            return await super()._fetch_job(job_id, columns)
+        return _row(await self._pool.fetchrow(
+            f"SELECT {_select_list(columns)} FROM jobs_jobs WHERE id = $1", job_id
+        ))
+
+    # ── List reads ────────────────────────────────────────────
+
+    async def list_jobs_by_provider(
+        self, provider_id: str, columns: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        if self._pool is None:
+            return await super().list_jobs_by_provider(provider_id, columns)
+        records = await self._pool.fetch(
+            f"SELECT {_select_list(columns)} FROM jobs_jobs "
+            "WHERE provider_id = $1 ORDER BY created_at DESC",
+            provider_id,
+        )
+        return [_coerce_prep_guide(_row(r)) for r in records]
+
+    async def list_active_jobs(
+        self, skip: int = 0, limit: int = 20, columns: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        if self._pool is None:
+            return await super().list_active_jobs(skip, limit, columns)
+        records = await self._pool.fetch(
+            f"SELECT {_select_list(columns)} FROM jobs_jobs WHERE status = 'active' "
+            "ORDER BY created_at DESC OFFSET $1 LIMIT $2",
+            skip,
+            limit,
+        )
+        return [_row(r) for r in records]
+
+    # ── Aggregates ────────────────────────────────────────────
+
+    async def get_jobs_analytics(self) -> dict[str, Any]:
+        if self._pool is None:
+            return await super().get_jobs_analytics()
+        # jsonb comes back already decoded by the pool's type codec
+        return await self._pool.fetchval("SELECT jobs_analytics()") or {}
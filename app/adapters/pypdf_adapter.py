@@ -1,26 +1,19 @@
 """
-Concrete implementation of PdfPort using pypdf.
-"""
+Concrete implementation of PdfPort.
 
-import io
+Kept as a thin wrapper around DocumentAdapter's PyMuPDF path so there is
+a single fast PDF extraction implementation in the codebase.
+"""
 
-from pypdf import PdfReader
+import asyncio
 
+from app.adapters.document_adapter import DocumentAdapter
 from app.ports.pdf_port import PdfPort
 
 
 class PyPdfAdapter(PdfPort):
-    """Extracts text from PDF files using pypdf."""
+    """Extracts text from PDF files using PyMuPDF (via DocumentAdapter)."""
 
     async def extract_text(self, file_bytes: bytes) -> str:
         """Read all pages and concatenate text."""
-
-        reader = PdfReader(io.BytesIO(file_bytes))
-        pages_text: list[str] = []
-
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                pages_text.append(text.strip())
-
-        return "\n\n".join(pages_text)
+        return await asyncio.to_thread(DocumentAdapter._extract_pdf, file_bytes)
@@ -7,6 +7,8 @@ Subclasses OpenAIAdapter to override tailor_resume() with:
   - Explicit Anti-Fabrication rules in the system prompt
 """
 
+import orjson  # type: ignore
+
 from app.adapters.openai_adapter import OpenAIAdapter
 
 
@@ -65,9 +67,8 @@ class ResumeAIAdapter(OpenAIAdapter):
             max_tokens=3000,     # prevent runaway generation but allow enough space for both
         )
         content = response.choices[0].message.content
-        import json
         try:
-            return json.loads(content)
+            return orjson.loads(content)
         except Exception:
             return {
                 "tailored_resume": content or "Failed to tailor resume.",
@@ -1,87 +1,211 @@
 """
-Concrete implementation of DatabasePort using the Supabase Python client.
+Concrete implementation of DatabasePort using Supabase's PostgREST API.
+
+Queries go straight to /rest/v1 over an async httpx client; the synchronous
+supabase-py Client is still held (as ``_client``) for maintenance scripts and
+admin paths that build their own queries.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
+from uuid import UUID
 
+import httpx  # type: ignore
+import orjson  # type: ignore
+from cachetools import TTLCache  # type: ignore
 from supabase import Client  # type: ignore
 
 from app.ports.database_port import DatabasePort  # type: ignore
 
+_OBJECT = {"Accept": "application/vnd.pgrst.object+json"}
+_JSON = {"Content-Type": "application/json"}
+_RETURN_ROWS = {**_JSON, "Prefer": "return=representation"}
+_RETURN_NONE = {**_JSON, "Prefer": "return=minimal"}
+
+# Public blog post columns (excludes the dedup embedding)
+_BLOG_POST_COLUMNS = "id,slug,title,summary,content,image_url,published_at,created_at"
+
+# Seeker session list; the to-one job embed is spread so rows arrive flat
+# (job_title, not {jobs_jobs: {title}})
+_USER_SESSION_COLUMNS = "id,created_at,status,job_id,...jobs_jobs(job_title:title)"
+
+# Max description hashes per batched dedup lookup (64 hex chars each)
+_HASH_CHUNK = 100
+
+
+def _in(values: list[str]) -> str:
+    """Build a PostgREST `in.(...)` filter, quoting each value."""
+    quoted = ",".join(
+        '"' + str(v).replace("\\", "\\\\").replace('"', '\\"') + '"' for v in values
+    )
+    return f"in.({quoted})"
+
+
+def _coerce_prep_guide(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Promote legacy prep_guide_generated entries (bare strings, partial dicts)
+    to the {question, answer_strategy} shape so JobDetail validates a single
+    concrete type. Mutates and returns the row.
+    """
+    raw = row.get("prep_guide_generated")
+    if raw:
+        row["prep_guide_generated"] = [
+            {"question": q.get("question", ""), "answer_strategy": q.get("answer_strategy", "")}
+            if isinstance(q, dict)
+            else {"question": str(q), "answer_strategy": ""}
+            for q in raw
+        ]
+    return row
+
 
 class SupabaseAdapter(DatabasePort):
-    """All database I/O goes through the Supabase REST client."""
+    """All database I/O goes through Supabase's PostgREST endpoint."""
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, http: httpx.AsyncClient | None = None) -> None:
         self._client = client
+        self._http = http or httpx.AsyncClient(
+            base_url=f"{client.supabase_url}/rest/v1",
+            headers={
+                "apikey": client.supabase_key,
+                "Authorization": f"Bearer {client.supabase_key}",
+            },
+            http2=True,
+            timeout=30.0,
+        )
+
+        # In-process read caches for hot rows (job-detail fan-out, blog pages).
+        # Writes through this adapter invalidate the affected entries.
+        self._job_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+        self._user_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+        self._blog_post_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+        self._blog_list_cache: TTLCache = TTLCache(maxsize=16, ttl=300)
+
+    # ── PostgREST helpers ─────────────────────────────────────
+
+    async def _select(
+        self, table: str, params: dict[str, Any], select: str = "*"
+    ) -> list[dict[str, Any]]:
+        r = await self._http.get(f"/{table}", params={"select": select, **params})
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+    async def _select_one(
+        self, table: str, params: dict[str, Any], select: str = "*"
+    ) -> dict[str, Any] | None:
+        """First matching row, or None (PostgREST answers 406 for an empty object read)."""
+        r = await self._http.get(
+            f"/{table}", params={"select": select, "limit": 1, **params}, headers=_OBJECT
+        )
+        if r.status_code == 406:
+            return None
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+    async def _insert(self, table: str, data: dict[str, Any]) -> dict[str, Any]:
+        r = await self._http.post(f"/{table}", content=orjson.dumps(data), headers=_RETURN_ROWS)
+        r.raise_for_status()
+        return orjson.loads(r.content)[0]
+
+    async def _update(self, table: str, params: dict[str, Any], data: dict[str, Any]) -> None:
+        r = await self._http.patch(f"/{table}", params=params, content=orjson.dumps(data), headers=_RETURN_NONE)
+        r.raise_for_status()
+
+    async def _rpc(self, fn: str, args: dict[str, Any] | None = None) -> Any:
+        r = await self._http.post(f"/rpc/{fn}", content=orjson.dumps(args or {}), headers=_JSON)
+        r.raise_for_status()
+        return orjson.loads(r.content)
 
     # ── Users ─────────────────────────────────────────────────
 
     async def get_user(self, user_id: str) -> dict[str, Any] | None:
-        result = (
-            self._client.table("users_jobs")
-            .select("*")
-            .eq("id", user_id)
-            .maybe_single()
-            .execute()
-        )
-        return result.data if result else None
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            return dict(cached)
+
+        row = await self._fetch_user(user_id)
+        if row:
+            self._user_cache[user_id] = row
+            return dict(row)
+        return None
+
+    async def _fetch_user(self, user_id: str) -> dict[str, Any] | None:
+        return await self._select_one("users_jobs", {"id": f"eq.{user_id}"})
 
     async def upsert_user(self, user_id: str, data: dict[str, Any]) -> None:
-        # Try update first (preserves existing columns like email)
-        result = (
-            self._client.table("users_jobs")
-            .update(data)
-            .eq("id", user_id)
-            .execute()
+        # Try update first (preserves existing columns like email). An
+        # INSERT ... ON CONFLICT can't be used here: NOT NULL columns such as
+        # email are checked on the proposed row before the conflict is seen.
+        r = await self._http.patch(
+            "/users_jobs",
+            params={"id": f"eq.{user_id}"},
+            content=orjson.dumps(data),
+            headers=_RETURN_ROWS,
         )
+        r.raise_for_status()
         # If no rows were updated, the user doesn't exist yet — insert
-        if not result.data:
-            data["id"] = user_id
-            self._client.table("users_jobs").insert(data).execute()
+        if not orjson.loads(r.content):
+            await self._insert("users_jobs", {**data, "id": user_id})
+        self._user_cache.pop(user_id, None)
 
     # ── Jobs ──────────────────────────────────────────────────
 
     async def create_job(self, data: dict[str, Any]) -> dict[str, Any]:
-        result = self._client.table("jobs_jobs").insert(data).execute()
-        return result.data[0]
-
-    async def get_job(self, job_id: str) -> dict[str, Any] | None:
-        result = (
-            self._client.table("jobs_jobs")
-            .select("*")
-            .eq("id", job_id)
-            .maybe_single()
-            .execute()
-        )
-        return result.data if result else None
+        return await self._insert("jobs_jobs", data)
+
+    async def get_job(
+        self, job_id: str, columns: tuple[str, ...] | None = None
+    ) -> dict[str, Any] | None:
+        cached = self._job_cache.get(job_id)
+        if cached is not None:
+            return {c: cached.get(c) for c in columns} if columns else dict(cached)
+
+        if columns:
+            # Projected reads are not cached; the cache holds full rows only
+            return await self._fetch_job(job_id, columns)
+
+        row = await self._fetch_job(job_id)
+        if row:
+            self._job_cache[job_id] = _coerce_prep_guide(row)
+            return dict(row)
+        return None
+
+    async def _fetch_job(
+        self, job_id: str, columns: tuple[str, ...] | None = None
+    ) -> dict[str, Any] | None:
+        select = ",".join(columns) if columns else "*"
+        return await self._select_one("jobs_jobs", {"id": f"eq.{job_id}"}, select=select)
 
     async def update_job(self, job_id: str, data: dict[str, Any]) -> None:
-        self._client.table("jobs_jobs").update(data).eq("id", job_id).execute()
-
-    async def list_jobs_by_provider(self, provider_id: str) -> list[dict[str, Any]]:
-        result = (
-            self._client.table("jobs_jobs")
-            .select("*")
-            .eq("provider_id", provider_id)
-            .order("created_at", desc=True)
-            .execute()
+        await self._update("jobs_jobs", {"id": f"eq.{job_id}"}, data)
+        self._job_cache.pop(job_id, None)
+
+    async def bulk_update_job_status(self, job_ids: list[str], status: str) -> None:
+        if not job_ids:
+            return
+        await self._update("jobs_jobs", {"id": _in(job_ids)}, {"status": status})
+        for job_id in job_ids:
+            self._job_cache.pop(job_id, None)
+
+    async def list_jobs_by_provider(
+        self, provider_id: str, columns: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        rows = await self._select(
+            "jobs_jobs",
+            {"provider_id": f"eq.{provider_id}", "order": "created_at.desc"},
+            select=",".join(columns) if columns else "*",
         )
-        return result.data or []
+        return [_coerce_prep_guide(row) for row in rows]
 
     async def archive_jobs_not_in(self, company_name: str, active_external_ids: list[str]) -> int:
         """Mark ALL jobs for a company as archived if their external ID is not in active_external_ids."""
         count = 0
         try:
             # 1. Fetch all active jobs for this company
-            result = (
-                self._client.table("jobs_jobs")
-                .select("id, external_id")
-                .eq("company_name", company_name)
-                .eq("status", "active")
-                .execute()
+            jobs = await self._select(
+                "jobs_jobs",
+                {"company_name": f"eq.{company_name}", "status": "eq.active"},
+                select="id,external_id",
             )
-            jobs = result.data or []
             
             # 2. Filter out the active ones
             to_archive_ids = [job["id"] for job in jobs if job["external_id"] not in active_external_ids]
@@ -89,10 +213,11 @@ class SupabaseAdapter(DatabasePort):
             # 3. Update them to archived status
             for job_id in to_archive_ids:
                 from datetime import datetime, timezone
-                self._client.table("jobs_jobs").update({
+                await self._update("jobs_jobs", {"id": f"eq.{job_id}"}, {
                     "status": "archived", 
                     "archived_at": datetime.now(timezone.utc).isoformat()
-                }).eq("id", job_id).execute()
+                })
+                self._job_cache.pop(job_id, None)
                 count += 1
                 
         except Exception as e:
@@ -105,98 +230,136 @@ class SupabaseAdapter(DatabasePort):
     async def find_job_by_external_id(
         self, company_name: str, external_id: str
     ) -> dict[str, Any] | None:
-        result = (
-            self._client.table("jobs_jobs")
-            .select("*")
-            .eq("company_name", company_name)
-            .eq("external_id", external_id)
-            .maybe_single()
-            .execute()
+        return await self._select_one(
+            "jobs_jobs",
+            {"company_name": f"eq.{company_name}", "external_id": f"eq.{external_id}"},
         )
-        return result.data if result else None
 
-    async def list_active_jobs(self, skip: int = 0, limit: int = 20) -> list[dict[str, Any]]:
+    async def list_active_jobs(
+        self, skip: int = 0, limit: int = 20, columns: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
         # Only valid jobs = active status + not archived
-        result = (
-            self._client.table("jobs_jobs")
-            .select("*")
-            .eq("status", "active")
-            # .filter("archived_at", "is", "null")
-            .order("created_at", desc=True)
-            .range(skip, skip + limit - 1)
-            .execute()
+        return await self._select(
+            "jobs_jobs",
+            {
+                "status": "eq.active",
+                "order": "created_at.desc",
+                "offset": skip,
+                "limit": limit,
+            },
+            select=",".join(columns) if columns else "*",
         )
-        return result.data or []
 
-    async def get_all_jobs_for_analytics(self) -> list[dict[str, Any]]:
+    async def list_ranked_jobs(
+        self,
+        embedding: list[float],
+        skip: int = 0,
+        limit: int = 20,
+        columns: tuple[str, ...] | None = None,
+    ) -> list[dict[str, Any]]:
+        # match_jobs_for_embedding RPC (migration 018) — HNSW-backed ordering
+        r = await self._http.post(
+            "/rpc/match_jobs_for_embedding",
+            params={"select": ",".join(columns) if columns else "*"},
+            content=orjson.dumps({"query_embedding": embedding, "match_count": limit, "skip": skip}),
+            headers=_JSON,
+        )
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+    async def get_all_jobs_for_analytics_raw(self) -> list[dict[str, Any]]:
         """
         Fetches a lightweight subset of fields for ALL active jobs.
-        Used for in-memory aggregation of market stats.
+        Used for in-memory aggregation of market stats when the
+        server-side jobs_analytics() RPC is disabled.
         """
-        result = (
-            self._client.table("jobs_jobs")
-            .select("title, company_name, location, salary_range, skills_required, created_at")
-            .eq("status", "active")
-            # .filter("archived_at", "is", "null")
-            .execute()
+        return await self._select(
+            "jobs_jobs",
+            {"status": "eq.active"},
+            select="title,company_name,location,salary_range,skills_required,created_at",
         )
-        return result.data or []
+
+    async def get_jobs_analytics(self) -> dict[str, Any]:
+        """Pre-rolled market stats from the jobs_analytics() RPC (migration 011)."""
+        return await self._rpc("jobs_analytics") or {}
 
     # ── Chat Sessions ─────────────────────────────────────────
 
     async def get_chat_session(self, session_id: str) -> dict[str, Any] | None:
-        result = (
-            self._client.table("chat_sessions_jobs")
-            .select("*")
-            .eq("id", session_id)
-            .maybe_single()
-            .execute()
-        )
-        return result.data if result else None
+        return await self._select_one("chat_sessions_jobs", {"id": f"eq.{session_id}"})
 
     async def update_chat_session(
         self, session_id: str, data: dict[str, Any]
     ) -> None:
-        self._client.table("chat_sessions_jobs").update(data).eq("id", session_id).execute()
+        await self._update("chat_sessions_jobs", {"id": f"eq.{session_id}"}, data)
 
-
-
-    async def get_all_chat_sessions(self) -> list[dict[str, Any]]:
-        """Fetch all chat sessions for admin dashboard (bypasses RLS via service role)."""
-        result = (
-            self._client.table("chat_sessions_jobs")
-            .select("id, created_at, status, user_id, users_jobs(id, email, full_name)")
-            .order("created_at", desc=True)
-            .execute()
+    async def append_to_conversation_log(self, session_id: str, entry: dict[str, Any]) -> bool:
+        # append_chat_log RPC (migration 016) — single UPDATE, no log round-trip.
+        # p_session_id is a UUID parameter: a malformed id is just "not found"
+        # rather than a Postgres cast error.
+        try:
+            UUID(session_id)
+        except ValueError:
+            return False
+        return bool(await self._rpc("append_chat_log", {"p_session_id": session_id, "p_entry": entry}))
+
+
+    async def get_all_chat_sessions(
+        self, limit: int = 50, cursor: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch a page of chat sessions for admin dashboard (bypasses RLS via service role)."""
+        params: dict[str, Any] = {"order": "created_at.desc", "limit": limit}
+        if cursor:
+            params["created_at"] = f"lt.{cursor}"
+        return await self._select(
+            "chat_sessions_jobs",
+            params,
+            select="id,created_at,status,user_id,job_id,users_jobs(id,email,full_name)",
         )
-        return result.data or []
 
     async def list_user_sessions(self, user_id: str) -> list[dict[str, Any]]:
         """Fetch all chat sessions for a specific seeker, including job details."""
         # Using service role key bypasses RLS, so manually filter by user_id
-        result = (
-            self._client.table("chat_sessions_jobs")
-            .select("id, created_at, status, job_id, jobs_jobs(title)")
-            .eq("user_id", user_id)
-            .order("created_at", desc=True)
-            .execute()
+        return await self._select(
+            "chat_sessions_jobs",
+            {"user_id": f"eq.{user_id}", "order": "created_at.desc"},
+            select=_USER_SESSION_COLUMNS,
         )
-        return result.data or []
+
+    async def iter_user_sessions(
+        self, user_id: str, page_size: int = 200
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        offset = 0
+        while True:
+            page = await self._select(
+                "chat_sessions_jobs",
+                {
+                    "user_id": f"eq.{user_id}",
+                    "order": "created_at.desc,id.desc",
+                    "limit": page_size,
+                    "offset": offset,
+                },
+                select=_USER_SESSION_COLUMNS,
+            )
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            offset += page_size
 
     async def find_chat_session(self, user_id: str, job_id: str) -> dict[str, Any] | None:
         """Find an active chat session for a user and job."""
         # Check for non-closed sessions
-        result = (
-            self._client.table("chat_sessions_jobs")
-            .select("*")
-            .eq("user_id", user_id)
-            .eq("job_id", job_id)
-            .neq("status", "closed")
-            .limit(1)
-            .maybe_single()
-            .execute()
+        rows = await self._select(
+            "chat_sessions_jobs",
+            {
+                "user_id": f"eq.{user_id}",
+                "job_id": f"eq.{job_id}",
+                "status": "neq.closed",
+                "limit": 1,
+            },
         )
-        return result.data if result else None
+        return rows[0] if rows else None
 
     async def create_chat_session(
         self, user_id: str, initial_log: list | None = None, job_id: str | None = None
@@ -207,104 +370,122 @@ class SupabaseAdapter(DatabasePort):
         if job_id:
             insert_data["job_id"] = job_id
             
-        result = (
-            self._client.table("chat_sessions_jobs")
-            .insert(insert_data)
-            .execute()
-        )
-        return result.data[0]
+        return await self._insert("chat_sessions_jobs", insert_data)
 
     # ── Mock Interviews ───────────────────────────────────────
 
     async def create_mock_interview(self, data: dict[str, Any]) -> dict[str, Any]:
-        result = self._client.table("mock_interviews_jobs").insert(data).execute()
-        return result.data[0]
+        return await self._insert("mock_interviews_jobs", data)
 
     async def get_mock_interview(self, interview_id: str) -> dict[str, Any] | None:
-        result = (
-            self._client.table("mock_interviews_jobs")
-            .select("*")
-            .eq("id", interview_id)
-            .maybe_single()
-            .execute()
-        )
-        return result.data if result else None
+        return await self._select_one("mock_interviews_jobs", {"id": f"eq.{interview_id}"})
 
     async def update_mock_interview(self, interview_id: str, data: dict[str, Any]) -> None:
-        self._client.table("mock_interviews_jobs").update(data).eq("id", interview_id).execute()
+        await self._update("mock_interviews_jobs", {"id": f"eq.{interview_id}"}, data)
 
     async def list_user_mock_interviews(self, user_id: str) -> list[dict[str, Any]]:
-        result = (
-            self._client.table("mock_interviews_jobs")
-            .select("*, jobs_jobs(title)")
-            .eq("user_id", user_id)
-            .order("created_at", desc=True)
-            .execute()
+        return await self._select(
+            "mock_interviews_jobs",
+            {"user_id": f"eq.{user_id}", "order": "created_at.desc"},
+            select="*,jobs_jobs(title)",
         )
-        return result.data or []
 
     async def list_pending_reviews(self) -> list[dict[str, Any]]:
-        result = (
-            self._client.table("mock_interviews_jobs")
-            .select("*, jobs_jobs(title), users_jobs(full_name, email)")
-            .eq("status", "pending_review")
-            .order("created_at", desc=True)
-            .execute()
+        return await self._select(
+            "mock_interviews_jobs",
+            {"status": "eq.pending_review", "order": "created_at.desc"},
+            select="*,jobs_jobs(title),users_jobs(full_name,email)",
         )
-        return result.data or []
 
     # ── Job Description Hash ───────────────────────────────────
 
     async def find_job_by_description_hash(
         self, description_hash: str
     ) -> dict[str, Any] | None:
-        result = (
-            self._client.table("jobs_jobs")
-            .select("*")
-            .eq("description_hash", description_hash)
-            .not_.is_("embedding", "null")
-            .limit(1)
-            .maybe_single()
-            .execute()
-        )
-        return result.data if result else None
+        # Stored function (migration 010) — returns the donor row directly
+        # instead of PostgREST planning the filter chain on every call.
+        rows = await self._rpc("find_job_by_hash", {"h": description_hash})
+        return rows[0] if rows else None
+
+    async def find_jobs_by_description_hashes(
+        self, description_hashes: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        # One IN query per _HASH_CHUNK hashes (keeps the URL well under proxy
+        # limits) instead of one round-trip per scraped job.
+        unique = list(dict.fromkeys(h for h in description_hashes if h))
+        donors: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(unique), _HASH_CHUNK):
+            rows = await self._select(
+                "jobs_jobs",
+                {
+                    "description_hash": _in(unique[start:start + _HASH_CHUNK]),
+                    "embedding": "not.is.null",
+                },
+                select="description_hash,resume_guide_generated,prep_guide_generated,embedding",
+            )
+            for row in rows:
+                donors.setdefault(row["description_hash"], row)
+        return donors
 
     # ── Scraping Logs ──────────────────────────────────────────
 
     async def insert_scraping_log(self, data: dict[str, Any]) -> dict[str, Any]:
-        result = self._client.table("scraping_logs_jobs").insert(data).execute()
-        return result.data[0]
+        return await self._insert("scraping_logs_jobs", data)
 
     async def update_scraping_log(
         self, log_id: str, data: dict[str, Any]
     ) -> None:
-        self._client.table("scraping_logs_jobs").update(data).eq("id", log_id).execute()
+        await self._update("scraping_logs_jobs", {"id": f"eq.{log_id}"}, data)
 
     # ── Blog Posts ─────────────────────────────────────────────
 
-    async def create_blog_post(self, data: dict[str, Any]) -> dict[str, Any]:
-        result = self._client.table("blog_posts_jobs").insert(data).execute()
-        return result.data[0]
+    async def create_blog_post(
+        self, data: dict[str, Any], embedding: list[float] | None = None
+    ) -> dict[str, Any]:
+        if embedding is not None:
+            data = {**data, "embedding": embedding}
+        row = await self._insert("blog_posts_jobs", data)
+        row.pop("embedding", None)
+        self._blog_list_cache.clear()
+        self._blog_post_cache.pop(row.get("slug"), None)
+        return row
+
+    async def find_similar_blog_post(
+        self, embedding: list[float], threshold: float, days: int
+    ) -> dict[str, Any] | None:
+        # match_blog_posts RPC (migration 013) — pgvector cosine search
+        rows = await self._rpc(
+            "match_blog_posts",
+            {"query_embedding": embedding, "threshold": threshold, "days": days},
+        )
+        if not rows:
+            return None
+        rows[0].pop("embedding", None)
+        return rows[0]
 
     async def list_blog_posts(self, limit: int = 10) -> list[dict[str, Any]]:
-        result = (
-            self._client.table("blog_posts_jobs")
-            .select("id, title, slug, summary, published_at, image_url")
-            .order("published_at", desc=True)
-            .limit(limit)
-            .execute()
+        cached = self._blog_list_cache.get(limit)
+        if cached is not None:
+            return [dict(post) for post in cached]
+
+        posts = await self._select(
+            "blog_posts_jobs",
+            {"order": "published_at.desc", "limit": limit},
+            select="id,title,slug,summary,published_at,image_url",
         )
-        return result.data or []
+        self._blog_list_cache[limit] = posts
+        return [dict(post) for post in posts]
 
     async def get_blog_post(self, slug: str) -> dict[str, Any] | None:
-        result = (
-            self._client.table("blog_posts_jobs")
-            .select("*")
-            .eq("slug", slug)
-            .maybe_single()
-            .execute()
-        )
-        return result.data if result else None
+        cached = self._blog_post_cache.get(slug)
+        if cached is not None:
+            return dict(cached)
+
+        row = await self._select_one("blog_posts_jobs", {"slug": f"eq.{slug}"}, select=_BLOG_POST_COLUMNS)
+        if row:
+            self._blog_post_cache[slug] = row
+            return dict(row)
+        return None
 
     # ── Learning Resources ─────────────────────────────────────
 
@@ -312,11 +493,50 @@ class SupabaseAdapter(DatabasePort):
         if not skills:
             return []
             
-        result = (
-            self._client.table("learning_resources_jobs")
-            .select("*")
-            .in_("skill_name", skills)
-            .execute()
+        return await self._select("learning_resources_jobs", {"skill_name": _in(skills)})
+
+    # ── AI Response Cache ──────────────────────────────────────
+
+    async def get_cached_ai_response(self, prompt_hash: str) -> dict[str, Any] | None:
+        row = await self._select_one(
+            "ai_response_cache_jobs", {"prompt_hash": f"eq.{prompt_hash}"}, select="response"
+        )
+        return row["response"] if row else None
+
+    async def save_ai_response(self, prompt_hash: str, response: dict[str, Any], model: str) -> None:
+        r = await self._http.post(
+            "/ai_response_cache_jobs",
+            params={"on_conflict": "prompt_hash"},
+            content=orjson.dumps({"prompt_hash": prompt_hash, "response": response, "model": model}),
+            headers={**_JSON, "Prefer": "resolution=ignore-duplicates,return=minimal"},
         )
-        return result.data or []
+        r.raise_for_status()
+
+    # ── Embedding Cache ────────────────────────────────────────
 
+    async def get_cached_embeddings(self, content_hashes: list[str]) -> dict[str, list[float]]:
+        if not content_hashes:
+            return {}
+
+        rows = await self._select(
+            "embedding_cache_jobs",
+            {"content_hash": _in(content_hashes)},
+            select="content_hash,vector",
+        )
+        # pgvector columns come back as "[0.1,0.2,...]" strings
+        return {
+            row["content_hash"]: orjson.loads(row["vector"]) if isinstance(row["vector"], str) else row["vector"]
+            for row in rows
+        }
+
+    async def save_cached_embeddings(self, vectors: dict[str, list[float]]) -> None:
+        if not vectors:
+            return
+
+        r = await self._http.post(
+            "/embedding_cache_jobs",
+            params={"on_conflict": "content_hash"},
+            content=orjson.dumps([{"content_hash": h, "vector": v} for h, v in vectors.items()]),
+            headers={**_JSON, "Prefer": "resolution=ignore-duplicates,return=minimal"},
+        )
+        r.raise_for_status()
@@ -2,6 +2,8 @@
 Concrete implementation of StoragePort using Supabase Storage.
 """
 
+import asyncio
+
 from supabase import Client
 
 from app.ports.storage_port import StoragePort
@@ -18,7 +20,9 @@ class SupabaseStorageAdapter(StoragePort):
     ) -> str:
         """Upload file to Supabase Storage and return the path."""
         try:
-            self._client.storage.from_(bucket).upload(
+            # storage3 is synchronous — keep the upload off the event loop
+            await asyncio.to_thread(
+                self._client.storage.from_(bucket).upload,
                 path=path,
                 file=file_bytes,
                 file_options={"content-type": content_type, "upsert": "true"},
@@ -38,7 +42,8 @@ class SupabaseStorageAdapter(StoragePort):
         self, bucket: str, path: str, expires_in: int = 3600
     ) -> str:
         """Generate a signed download URL for a private file."""
-        result = self._client.storage.from_(bucket).create_signed_url(
+        result = await asyncio.to_thread(
+            self._client.storage.from_(bucket).create_signed_url,
             path=path,
             expires_in=expires_in,
         )
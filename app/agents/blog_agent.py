@@ -1,62 +1,319 @@
+import asyncio
+import hashlib
+import io
 import logging
 import datetime
+import math
+import re
+from typing import Final
+
+import orjson  # type: ignore
+from cachetools import LRUCache, TTLCache  # type: ignore
+from app.domain.models import BlogPostCreate
 from app.ports.ai_port import AIPort
 from app.ports.database_port import DatabasePort
+from app.ports.embedding_port import EmbeddingPort
 from app.services.market_news_service import MarketNewsService
 
 logger = logging.getLogger(__name__)
 
+# Articles at or above this cosine similarity are treated as the same story
+DUPLICATE_SIMILARITY = 0.8
+
+# Per-article AI calls: concurrency cap and retry passes for failed items
+ARTICLE_CONCURRENCY = 10
+ARTICLE_RETRIES = 2
+
+# A new digest this similar to a post from the last N days is not republished
+DUPLICATE_POST_SIMILARITY = 0.92
+DUPLICATE_POST_WINDOW_DAYS = 30
+
+# Title+summary embeddings of recently seen headlines (content hash → vector).
+# Backed by the embedding_cache_jobs table so recurring stories survive restarts.
+_article_embeddings: LRUCache = LRUCache(maxsize=4096)
+
+# Published digest per ISO week (year, week) — /blogs/generate and
+# /blogs/refresh-trends run the same pipeline, so back-to-back admin calls
+# return the post from the first instead of paying for news + LLM twice.
+DIGEST_MEMO_SECS = 3600
+_recent_digests: TTLCache = TTLCache(maxsize=8, ttl=DIGEST_MEMO_SECS)
+_digest_lock = asyncio.Lock()
+
+# Completed "slug" value in a partially streamed JSON blog post
+_SLUG_FIELD = re.compile(r'"slug"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _article_hash(article: dict) -> str:
+    return hashlib.blake2b(
+        f"{article['title']}|{article['summary']}".encode(), digest_size=16
+    ).hexdigest()
+
+# Weekly digest prompt; only {week_str} and {news_context} vary per run
+_PROMPT_TEMPLATE: Final[str] = (
+    "Act as a Career Strategist for university students aiming for jobs at the Big 4 (Deloitte, PwC, KPMG, EY). "
+    "Here are the latest news updates from {week_str}:\n\n"
+    "{news_context}\n\n"
+    "Task: Write a high-value, actionable blog post for students.\n"
+    "DO NOT just summarize the news. Translate every piece of news into a specific 'Student Action'.\n"
+    "Example: If PwC invests in AI, tell students to build a specific AI project or get a cert.\n\n"
+    "Structure:\n"
+    "1. Title (Must be catchy, e.g., 'Big 4 Campus Watch: [Key Trend]')\n"
+    "2. Executive Summary (2 sentences)\n"
+    "3. The News & The Opportunity (For each key story, have a 'News Snapshot' and a '🎓 Student Takeaway')\n"
+    "4. 🚀 Action Plan for this Week (3 bullet points)\n\n"
+    "Output strictly valid JSON with keys: 'title', 'slug', 'summary', 'content' (markdown)."
+)
+
 class BlogAgent:
-    def __init__(self, db: DatabasePort, ai: AIPort):
+    def __init__(
+        self,
+        db: DatabasePort,
+        ai: AIPort,
+        embeddings: EmbeddingPort | None = None,
+        news_service: MarketNewsService | None = None,
+    ):
         self.db = db
         self.ai = ai
-        self.news_service = MarketNewsService()
+        self.embeddings = embeddings
+        self.news_service = news_service or MarketNewsService()
+        self._sem = asyncio.Semaphore(ARTICLE_CONCURRENCY)
+
+    async def _map_articles(self, call, articles: list[dict]) -> list:
+        """
+        Run an async per-article AI call concurrently (bounded by the semaphore).
+        Items that fail are retried in later passes with exponential backoff;
+        any that still fail come back as the raised exception.
+        """
+        async def _bounded(article: dict):
+            async with self._sem:
+                return await call(article)
+
+        results = await asyncio.gather(*[_bounded(a) for a in articles], return_exceptions=True)
+        for attempt in range(ARTICLE_RETRIES):
+            failed = [i for i, r in enumerate(results) if isinstance(r, Exception)]
+            if not failed:
+                break
+            await asyncio.sleep(0.5 * 2 ** attempt)
+            retried = await asyncio.gather(*[_bounded(articles[i]) for i in failed], return_exceptions=True)
+            for i, r in zip(failed, retried):
+                results[i] = r
+        return results
+
+    async def _embed_articles(self, articles: list[dict]) -> list[list[float]] | None:
+        """
+        Title+summary embeddings for each article, served from the in-process
+        LRU, then the embedding_cache_jobs table, and only then the API.
+        Returns None if any article could not be embedded.
+        """
+        hashes = [_article_hash(a) for a in articles]
+        missing = [h for h in dict.fromkeys(hashes) if h not in _article_embeddings]
+
+        if missing:
+            try:
+                _article_embeddings.update(await self.db.get_cached_embeddings(missing))
+            except Exception as e:
+                logger.warning("BlogAgent: Embedding cache lookup failed: %s", e)
+
+        to_embed = [(h, a) for h, a in zip(hashes, articles) if h not in _article_embeddings]
+        to_embed = list(dict(to_embed).items())
+        if to_embed:
+            results = await self._map_articles(
+                lambda a: self.embeddings.encode(f"{a['title']} {a['summary']}"),
+                [a for _, a in to_embed],
+            )
+            errors = [r for r in results if isinstance(r, Exception)]
+            if errors:
+                logger.warning("BlogAgent: Article dedup skipped (embedding failed): %s", errors[0])
+                return None
+
+            fresh = {h: vec for (h, _), vec in zip(to_embed, results)}
+            _article_embeddings.update(fresh)
+            try:
+                await self.db.save_cached_embeddings(fresh)
+            except Exception as e:
+                logger.warning("BlogAgent: Embedding cache write failed: %s", e)
+
+        return [_article_embeddings[h] for h in hashes]
+
+    async def _dedupe_articles(self, articles: list[dict]) -> list[dict]:
+        """
+        Collapse near-duplicate stories (same news syndicated by several outlets)
+        to their first occurrence, using cosine similarity of title+summary embeddings.
+        """
+        if not self.embeddings or len(articles) < 2:
+            return articles
+
+        vectors = await self._embed_articles(articles)
+        if vectors is None:
+            return articles
+
+        # L2-normalise once so the dot product is the cosine similarity
+        unit = []
+        for vec in vectors:
+            norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+            unit.append([x / norm for x in vec])
+
+        kept: list[int] = []
+        for i, vec in enumerate(unit):
+            if all(sum(x * y for x, y in zip(vec, unit[k])) < DUPLICATE_SIMILARITY for k in kept):
+                kept.append(i)
+
+        if len(kept) < len(articles):
+            logger.info("BlogAgent: Dropped %d duplicate articles", len(articles) - len(kept))
+        return [articles[i] for i in kept]
+
+    async def _cached_blog_post(self, prompt: str, news_context: str, iso_week: str) -> dict:
+        """
+        Generate the digest draft, keyed in the AI response cache by its ISO
+        week and news context. Cached and fresh drafts both get a slug that is not
+        already taken.
+        """
+        model = getattr(self.ai, "model", "")
+        key = hashlib.sha256(f"blog|{iso_week}|{news_context}|{model}".encode("utf-8")).hexdigest()
+
+        try:
+            cached = await self.db.get_cached_ai_response(key)
+            if cached:
+                logger.info("BlogAgent: Reusing cached digest draft for unchanged news context")
+                blog_data = dict(cached)
+                blog_data["slug"] = await self._unique_slug(blog_data.get("slug"))
+                return blog_data
+        except Exception as e:
+            logger.warning("BlogAgent: AI response cache lookup failed: %s", e)
+
+        raw, slug_lookup = await self._stream_blog_post(prompt)
+        try:
+            blog_data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            if slug_lookup is not None:
+                slug_lookup.cancel()
+            return {
+                "slug": "ai-generated-post",
+                "title": "Error Generating Post",
+                "summary": "An error occurred during generation.",
+                "content": raw,
+            }
+
+        # Cache the draft as generated; the slug is made unique per use
+        try:
+            await self.db.save_ai_response(key, blog_data, model)
+        except Exception as e:
+            logger.warning("BlogAgent: AI response cache write failed: %s", e)
+
+        blog_data["slug"] = await self._unique_slug(blog_data.get("slug"), slug_lookup)
+        return blog_data
+
+    async def _stream_blog_post(self, prompt: str) -> tuple[str, asyncio.Task | None]:
+        """
+        Stream the draft from the model. The system prompt asks for `slug`
+        first, so as soon as it is complete a lookup for an existing post with
+        that slug runs alongside the rest of the generation. Returns the raw
+        text and that (possibly still running) lookup.
+        """
+        buf = io.StringIO()
+        slug_lookup: asyncio.Task | None = None
+
+        async for delta in self.ai.generate_blog_post_stream(prompt):
+            buf.write(delta)
+            # slug is emitted first; stop scanning if it hasn't shown up early
+            if slug_lookup is None and buf.tell() < 4096:
+                m = _SLUG_FIELD.search(buf.getvalue())
+                if m:
+                    slug_lookup = asyncio.create_task(self.db.get_blog_post(m.group(1)))
+
+        return buf.getvalue(), slug_lookup
+
+    async def _unique_slug(self, slug: str | None, lookup: asyncio.Task | None = None) -> str | None:
+        """
+        A taken slug gets a date suffix (then a counter) instead of failing
+        the insert. `lookup` is an already-started get_blog_post(slug).
+        """
+        if not slug:
+            return slug
+        try:
+            if not await (lookup or self.db.get_blog_post(slug)):
+                return slug
+            candidate = f"{slug}-{datetime.date.today():%Y%m%d}"
+            n = 2
+            while await self.db.get_blog_post(candidate):
+                candidate = f"{slug}-{datetime.date.today():%Y%m%d}-{n}"
+                n += 1
+            return candidate
+        except Exception as e:
+            logger.warning("BlogAgent: Slug lookup failed: %s", e)
+            return slug
 
     async def generate_weekly_digest(self) -> dict:
         """
         Generates a blog post about this week's Big 4 market trends using Google News RSS.
-        Returns the created blog post dict.
+        Returns the created blog post dict (memoized per ISO week for an hour).
         """
+        week = datetime.date.today().isocalendar()[:2]
+        async with _digest_lock:
+            post = _recent_digests.get(week)
+            if post is None:
+                post = await self._generate_weekly_digest()
+                if post:
+                    _recent_digests[week] = post
+            else:
+                logger.info("BlogAgent: Digest for ISO week %d-W%02d already generated, reusing it", *week)
+        return post
+
+    async def _generate_weekly_digest(self) -> dict:
         logger.info("BlogAgent: Starting weekly digest generation (Real-Time Mode)...")
 
         # 1. Fetch Real-Time News
-        articles = self.news_service.fetch_big4_career_news(limit=5)
+        articles = await self.news_service.fetch_big4_career_news(limit=5)
         
         if not articles:
             logger.warning("BlogAgent: No news found to analyze.")
             return None
 
+        articles = await self._dedupe_articles(articles)
+
         # Format articles for the prompt
-        news_context = "\n\n".join([
-            f"- Title: {a['title']}\n  Source: {a['source']}\n  Summary: {a['summary']}"
-            for a in articles
-        ])
+        buf = io.StringIO()
+        w = buf.write
+        for i, a in enumerate(articles):
+            if i:
+                w("\n\n")
+            w(f"- Title: {a['title']}\n")
+            w(f"  Source: {a['source']}\n")
+            w(f"  Summary: {a['summary']}")
+        news_context = buf.getvalue()
         
         # 2. Construct Prompt (Student/Seeker Focused)
         week_str = datetime.datetime.now().strftime("%B %Y")
-        prompt = (
-            f"Act as a Career Strategist for university students aiming for jobs at the Big 4 (Deloitte, PwC, KPMG, EY). "
-            f"Here are the latest news updates from {week_str}:\n\n"
-            f"{news_context}\n\n"
-            "Task: Write a high-value, actionable blog post for students.\n"
-            "DO NOT just summarize the news. Translate every piece of news into a specific 'Student Action'.\n"
-            "Example: If PwC invests in AI, tell students to build a specific AI project or get a cert.\n\n"
-            "Structure:\n"
-            "1. Title (Must be catchy, e.g., 'Big 4 Campus Watch: [Key Trend]')\n"
-            "2. Executive Summary (2 sentences)\n"
-            "3. The News & The Opportunity (For each key story, have a 'News Snapshot' and a '🎓 Student Takeaway')\n"
-            "4. 🚀 Action Plan for this Week (3 bullet points)\n\n"
-            "Output strictly valid JSON with keys: 'title', 'slug', 'summary', 'content' (markdown)."
-        )
-
-        # 3. Generate Content
-        blog_data = await self.ai.generate_blog_post(prompt)
+        prompt = _PROMPT_TEMPLATE.format(week_str=week_str, news_context=news_context)
+
+        # 3. Generate Content (an identical news feed reuses the cached draft)
+        iso_week = "%d-W%02d" % datetime.date.today().isocalendar()[:2]
+        blog_data = await self._cached_blog_post(prompt, news_context, iso_week)
         
         # 4. Save to DB
         if blog_data:
             # Add image URL based on content or random
             blog_data['image_url'] = "https://images.unsplash.com/photo-1486406146926-c627a92ad1ab?auto=format&fit=crop&q=80&w=2070" 
-            post = await self.db.create_blog_post(blog_data)
+
+            # Skip publishing if a recent post already covers the same ground
+            embedding = None
+            if self.embeddings:
+                try:
+                    embedding = await self.embeddings.encode(
+                        f"{blog_data.get('title', '')}\n{blog_data.get('summary', '')}"
+                    )
+                    existing = await self.db.find_similar_blog_post(
+                        embedding, DUPLICATE_POST_SIMILARITY, DUPLICATE_POST_WINDOW_DAYS
+                    )
+                    if existing:
+                        logger.info(f"BlogAgent: Digest duplicates recent post '{existing['title']}', not republishing")
+                        return existing
+                except Exception as e:
+                    logger.warning("BlogAgent: Duplicate-post check failed: %s", e)
+                    embedding = None
+
+            row = BlogPostCreate.model_validate(blog_data).model_dump(mode="json")
+            post = await self.db.create_blog_post(row, embedding=embedding)
             logger.info(f"BlogAgent: Published new post '{post['title']}'")
             return post
             
@@ -6,17 +6,21 @@ Wires abstract ports → concrete adapters. To swap a provider
 Nothing else in the codebase changes  (Open/Closed Principle).
 """
 
-from functools import lru_cache
+import importlib
+import logging
+from typing import Final
 
+import httpx  # type: ignore
 from fastapi import Depends  # type: ignore
 from supabase import create_client  # type: ignore
 
-from app.adapters.document_adapter import DocumentAdapter  # type: ignore
+from app.adapters.document_adapter import DocumentAdapter, shutdown_process_pool  # type: ignore
 from app.adapters.openai_adapter import OpenAIAdapter  # type: ignore
 from app.adapters.openai_embedding import OpenAIEmbeddingAdapter  # type: ignore
-from app.adapters.supabase_adapter import SupabaseAdapter  # type: ignore
+from app.adapters.postgres_adapter import PostgresAdapter, create_pool  # type: ignore
 from app.adapters.supabase_storage_adapter import SupabaseStorageAdapter  # type: ignore
 from app.config import settings  # type: ignore
+from app.services.market_news_service import MarketNewsService  # type: ignore
 from app.ports.ai_port import AIPort  # type: ignore
 from app.ports.database_port import DatabasePort  # type: ignore
 from app.ports.document_port import DocumentPort  # type: ignore
@@ -24,38 +28,85 @@ from app.ports.embedding_port import EmbeddingPort  # type: ignore
 from app.ports.storage_port import StoragePort  # type: ignore
 
 
-# ── Singletons (cached) ──────────────────────────────────────
+# ── Singletons (built once at import) ─────────────────────────
 
+# Config values used by the wiring below, read once from the frozen settings
+_SUPABASE_URL: Final[str] = settings.supabase_url
+_SUPABASE_SERVICE_KEY: Final[str] = settings.supabase_service_role_key
+_OPENAI_API_KEY: Final[str] = settings.openai_api_key
 
-@lru_cache(maxsize=1)
-def _get_supabase_client():
-    # Use service role key — bypasses RLS for server-side operations
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+# Use service role key — bypasses RLS for server-side operations
+_SUPABASE_CLIENT = create_client(_SUPABASE_URL, _SUPABASE_SERVICE_KEY)
+
+# One pooled HTTP/2 client shared by every OpenAI adapter — avoids a
+# fresh TCP+TLS handshake per adapter and multiplexes concurrent calls.
+_OPENAI_HTTP_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=30.0,
+)
+
+# Async PostgREST client — DB calls overlap on the event loop instead of
+# blocking on supabase-py's synchronous transport.
+_POSTGREST_HTTP_CLIENT = httpx.AsyncClient(
+    base_url=f"{_SUPABASE_URL.rstrip('/')}/rest/v1",
+    headers={
+        "apikey": _SUPABASE_SERVICE_KEY,
+        "Authorization": f"Bearer {_SUPABASE_SERVICE_KEY}",
+    },
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=30.0,
+)
+
+_OPENAI_ADAPTER = OpenAIAdapter(
+    api_key=_OPENAI_API_KEY,
+    http_client=_OPENAI_HTTP_CLIENT,
+)
 
+_EMBEDDING_ADAPTER = OpenAIEmbeddingAdapter(
+    api_key=_OPENAI_API_KEY,
+    http_client=_OPENAI_HTTP_CLIENT,
+)
 
-@lru_cache(maxsize=1)
-def _get_openai_adapter() -> OpenAIAdapter:
-    return OpenAIAdapter(api_key=settings.openai_api_key)
+# PostgREST-backed; hot reads switch to asyncpg once open_db_pool() attaches a pool
+_SUPABASE_ADAPTER = PostgresAdapter(client=_SUPABASE_CLIENT, http=_POSTGREST_HTTP_CLIENT)
 
+_STORAGE_ADAPTER = SupabaseStorageAdapter(client=_SUPABASE_CLIENT)
 
-@lru_cache(maxsize=1)
-def _get_embedding_adapter() -> OpenAIEmbeddingAdapter:
-    return OpenAIEmbeddingAdapter(api_key=settings.openai_api_key)
+_DOCUMENT_ADAPTER = DocumentAdapter()
+
+# Shared across digest runs so RSS fetches reuse keep-alive connections
+_NEWS_SERVICE = MarketNewsService()
+
+
+def _get_supabase_client():
+    """Raw supabase-py client for scripts and admin paths that build their own queries."""
+    return _SUPABASE_CLIENT
 
 
-@lru_cache(maxsize=1)
-def _get_supabase_adapter() -> SupabaseAdapter:
-    return SupabaseAdapter(client=_get_supabase_client())
+async def open_db_pool() -> None:
+    """Attach an asyncpg pool for direct reads when enabled (called from the app lifespan)."""
+    if settings.db_direct_reads:
+        _SUPABASE_ADAPTER.attach_pool(await create_pool(settings.database_url))
 
 
-@lru_cache(maxsize=1)
-def _get_storage_adapter() -> SupabaseStorageAdapter:
-    return SupabaseStorageAdapter(client=_get_supabase_client())
+async def close_db_pool() -> None:
+    pool = _SUPABASE_ADAPTER.detach_pool()
+    if pool is not None:
+        await pool.close()
 
 
-@lru_cache(maxsize=1)
-def _get_document_adapter() -> DocumentAdapter:
-    return DocumentAdapter()
+async def close_http_clients() -> None:
+    """Close the shared OpenAI, PostgREST and news-feed HTTP clients (called from the app lifespan)."""
+    await _OPENAI_HTTP_CLIENT.aclose()
+    await _POSTGREST_HTTP_CLIENT.aclose()
+    await _NEWS_SERVICE.aclose()
+
+
+def close_document_pool() -> None:
+    """Shut down the PDF extraction process pool (called from the app lifespan)."""
+    shutdown_process_pool()
 
 
 # ── FastAPI Dependencies (return abstract types) ──────────────
@@ -63,67 +114,77 @@ def _get_document_adapter() -> DocumentAdapter:
 
 def get_ai_service() -> AIPort:
     """Inject the AI adapter."""
-    return _get_openai_adapter()
+    return _OPENAI_ADAPTER
 
 
 def get_embedding_service() -> EmbeddingPort:
     """Inject the embedding adapter."""
-    return _get_embedding_adapter()
+    return _EMBEDDING_ADAPTER
 
 
 def get_db() -> DatabasePort:
     """Inject the database adapter."""
-    return _get_supabase_adapter()
+    return _SUPABASE_ADAPTER
 
 
 def get_storage() -> StoragePort:
     """Inject the file storage adapter."""
-    return _get_storage_adapter()
+    return _STORAGE_ADAPTER
 
 
 def get_document_parser() -> DocumentPort:
     """Inject the document text extractor (PDF + DOCX)."""
-    return _get_document_adapter()
+    return _DOCUMENT_ADAPTER
+
+
+def get_news_service() -> MarketNewsService:
+    """Inject the shared market news (RSS) service."""
+    return _NEWS_SERVICE
 
 
 # ── Scraper Registry ──────────────────────────────────────────
 
 from app.scraper.scraper_port import ScraperPort  # type: ignore # noqa: E402
 
-def _get_registry() -> dict[str, type]:
-    try:
-        from app.scraper.deloitte_adapter import DeloitteAdapter  # type: ignore
-        from app.scraper.pwc_adapter import PwCAdapter  # type: ignore
-        from app.scraper.kpmg_adapter import KPMGAdapter  # type: ignore
-        from app.scraper.ey_adapter import EYAdapter  # type: ignore
-        from app.scraper.generic_adapter import GenericAdapter  # type: ignore
-        return {
-            "deloitte": DeloitteAdapter,
-            "pwc": PwCAdapter,
-            "kpmg": KPMGAdapter,
-            "ey": EYAdapter,
-            "generic": GenericAdapter,
-        }
-    except ImportError as e:
-        import logging
-        logging.getLogger(__name__).warning("Scrapers could not be loaded due to import error: %s", e)
-        return {}
+# "module:Class" per source; each is imported only when first requested
+# (so the API process doesn't import crawl4ai/bs4 for unused scrapers).
+_SCRAPER_MODULES: Final[dict[str, str]] = {
+    "deloitte": "app.scraper.deloitte_adapter:DeloitteAdapter",
+    "pwc": "app.scraper.pwc_adapter:PwCAdapter",
+    "kpmg": "app.scraper.kpmg_adapter:KPMGAdapter",
+    "ey": "app.scraper.ey_adapter:EYAdapter",
+    "generic": "app.scraper.generic_adapter:GenericAdapter",
+}
+
+# Scrapers are stateless, so one instance each is built on first use
+_SCRAPERS: dict[str, ScraperPort] = {}
+
+def _load_scraper(name: str) -> ScraperPort | None:
+    scraper = _SCRAPERS.get(name)
+    if scraper is None:
+        module_path, cls_name = _SCRAPER_MODULES[name].split(":")
+        try:
+            cls = getattr(importlib.import_module(module_path), cls_name)
+        except ImportError as e:
+            logging.getLogger(__name__).warning("Scraper %s could not be loaded due to import error: %s", name, e)
+            return None
+        scraper = _SCRAPERS[name] = cls()
+    return scraper
 
 def get_scraper(source_name: str) -> ScraperPort:
     """Resolve a source name to its scraper adapter instance."""
-    registry = _get_registry()
-    cls = registry.get(source_name.lower())
-    if not cls:
+    name = source_name.lower()
+    scraper = _load_scraper(name) if name in _SCRAPER_MODULES else None
+    if not scraper:
         raise ValueError(
             f"Unknown source or scrapers disabled: {source_name}. "
-            f"Available: {', '.join(registry.keys())}"
+            f"Available: {', '.join(_SCRAPER_MODULES)}"
         )
-    return cls()
+    return scraper
 
 def get_all_scrapers() -> list[ScraperPort]:
     """Returns a list of all registered scraper instances."""
-    registry = _get_registry()
-    return [cls() for cls in registry.values()]
+    return [s for s in map(_load_scraper, _SCRAPER_MODULES) if s is not None]
 
 
 # ── Domain Services ───────────────────────────────────────────
@@ -131,18 +192,22 @@ def get_all_scrapers() -> list[ScraperPort]:
 from app.services.matching_service import MatchingService  # type: ignore # noqa: E402
 
 
-def get_matching_service(
-    db: DatabasePort = Depends(get_db), ai: AIPort = Depends(get_ai_service)
-) -> MatchingService:
-    """Injects DB and AI adapters into the matching domain service."""
-    return MatchingService(db=db, ai=ai)
+# Stateless services over singleton adapters — built once, not per request
+_MATCHING_SERVICE = MatchingService(db=_SUPABASE_ADAPTER, ai=_OPENAI_ADAPTER)
+
+
+def get_matching_service() -> MatchingService:
+    """Injects the shared matching domain service (DB + AI adapters)."""
+    return _MATCHING_SERVICE
 
 
 from app.services.analytics_service import AnalyticsService  # type: ignore
 
-def get_analytics_service(db: DatabasePort = Depends(get_db)) -> AnalyticsService:
-    """Injects DB adapter into analytics service."""
-    return AnalyticsService(db=db)
+_ANALYTICS_SERVICE = AnalyticsService(db=_SUPABASE_ADAPTER, server_side=settings.analytics_server_side)
+
+def get_analytics_service() -> AnalyticsService:
+    """Injects the shared analytics service (DB adapter)."""
+    return _ANALYTICS_SERVICE
 
 
 from app.services.user_service import UserService  # type: ignore
@@ -5,13 +5,20 @@ Pure data — no I/O, no side effects.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from uuid import UUID
 
-from pydantic import BaseModel, Field  # type: ignore
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter  # type: ignore
 
 from app.domain.enums import ChatStatus, UserRole, MockInterviewStatus  # type: ignore
 
+# Read-only response models built from DB rows: immutable, unknown columns dropped
+_READ_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+# Timezone-aware "now" (datetime.utcnow is deprecated and returns a naive value)
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 # ── User ──────────────────────────────────────────────────────
 
@@ -19,6 +26,8 @@ from app.domain.enums import ChatStatus, UserRole, MockInterviewStatus  # type:
 class UserProfile(BaseModel):
     """Response model for GET /users/me."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: UUID
     email: str
     role: UserRole
@@ -66,12 +75,14 @@ class JobCreate(BaseModel):
 class JobDetail(BaseModel):
     """Full 4-Pillar response for GET /jobs/{id}/details."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: UUID
     title: str
     description_raw: str
     skills_required: list[str] | None = None
     resume_guide_generated: list[str] | None = None
-    prep_guide_generated: list[InterviewQuestion | str | dict] | None = None
+    prep_guide_generated: list[InterviewQuestion] | None = None
     status: str = "active"
     company_name: str | None = None
     external_apply_url: str | None = None
@@ -82,6 +93,8 @@ class JobDetail(BaseModel):
 class JobFeedItem(BaseModel):
     """Lightweight item for the jobs feed."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: UUID
     title: str
     skills_required: list[str] | None = None
@@ -166,6 +179,19 @@ class AIEnrichment(BaseModel):
     )
 
 
+class BatchEnrichment(BaseModel):
+    """Wrapper for batch prompting: one AIEnrichment per job, in input order."""
+
+    items: list[AIEnrichment] = Field(
+        ...,
+        description="One enrichment per job, in the same order as the jobs were given",
+    )
+
+
+# Compiled once; validate whole DB result sets in a single call on list endpoints
+JobDetailList = TypeAdapter(list[JobDetail])
+
+
 # ── Chat ──────────────────────────────────────────────────────
 
 
@@ -174,7 +200,7 @@ class ChatMessage(BaseModel):
 
     role: str = Field(..., pattern=r"^(user|assistant|admin)$")
     content: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class TakeoverRequest(BaseModel):
@@ -186,6 +212,8 @@ class TakeoverRequest(BaseModel):
 class ChatSessionInfo(BaseModel):
     """Info about a chat session."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: UUID
     user_id: UUID | None = None
     status: ChatStatus
@@ -194,6 +222,28 @@ class ChatSessionInfo(BaseModel):
     created_at: datetime | None = None
 
 
+ChatSessionInfoList = TypeAdapter(list[ChatSessionInfo])
+
+
+# ── Blog ──────────────────────────────────────────────────────
+
+
+class BlogPostCreate(BaseModel):
+    """
+    Insert payload for blog_posts_jobs: only the table's writable columns
+    (extra keys from the LLM draft are dropped); id and timestamps come from
+    the column defaults.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    slug: str
+    title: str
+    summary: str | None = None
+    content: str
+    image_url: str | None = None
+
+
 # ── Mock Interview ────────────────────────────────────────────
 
 
@@ -209,6 +259,8 @@ class MockScorecard(BaseModel):
 class MockInterview(BaseModel):
     """Full mock interview record."""
 
+    model_config = _READ_MODEL_CONFIG
+
     id: UUID
     user_id: UUID
     job_id: UUID
@@ -4,6 +4,7 @@ Concrete implementations (OpenAI, Ollama, etc.) must implement this port.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.domain.models import AIEnrichment, ChatMessage, MockScorecard
 
@@ -21,6 +22,29 @@ class AIPort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def generate_enrichment_batch(self, jobs: list[dict]) -> list[AIEnrichment]:
+        """
+        Real-time enrichment of many jobs at once, returned in input order.
+        Each job dict uses 'description_raw', 'skills_required', 'title', 'company_name'.
+        """
+        ...
+
+    @abstractmethod
+    async def submit_batch_enrichment(self, jobs: list[dict]) -> str:
+        """
+        Offline enrichment: queue jobs (each with an 'id') for asynchronous
+        processing by the provider's batch endpoint. Returns a batch ID.
+        """
+        ...
+
+    @abstractmethod
+    async def poll_batch(self, batch_id: str) -> dict[str, AIEnrichment] | None:
+        """
+        Results of a submitted batch keyed by job ID, or None while still running.
+        """
+        ...
+
     @abstractmethod
     async def extract_missing_skills(self, resume_text: str, required_skills: list[str]) -> list[str]:
         """
@@ -40,6 +64,16 @@ class AIPort(ABC):
         """
         ...
 
+    @abstractmethod
+    def chat_stream(
+        self, history: list[ChatMessage], user_context: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of chat(): yields reply text deltas as the
+        model generates them, for SSE delivery to the client.
+        """
+        ...
+
     @abstractmethod
     async def analyze_gap(self, resume_text: str, job_description: str) -> str:
         """
@@ -48,6 +82,13 @@ class AIPort(ABC):
         """
         ...
 
+    @abstractmethod
+    def analyze_gap_stream(self, resume_text: str, job_description: str) -> AsyncIterator[str]:
+        """
+        Streaming variant of analyze_gap(): yields explanation text deltas.
+        """
+        ...
+
     @abstractmethod
     async def tailor_resume(self, resume_text: str, job_description: str) -> str:
         """
@@ -56,6 +97,22 @@ class AIPort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def analyze_bundle(
+        self,
+        resume_text: str,
+        job_description: str,
+        required_skills: list[str],
+        tailor: bool = False,
+    ) -> tuple[list[str], str | None, str | None]:
+        """
+        Run missing-skill extraction, gap analysis and (optionally) resume
+        tailoring concurrently for one resume/job pair.
+        Returns (missing_skills, gap_analysis, tailored_resume); a part that
+        failed or was not requested comes back empty / None.
+        """
+        ...
+
     @abstractmethod
     async def generate_blog_post(self, prompt: str) -> dict:
         """
@@ -64,6 +121,15 @@ class AIPort(ABC):
         """
         ...
 
+    @abstractmethod
+    def generate_blog_post_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Streaming variant of generate_blog_post(): yields raw JSON text
+        deltas so callers can act on early fields (e.g. slug) before the
+        content is finished.
+        """
+        ...
+
     @abstractmethod
     async def evaluate_mock_interview(
         self, transcript: list[dict[str, str]], job_description: str
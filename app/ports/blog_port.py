@@ -3,7 +3,16 @@ from typing import Any, List
 
 class BlogPort(ABC):
     @abstractmethod
-    async def create_blog_post(self, data: dict[str, Any]) -> dict[str, Any]:
+    async def create_blog_post(
+        self, data: dict[str, Any], embedding: list[float] | None = None
+    ) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def find_similar_blog_post(
+        self, embedding: list[float], threshold: float, days: int
+    ) -> dict[str, Any] | None:
+        """Most similar post published in the last `days` days at or above `threshold` cosine."""
         pass
 
     @abstractmethod
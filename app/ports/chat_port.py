@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any, List
 
 class ChatPort(ABC):
@@ -13,8 +14,15 @@ class ChatPort(ABC):
         pass
 
     @abstractmethod
-    async def get_all_chat_sessions(self) -> list[dict[str, Any]]:
-        """Fetch all chat sessions."""
+    async def append_to_conversation_log(self, session_id: str, entry: dict[str, Any]) -> bool:
+        """Append one entry to conversation_log server-side; False if the session doesn't exist."""
+        pass
+
+    @abstractmethod
+    async def get_all_chat_sessions(
+        self, limit: int = 50, cursor: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch a page of chat sessions, newest first, created before `cursor` (ISO timestamp)."""
         pass
     
     @abstractmethod
@@ -22,6 +30,11 @@ class ChatPort(ABC):
         """List all chat sessions for a given user."""
         pass
 
+    @abstractmethod
+    def iter_user_sessions(self, user_id: str, page_size: int = 200) -> AsyncIterator[list[dict[str, Any]]]:
+        """Same rows as list_user_sessions(), yielded one page at a time."""
+        ...
+
     @abstractmethod
     async def find_chat_session(self, user_id: str, job_id: str) -> dict[str, Any] | None:
         """Find a chat session by user ID and job ID."""
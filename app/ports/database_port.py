@@ -31,3 +31,27 @@ class DatabasePort(UserPort, JobPort, BlogPort, ChatPort, MockInterviewPort, ABC
     async def get_learning_resources(self, skills: list[str]) -> list[dict[str, Any]]:
         """Fetch learning resources for a list of skills."""
         ...
+
+    # ── AI Response Cache ──
+
+    @abstractmethod
+    async def get_cached_ai_response(self, prompt_hash: str) -> dict[str, Any] | None:
+        """Return a stored LLM response for this input hash, if any."""
+        ...
+
+    @abstractmethod
+    async def save_ai_response(self, prompt_hash: str, response: dict[str, Any], model: str) -> None:
+        """Store an LLM response under its input hash (existing keys are left as-is)."""
+        ...
+
+    # ── Embedding Cache ──
+
+    @abstractmethod
+    async def get_cached_embeddings(self, content_hashes: list[str]) -> dict[str, list[float]]:
+        """Bulk-fetch stored embeddings; returns only the hashes that were found."""
+        ...
+
+    @abstractmethod
+    async def save_cached_embeddings(self, vectors: dict[str, list[float]]) -> None:
+        """Store embeddings keyed by content hash (existing keys are left as-is)."""
+        ...
@@ -15,3 +15,11 @@ class EmbeddingPort(ABC):
         Expected output dimension: 384.
         """
         ...
+
+    @abstractmethod
+    async def encode_many(self, texts: list[str]) -> list[list[float]]:
+        """
+        Convert several texts into vectors in one round-trip.
+        Output order matches input order.
+        """
+        ...
@@ -8,8 +8,10 @@ class JobPort(ABC):
         ...
 
     @abstractmethod
-    async def get_job(self, job_id: str) -> dict[str, Any] | None:
-        """Fetch a single job by ID."""
+    async def get_job(
+        self, job_id: str, columns: tuple[str, ...] | None = None
+    ) -> dict[str, Any] | None:
+        """Fetch a single job by ID (only `columns`, when given)."""
         ...
 
     @abstractmethod
@@ -18,8 +20,15 @@ class JobPort(ABC):
         ...
 
     @abstractmethod
-    async def list_jobs_by_provider(self, provider_id: str) -> list[dict[str, Any]]:
-        """List all jobs owned by a given provider."""
+    async def bulk_update_job_status(self, job_ids: list[str], status: str) -> None:
+        """Set the same status on several jobs in one statement."""
+        ...
+
+    @abstractmethod
+    async def list_jobs_by_provider(
+        self, provider_id: str, columns: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        """List all jobs owned by a given provider (only `columns`, when given)."""
         ...
 
     @abstractmethod
@@ -38,11 +47,40 @@ class JobPort(ABC):
         ...
 
     @abstractmethod
-    async def list_active_jobs(self, skip: int = 0, limit: int = 20) -> list[dict[str, Any]]:
-        """Paginated list of active jobs."""
+    async def find_jobs_by_description_hashes(
+        self, description_hashes: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Batch variant: map each hash to one already-enriched job carrying it."""
+        ...
+
+    @abstractmethod
+    async def list_active_jobs(
+        self, skip: int = 0, limit: int = 20, columns: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        """Paginated list of active jobs (only `columns`, when given)."""
         ...
 
     @abstractmethod
-    async def get_all_jobs_for_analytics(self) -> list[dict[str, Any]]:
+    async def list_ranked_jobs(
+        self,
+        embedding: list[float],
+        skip: int = 0,
+        limit: int = 20,
+        columns: tuple[str, ...] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Active jobs ordered by cosine distance to `embedding` (nearest first)."""
+        ...
+
+    @abstractmethod
+    async def get_all_jobs_for_analytics_raw(self) -> list[dict[str, Any]]:
         """Fetch all active jobs with fields relevant for analytics (title, salary, skills)."""
         ...
+
+    @abstractmethod
+    async def get_jobs_analytics(self) -> dict[str, Any]:
+        """
+        Fetch pre-aggregated market stats computed in the database:
+        total_jobs, top_skills, top_companies, work_styles, experience_levels,
+        plus the (title, salary_range) pairs needed for salary trends.
+        """
+        ...
@@ -2,60 +2,58 @@
 Admin endpoints — Control Tower management.
 """
 
-import json
+import asyncio
 import logging
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+import orjson  # type: ignore
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
-from app.dependencies import get_ai_service, get_db, get_embedding_service
-from app.ports.ai_port import AIPort
+from app.dependencies import get_db
 from app.ports.database_port import DatabasePort
-from app.ports.embedding_port import EmbeddingPort
-from app.services.auth_service import get_current_user
+from app.services.auth_service import require_role
 from app.services.chat_service import ChatService
-from app.services.enrichment_service import EnrichmentService
-from app.scheduler import trigger_ingestion # Manual trigger import
+from app.worker.ingestion_tasks import ingest_jobs, reenrich_unenriched
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
+async def _push_to_session(session_id: str, payload: dict[str, Any]) -> None:
+    """Push live via WebSocket if the user is connected; the log copy is authoritative."""
+    from app.routers.chat import manager
+    try:
+        await manager.send_message(session_id, orjson.dumps(payload).decode())
+    except Exception:
+        pass  # User may not be connected right now — message is saved in log anyway
+
+
 @router.get("/sessions", status_code=status.HTTP_200_OK)
 async def get_all_sessions(
-    current_user: dict[str, Any] = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="created_at of the last session on the previous page"),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
     db: DatabasePort = Depends(get_db),
 ):
     """
-    Get all active chat sessions for the Control Tower.
+    Get chat sessions for the Control Tower, newest first.
+    Pass the last row's created_at as `cursor` to fetch the next page.
     """
-    if current_user.get("role") != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admins can view all sessions",
-        )
-    
-    sessions = await db.get_all_chat_sessions()
+    sessions = await db.get_all_chat_sessions(limit=limit, cursor=cursor)
     return sessions
 
 
 @router.get("/sessions/{session_id}", status_code=status.HTTP_200_OK)
 async def get_session_details(
     session_id: str,
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
     db: DatabasePort = Depends(get_db),
 ):
     """
     Get full details for a specific chat session (Admin only).
     """
-    if current_user.get("role") != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admins can view session details",
-        )
-    
     session = await db.get_chat_session(session_id)
     if not session:
         raise HTTPException(
@@ -69,7 +67,7 @@ async def get_session_details(
 @router.post("/sessions/{session_id}/intercept", status_code=status.HTTP_200_OK)
 async def intercept_session(
     session_id: str,
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
     db: DatabasePort = Depends(get_db),
 ):
     """
@@ -77,39 +75,22 @@ async def intercept_session(
     Injects a system notification into the chat log and pushes it
     live to the user via their active WebSocket connection.
     """
-    if current_user.get("role") != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admins can intercept sessions",
-        )
-
-    session = await db.get_chat_session(session_id)
-    if not session:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-
     # Inject a system notification into the conversation log
-    import json
     from datetime import datetime, timezone
-    from app.services.chat_service import ChatService
 
-    log = ChatService._parse_log(session.get("conversation_log"))
     notification = {
         "role": "system",
         "content": "🛡️ An expert has joined the conversation.",
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
-    log.append(notification)
-    await db.update_chat_session(session_id, {"conversation_log": log})
 
-    # Push live via WebSocket if user is connected
-    from app.routers.chat import manager
-    try:
-        await manager.send_message(
-            session_id,
-            json.dumps({"type": "system_notification", "content": notification["content"]}),
-        )
-    except Exception:
-        pass  # User may not be connected right now — message is saved in log anyway
+    # Append server-side and push live concurrently
+    appended, _ = await asyncio.gather(
+        db.append_to_conversation_log(session_id, notification),
+        _push_to_session(session_id, {"type": "system_notification", "content": notification["content"]}),
+    )
+    if not appended:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
 
     return {"ok": True, "message": "Expert notification sent"}
 
@@ -122,7 +103,7 @@ class AdminMessageBody(BaseModel):
 async def send_admin_message(
     session_id: str,
     body: AdminMessageBody,
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
     db: DatabasePort = Depends(get_db),
 ):
     """
@@ -130,35 +111,21 @@ async def send_admin_message(
     The message is saved to the conversation log and pushed
     live to the seeker's active WebSocket connection.
     """
-    if current_user.get("role") != "admin":
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admins only")
-
-    session = await db.get_chat_session(session_id)
-    if not session:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-
-    import json
     from datetime import datetime, timezone
-    from app.services.chat_service import ChatService
-    from app.routers.chat import manager
 
-    log = ChatService._parse_log(session.get("conversation_log"))
     msg = {
         "role": "admin",
         "content": body.content,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
-    log.append(msg)
-    await db.update_chat_session(session_id, {"conversation_log": log})
 
-    # Push to the seeker's live WebSocket
-    try:
-        await manager.send_message(
-            session_id,
-            json.dumps({"type": "admin_message", "content": body.content}),
-        )
-    except Exception:
-        pass
+    # Append server-side and push to the seeker's live WebSocket concurrently
+    appended, _ = await asyncio.gather(
+        db.append_to_conversation_log(session_id, msg),
+        _push_to_session(session_id, {"type": "admin_message", "content": body.content}),
+    )
+    if not appended:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
 
     return {"ok": True}
 
@@ -167,23 +134,15 @@ async def send_admin_message(
 
 @router.post("/ingest/trigger", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_manual_ingestion(
-    background_tasks: BackgroundTasks,
     scraper_name: Optional[str] = None,
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin", "provider")),
 ):
     """
     Manually trigger the job ingestion process.
     - scraper_name: 'deloitte', 'pwc', etc. or None for all.
     """
-    role = current_user.get("role")
-    if role not in ["admin", "provider"]:
-         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions to trigger ingestion",
-        )
-
-    # Run in background to avoid blocking the request
-    background_tasks.add_task(trigger_ingestion, scraper_name)
+    # Queue for the ingest worker; the broker publish is blocking I/O, so off the loop
+    await asyncio.to_thread(ingest_jobs.delay, scraper_name)
     
     return {
         "message": f"Ingestion triggered for {scraper_name or 'ALL scrapers'}",
@@ -191,86 +150,23 @@ async def trigger_manual_ingestion(
     }
 
 
-async def _reenrich_unenriched_jobs(db: DatabasePort, ai: AIPort, emb: EmbeddingPort):
-    """Background task: find all jobs missing enrichment and re-run the pipeline in small batches."""
-    import asyncio
-
-    BATCH_SIZE = 3          # Process 3 jobs at a time
-    BATCH_DELAY_SECS = 3    # Wait 3 seconds between batches
-
-    enricher = EnrichmentService(db=db, ai=ai, embeddings=emb)
-
-    # Query all jobs missing any enrichment data
-    result = (
-        db._client.table("jobs_jobs")
-        .select("id, title, company_name, prep_guide_generated, resume_guide_generated, embedding, status")
-        .execute()
-    )
-    all_jobs = result.data or []
-
-    unenriched = [
-        j for j in all_jobs
-        if not j.get("prep_guide_generated")
-        or not j.get("resume_guide_generated")
-        or not j.get("embedding")
-    ]
-
-    logger.info("Re-enrichment: %d/%d jobs need enrichment", len(unenriched), len(all_jobs))
-
-    success = 0
-    failed = 0
-
-    # Process in small batches to avoid overloading the server
-    for batch_start in range(0, len(unenriched), BATCH_SIZE):
-        batch = unenriched[batch_start:batch_start + BATCH_SIZE]
-        batch_num = (batch_start // BATCH_SIZE) + 1
-        total_batches = (len(unenriched) + BATCH_SIZE - 1) // BATCH_SIZE
-        logger.info("Processing batch %d/%d (%d jobs)", batch_num, total_batches, len(batch))
-
-        for job in batch:
-            job_id = job["id"]
-            try:
-                await enricher.enrich_job(job_id)
-                # Fix stuck 'processing' status
-                if job.get("status") == "processing":
-                    await db.update_job(job_id, {"status": "active"})
-                success += 1
-                logger.info("Re-enriched: %s (%s)", job.get("title"), job.get("company_name"))
-            except Exception:
-                failed += 1
-                logger.exception("Re-enrichment failed for job %s", job_id)
-
-        # Pause between batches to let the server breathe
-        if batch_start + BATCH_SIZE < len(unenriched):
-            logger.info("Batch %d done. Pausing %ds before next batch...", batch_num, BATCH_DELAY_SECS)
-            await asyncio.sleep(BATCH_DELAY_SECS)
-
-    logger.info("Re-enrichment complete: %d success, %d failed", success, failed)
-
-
 @router.post("/reenrich", status_code=status.HTTP_202_ACCEPTED)
-async def reenrich_jobs(
-    background_tasks: BackgroundTasks,
-    db: DatabasePort = Depends(get_db),
-    ai: AIPort = Depends(get_ai_service),
-    emb: EmbeddingPort = Depends(get_embedding_service),
-):
+async def reenrich_jobs(use_batch_api: bool = False):
     """
     Re-run AI enrichment for all jobs missing prep_guide, resume_guide, or embedding.
+    - use_batch_api: submit through the OpenAI Batch API (~50% cheaper,
+      results applied within 24h) instead of enriching immediately.
     Does NOT require auth — use for development/debugging only.
     """
-    background_tasks.add_task(_reenrich_unenriched_jobs, db, ai, emb)
-    return {"message": "Re-enrichment started in background. Check server logs for progress."}
+    await asyncio.to_thread(reenrich_unenriched.delay, use_batch_api)
+    return {"message": "Re-enrichment queued. Check ingest worker logs for progress."}
 
 
 @router.post("/scrape-all", status_code=status.HTTP_202_ACCEPTED)
-async def scrape_all_sources(
-    background_tasks: BackgroundTasks,
-):
+async def scrape_all_sources():
     """
     Trigger full scraping from all sources (no auth — dev only).
     """
-    from app.scheduler import trigger_ingestion
-    background_tasks.add_task(trigger_ingestion, "all")
-    return {"message": "Scraping ALL sources triggered in background. Check server logs for progress."}
+    await asyncio.to_thread(ingest_jobs.delay, "all")
+    return {"message": "Scraping ALL sources queued. Check ingest worker logs for progress."}
 
@@ -3,12 +3,19 @@ Auth endpoints — handles signup and login via the Supabase Admin API.
 Routes through the backend to bypass Supabase's free-tier rate limits.
 """
 
+import asyncio
 import logging
+from typing import Any
+
+from cachetools import TTLCache  # type: ignore
 from pydantic import BaseModel, EmailStr  # type: ignore
 
-from fastapi import APIRouter, HTTPException, status  # type: ignore
+from fastapi import APIRouter, Depends, HTTPException, status  # type: ignore
+from supabase import Client, create_client  # type: ignore
 
 from app.config import settings  # type: ignore
+from app.dependencies import get_db  # type: ignore
+from app.ports.database_port import DatabasePort  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -37,32 +44,37 @@ class AuthResponse(BaseModel):
     role: str | None = None
 
 
-# ── Lazy singleton for the admin Supabase client ──────────────
-_admin_client = None
+# ── Supabase Auth client (built once at import) ───────────────
+# Only used for GoTrue calls. sign_in_with_password swaps this client's
+# session to the signed-in user, so table access goes through the pooled
+# async DatabasePort instead (service role, unaffected by sign-ins).
+_AUTH_CLIENT: Client = create_client(
+    settings.supabase_url,
+    settings.supabase_service_role_key,
+)
 
+# user_id → role; lets repeat logins skip the users_jobs lookup
+_role_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
 
-def _get_admin_client():
-    global _admin_client
-    if _admin_client is None:
-        from supabase import create_client  # type: ignore
-        _admin_client = create_client(
-            settings.supabase_url,
-            settings.supabase_service_role_key,
-        )
-    return _admin_client
+
+def get_auth_client() -> Client:
+    return _AUTH_CLIENT
 
 
 @router.post("/signup", response_model=AuthResponse)
-async def signup(req: SignUpRequest):
+async def signup(
+    req: SignUpRequest,
+    client: Client = Depends(get_auth_client),
+    db: DatabasePort = Depends(get_db),
+):
     """
     Create a new user via the Supabase Admin API (service role key).
     Bypasses email rate limits completely.
     """
-    client = _get_admin_client()
-
     try:
         # 1. Create user via Admin API — auto-confirms, no email sent
-        response = client.auth.admin.create_user({
+        #    (supabase-py is synchronous; keep it off the event loop)
+        response = await asyncio.to_thread(client.auth.admin.create_user, {
             "email": req.email,
             "password": req.password,
             "email_confirm": True,
@@ -83,40 +95,25 @@ async def signup(req: SignUpRequest):
 
         logger.info(f"User created via admin API: {user.id}")
 
-        # 2. Ensure user exists in public.users table
-        existing = (
-            client.table("users_jobs")
-            .select("id")
-            .eq("id", user.id)
-            .maybe_single()
-            .execute()
-        )
-        if not existing or not existing.data:
-            client.table("users_jobs").insert({
-                "id": user.id,
+        # 2. Ensure user exists in public.users table (one upsert — the row may
+        #    already have been created by the auth trigger) and
+        # 3. sign in to get tokens; neither depends on the other
+        _, sign_in_response = await asyncio.gather(
+            db.upsert_user(user.id, {
                 "email": req.email,
                 "role": req.role,
                 "password": req.password,
                 "full_name": req.full_name,
                 "phone": req.phone,
                 "location": req.location,
-            }).execute()
-        else:
-            # Update password column for existing row (created by trigger)
-            client.table("users_jobs").update({
+            }),
+            asyncio.to_thread(client.auth.sign_in_with_password, {
+                "email": req.email,
                 "password": req.password,
-                "role": req.role,
-                "full_name": req.full_name,
-                "phone": req.phone,
-                "location": req.location,
-            }).eq("id", user.id).execute()
+            }),
+        )
 
-        # 3. Sign in to get tokens (using the anon-key client approach)
-        #    We use the admin client to generate a session link instead
-        sign_in_response = client.auth.sign_in_with_password({
-            "email": req.email,
-            "password": req.password,
-        })
+        _role_cache[user.id] = req.role
 
         session = sign_in_response.session
         if not session:
@@ -150,15 +147,17 @@ async def signup(req: SignUpRequest):
 
 
 @router.post("/login", response_model=AuthResponse)
-async def login(req: SignInRequest):
+async def login(
+    req: SignInRequest,
+    client: Client = Depends(get_auth_client),
+    db: DatabasePort = Depends(get_db),
+):
     """
     Login via the backend using the Supabase Admin client.
     Bypasses rate limits on the auth endpoint.
     """
-    client = _get_admin_client()
-
     try:
-        response = client.auth.sign_in_with_password({
+        response = await asyncio.to_thread(client.auth.sign_in_with_password, {
             "email": req.email,
             "password": req.password,
         })
@@ -172,15 +171,13 @@ async def login(req: SignInRequest):
                 detail="Invalid email or password.",
             )
 
-        # Fetch role from public.users
-        profile = (
-            client.table("users_jobs")
-            .select("role")
-            .eq("id", user.id)
-            .maybe_single()
-            .execute()
-        )
-        role = profile.data.get("role") if profile and profile.data else None
+        # Fetch role from public.users (cached per user for a few minutes)
+        role = _role_cache.get(user.id)
+        if role is None:
+            profile: dict[str, Any] | None = await db.get_user(user.id)
+            role = profile.get("role") if profile else None
+            if role is not None:
+                _role_cache[user.id] = role
 
         return AuthResponse(**{  # type: ignore
             "access_token": session.access_token,
@@ -1,14 +1,17 @@
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from app.ports.database_port import DatabasePort
 from app.ports.ai_port import AIPort
-from app.dependencies import get_db, get_ai_service
-from app.services.auth_service import get_current_user
+from app.ports.embedding_port import EmbeddingPort
+from app.dependencies import get_db, get_ai_service, get_embedding_service, get_news_service
+from app.services.auth_service import require_role
 from app.agents.blog_agent import BlogAgent
+from app.services.market_news_service import MarketNewsService
 
 router = APIRouter(prefix="/blogs", tags=["Blog"])
 
-@router.get("/", response_model=List[dict])
+@router.get("/", response_model=List[dict], response_class=ORJSONResponse)
 async def list_blogs(
     limit: int = 10,
     db: DatabasePort = Depends(get_db)
@@ -16,9 +19,9 @@ async def list_blogs(
     """
     Public endpoint: List recent blog posts.
     """
-    return await db.list_blog_posts(limit=limit)
+    return ORJSONResponse(await db.list_blog_posts(limit=limit))
 
-@router.get("/{slug}", response_model=dict)
+@router.get("/{slug}", response_model=dict, response_class=ORJSONResponse)
 async def get_blog(
     slug: str,
     db: DatabasePort = Depends(get_db)
@@ -29,21 +32,20 @@ async def get_blog(
     post = await db.get_blog_post(slug)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    return ORJSONResponse(post)
 
 @router.post("/generate", status_code=status.HTTP_201_CREATED)
 async def generate_blog_post(
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
     db: DatabasePort = Depends(get_db),
-    ai: AIPort = Depends(get_ai_service)
+    ai: AIPort = Depends(get_ai_service),
+    embeddings: EmbeddingPort = Depends(get_embedding_service),
+    news: MarketNewsService = Depends(get_news_service)
 ):
     """
     Admin only: Manually trigger AI blog generation.
     """
-    if current_user.get("role") != "admin":
-        raise HTTPException(status_code=403, detail="Admin only")
-    
-    agent = BlogAgent(db, ai)
+    agent = BlogAgent(db, ai, embeddings, news)
     post = await agent.generate_weekly_digest()
     
     if not post:
@@ -53,17 +55,16 @@ async def generate_blog_post(
 
 @router.post("/refresh-trends", status_code=status.HTTP_201_CREATED)
 async def refresh_market_trends(
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
     db: DatabasePort = Depends(get_db),
-    ai: AIPort = Depends(get_ai_service)
+    ai: AIPort = Depends(get_ai_service),
+    embeddings: EmbeddingPort = Depends(get_embedding_service),
+    news: MarketNewsService = Depends(get_news_service)
 ):
     """
     Admin only: Trigger 'Big 4 Campus Watch' generation using Real-Time News.
     """
-    if current_user.get("role") != "admin":
-        raise HTTPException(status_code=403, detail="Admin only")
-    
-    agent = BlogAgent(db, ai)
+    agent = BlogAgent(db, ai, embeddings, news)
     post = await agent.generate_weekly_digest()
     
     if not post:
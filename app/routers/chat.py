@@ -7,14 +7,19 @@ Production hardening:
   - Status-aware routing (AI vs human mode)
 """
 
-import json
+import asyncio
 import logging
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
+import orjson  # type: ignore
+from cachetools import TTLCache  # type: ignore
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import Response, StreamingResponse
 
 from app.dependencies import get_ai_service, get_db
-from app.domain.models import ChatSessionInfo
+from app.domain.models import ChatSessionInfo, ChatSessionInfoList
 from app.ports.ai_port import AIPort
 from app.ports.database_port import DatabasePort
 from app.services.auth_service import get_current_user
@@ -29,30 +34,117 @@ class ConnectionManager:
     """
     Manages active WebSocket connections keyed by session_id.
     In production, replace with Redis Pub/Sub for horizontal scaling.
+
+    Each socket gets a bounded outbound queue drained by its own relay task,
+    so send_message never waits on a slow client's send buffer. JSON events
+    that arrive within a short window of each other are sent as a single
+    {"type": "batch", "messages": [...]} frame. Messages are never dropped:
+    a client too slow to keep its queue below the bound is disconnected
+    (and gets the history replay when it reconnects).
     """
 
+    __slots__ = ("_active", "_closing")
+
+    _QUEUE_SIZE = 64
+    _COALESCE_SECS = 0.010
+
     def __init__(self) -> None:
-        self._active: dict[str, WebSocket] = {}
+        self._active: dict[str, tuple[WebSocket, asyncio.Queue[str], asyncio.Task]] = {}
+        # Close tasks for overflowed sockets, referenced until they finish
+        self._closing: set[asyncio.Task] = set()
 
     async def connect(self, session_id: str, websocket: WebSocket) -> None:
         await websocket.accept()
-        self._active[session_id] = websocket
-
-    def disconnect(self, session_id: str) -> None:
-        self._active.pop(session_id, None)
+        self.disconnect(session_id)
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._QUEUE_SIZE)
+        task = asyncio.create_task(self._relay(session_id, websocket, queue))
+        self._active[session_id] = (websocket, queue, task)
+
+    def disconnect(self, session_id: str, websocket: WebSocket | None = None) -> None:
+        """Drop the session's socket (only if it is still `websocket`, when given)."""
+        entry = self._active.get(session_id)
+        if entry and (websocket is None or entry[0] is websocket):
+            del self._active[session_id]
+            entry[2].cancel()
+
+    def _enqueue(self, session_id: str, queue: asyncio.Queue[str], message: str) -> None:
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            entry = self._active.get(session_id)
+            if not entry or entry[1] is not queue:
+                return
+            logger.warning(
+                "Closing WebSocket for session %s: %d messages unsent (client too slow)",
+                session_id, queue.qsize(),
+            )
+            del self._active[session_id]
+            entry[2].cancel()
+            task = asyncio.create_task(self._close(entry[0]))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket) -> None:
+        try:
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        except Exception:
+            pass  # already closed by the client
+
+    async def _relay(self, session_id: str, websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+        try:
+            while True:
+                # Every queued message is a JSON event. Let events arriving
+                # right behind this one catch up, then drain whatever is
+                # queued without blocking.
+                batch = [await queue.get()]
+                await asyncio.sleep(self._COALESCE_SECS)
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                if len(batch) == 1:
+                    await websocket.send_text(batch[0])
+                else:
+                    # Messages are already JSON-encoded; splice them into one array
+                    await websocket.send_text('{"type": "batch", "messages": [' + ", ".join(batch) + "]}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info("Dropping WebSocket for session %s after send failure: %s", session_id, e)
+            # Only unregister if a reconnect hasn't already replaced this socket
+            entry = self._active.get(session_id)
+            if entry and entry[0] is websocket:
+                del self._active[session_id]
 
     async def send_message(self, session_id: str, message: str) -> None:
-        ws = self._active.get(session_id)
-        if ws:
-            await ws.send_text(message)
+        """Queue a message for the session's socket (a socket whose queue is full is closed)."""
+        entry = self._active.get(session_id)
+        if entry:
+            self._enqueue(session_id, entry[1], message)
+
+    def sender(self, session_id: str) -> Callable[[str], None]:
+        """
+        Bind the session's queue once, for the socket's own handler loop:
+        each send is then a plain call with no registry lookup.
+        """
+        queue = self._active[session_id][1]
+        return partial(self._enqueue, session_id, queue)
 
     def get(self, session_id: str) -> WebSocket | None:
-        return self._active.get(session_id)
+        entry = self._active.get(session_id)
+        return entry[0] if entry else None
 
 
 # Shared instance used by both this router and the admin router
 manager = ConnectionManager()
 
+# (session_id, status, log length) → (history_replay frame, history empty?, status)
+_replay_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+
+
+def _log_length(raw: Any) -> int:
+    return len(ChatService._parse_log(raw))
+
 
 # ── REST endpoints for chat session management ────────────────
 
@@ -62,6 +154,10 @@ class CreateSessionRequest(BaseModel):
     job_id: str | None = None
 
 
+class SendMessageRequest(BaseModel):
+    content: str
+
+
 @router.post(
     "/chat/sessions",
     response_model=ChatSessionInfo,
@@ -88,14 +184,16 @@ async def create_chat_session(
     initial_log = []
     if job_id:
         # Fetch job details so coach has full context
-        job = await db.get_job(job_id)
+        job = await db.get_job(
+            job_id, columns=("title", "description_chat_context", "skills_required")
+        )
         if job:
             initial_log.append({
                 "role": "system",
                 "content": f"__job_context__|{job_id}",
                 "job_id": job_id,
                 "job_title": job.get("title", ""),
-                "job_description": (job.get("description_raw") or "")[:3000],
+                "job_description": job.get("description_chat_context") or "",
                 "skills_required": job.get("skills_required", []),
                 "hidden": True,
             })
@@ -115,16 +213,28 @@ async def list_my_sessions(
     db: DatabasePort = Depends(get_db),
 ):
     """List all chat sessions for the current user."""
-    sessions = await db.list_user_sessions(current_user["id"])
-    
-    # Flatten the Supabase join result: {'jobs': {'title': '...'}} -> job_title
-    results = []
-    for s in sessions:
-        if s.get("jobs"):
-            s["job_title"] = s["jobs"].get("title")
-        results.append(ChatSessionInfo(**s))
-        
-    return results
+
+    # Fetch the first page before responding so a DB failure still reaches
+    # the exception handler as a proper error status; the remaining pages
+    # are streamed as they arrive.
+    pages = db.iter_user_sessions(current_user["id"])
+    first_page = await anext(pages, None)
+    if first_page is None:
+        return Response(b"[]", media_type="application/json")
+
+    def _encode(page: list[dict[str, Any]]) -> bytes:
+        # Rows come back flat (job_title spread from the job embed)
+        return ChatSessionInfoList.dump_json(ChatSessionInfoList.validate_python(page))[1:-1]
+
+    first_chunk = _encode(first_page)
+
+    async def _body():
+        yield b"[" + first_chunk
+        async for page in pages:
+            yield b"," + _encode(page)
+        yield b"]"
+
+    return StreamingResponse(_body(), media_type="application/json")
 
 
 @router.get("/chat/sessions/{session_id}", response_model=ChatSessionInfo)
@@ -143,6 +253,61 @@ async def get_chat_session(
     return ChatSessionInfo(**session)
 
 
+@router.post("/chat/sessions/{session_id}/stream")
+async def stream_chat_message(
+    session_id: str,
+    body: SendMessageRequest,
+    current_user: dict[str, Any] = Depends(get_current_user),
+    db: DatabasePort = Depends(get_db),
+    ai: AIPort = Depends(get_ai_service),
+):
+    """
+    Send a message and stream the AI reply back as Server-Sent Events.
+
+    Emits `{"type": "ai_delta", "content": ...}` events as tokens arrive and a
+    final `{"type": "done"}` event — time-to-first-token instead of full
+    generation time before the user sees anything.
+    """
+    session = await db.get_chat_session(session_id)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat session not found",
+        )
+    if str(session.get("user_id")) != str(current_user["id"]):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not your chat session",
+        )
+    if session.get("status") == "closed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Session is closed",
+        )
+    if not body.content.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Message is empty",
+        )
+
+    chat_svc = ChatService(db=db, ai=ai)
+
+    async def event_stream():
+        try:
+            async for delta in chat_svc.handle_message_stream(session_id, body.content):
+                yield b"data: " + orjson.dumps({"type": "ai_delta", "content": delta}) + b"\n\n"
+        except Exception as e:
+            logger.error("Error streaming message in session %s: %s", session_id, e)
+            yield b"data: " + orjson.dumps({"type": "error", "content": "I am having a moment — please try again."}) + b"\n\n"
+        yield b"data: " + orjson.dumps({"type": "done"}) + b"\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ── WebSocket endpoint ────────────────────────────────────────
 
 
@@ -175,28 +340,38 @@ async def websocket_chat(
         return
 
     await manager.connect(session_id, websocket)
+    send = manager.sender(session_id)
     chat_svc = ChatService(db=db, ai=ai)
 
     try:
         # ── History replay for state recovery ─────────────────
-        recent_messages, current_status = await chat_svc.get_recent_history(
-            session_id, count=10
-        )
-        await websocket.send_text(json.dumps({
-            "type": "history_replay",
-            "messages": recent_messages,
-            "session_status": current_status,
-        }))
+        # Reuses the session row fetched above; the serialized frame is cached
+        # briefly so clients reconnecting through a network flap skip the dump.
+        replay_key = (session_id, session_status, _log_length(session.get("conversation_log")))
+        cached = _replay_cache.get(replay_key)
+        if cached is None:
+            recent_messages, current_status = ChatService.recent_history_from(session, count=10)
+            cached = _replay_cache[replay_key] = (
+                orjson.dumps({
+                    "type": "history_replay",
+                    "messages": recent_messages,
+                    "session_status": current_status,
+                }).decode(),
+                not recent_messages,
+                current_status,
+            )
+        replay, history_empty, current_status = cached
+        send(replay)
 
         # ── Auto-greeting for new/empty sessions ─────────────
-        if not recent_messages and current_status == "active_ai":
+        if history_empty and current_status == "active_ai":
             try:
                 greeting = await chat_svc.generate_greeting(session_id)
                 if greeting:
-                    await websocket.send_text(json.dumps({
+                    send(orjson.dumps({
                         "type": "ai_reply",
                         "content": greeting,
-                    }))
+                    }).decode())
             except Exception as e:
                 logger.warning("Auto-greeting failed: %s", e)
 
@@ -204,13 +379,9 @@ async def websocket_chat(
         while True:
             data = await websocket.receive_text()
 
-            # Ignore heartbeat pings
-            if data == "__ping__":
-                await websocket.send_text("__pong__")
-                continue
-
-            # Ignore empty/whitespace messages
-            if not data.strip():
+            # Liveness uses native WebSocket PING frames (uvicorn --ws-ping-interval);
+            # legacy "__ping__" heartbeats and empty/whitespace messages are dropped
+            if data == "__ping__" or not data.strip():
                 continue
 
             try:
@@ -221,23 +392,24 @@ async def websocket_chat(
 
                 if reply is not None:
                     # AI mode → push reply immediately
-                    await websocket.send_text(json.dumps({
+                    send(orjson.dumps({
                         "type": "ai_reply",
                         "content": reply,
-                    }))
+                    }).decode())
                 else:
                     # Human mode → acknowledge receipt
-                    await websocket.send_text(json.dumps({
+                    send(orjson.dumps({
                         "type": "queued",
                         "content": "An admin will respond shortly.",
-                    }))
+                    }).decode())
             except Exception as e:
                 logger.error("Error handling message in session %s: %s", session_id, e)
-                await websocket.send_text(json.dumps({
+                send(orjson.dumps({
                     "type": "ai_reply",
                     "content": "I'm having a moment — please try again.",
-                }))
+                }).decode())
 
     except WebSocketDisconnect:
-        manager.disconnect(session_id)
         logger.info("WebSocket disconnected for session %s", session_id)
+    finally:
+        manager.disconnect(session_id, websocket)
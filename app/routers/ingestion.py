@@ -2,9 +2,10 @@
 Ingestion endpoints — admin-triggered external job scraping.
 """
 
+import asyncio
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks  # type: ignore
+from fastapi import APIRouter, Depends, HTTPException, status  # type: ignore
  
 from app.dependencies import (  # type: ignore
     get_ai_service, 
@@ -16,35 +17,28 @@ from app.dependencies import (  # type: ignore
 from app.ports.ai_port import AIPort  # type: ignore
 from app.ports.database_port import DatabasePort  # type: ignore
 from app.ports.embedding_port import EmbeddingPort  # type: ignore
-from app.services.auth_service import get_current_user  # type: ignore
+from app.services.auth_service import require_role  # type: ignore
 from app.services.ingestion_service import IngestionService  # type: ignore
+from app.worker.ingestion_tasks import daily_ingestion  # type: ignore
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
 @router.post("/ingest/all", status_code=status.HTTP_200_OK)
 async def ingest_all_sources(
-    background_tasks: BackgroundTasks,
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
 ):
-    """Trigger ingestion for ALL configured sources (background task)."""
-    if current_user.get("role") != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admins can trigger ingestion",
-        )
-
-    # We run this in background because it takes a while
-    from app.scheduler import run_daily_ingestion  # type: ignore
-    background_tasks.add_task(run_daily_ingestion)
+    """Trigger ingestion for ALL configured sources (queued for the ingest worker)."""
+    # Queued because it takes a while (the broker publish is blocking I/O)
+    await asyncio.to_thread(daily_ingestion.delay)
 
-    return {"message": "Global ingestion triggered in background"}
+    return {"message": "Global ingestion queued"}
 
 
 @router.post("/ingest/{source_name}", status_code=status.HTTP_200_OK)
 async def trigger_ingestion(
     source_name: str,
-    current_user: dict[str, Any] = Depends(get_current_user),
+    current_user: dict[str, Any] = Depends(require_role("admin")),
     svc: IngestionService = Depends(get_ingestion_service),
 ):
     """
@@ -52,13 +46,6 @@ async def trigger_ingestion(
 
     Supported sources: deloitte, pwc, kpmg, ey
     """
-    # Admin role check
-    if current_user.get("role") != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admins can trigger ingestion",
-        )
-
     # Resolve source name → scraper adapter
     try:
         scraper = get_scraper(source_name)
@@ -5,10 +5,11 @@ All logic delegated to JobService and EnrichmentService.
 
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status  # type: ignore
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status  # type: ignore
+from fastapi.responses import ORJSONResponse  # type: ignore
 
 from app.dependencies import get_ai_service, get_db, get_embedding_service  # type: ignore
-from app.domain.models import JobCreate, JobCreateResponse, JobDetail, JobFeedItem  # type: ignore
+from app.domain.models import JobCreate, JobCreateResponse, JobDetail, JobDetailList, JobFeedItem  # type: ignore
 from app.ports.ai_port import AIPort  # type: ignore
 from app.ports.database_port import DatabasePort  # type: ignore
 from app.ports.embedding_port import EmbeddingPort  # type: ignore
@@ -18,6 +19,10 @@ from app.services.job_service import JobService  # type: ignore
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+# Deepest rank the recommended feed serves: the HNSW scan returns at most
+# hnsw.ef_search candidates, which pgvector caps at 1000 (migration 018)
+RANKED_FEED_MAX_DEPTH = 1000
+
 
 @router.post(
     "",
@@ -59,7 +64,8 @@ async def list_provider_jobs(
     """List all jobs created by the authenticated provider."""
     job_svc = JobService(db=db)
     jobs = await job_svc.list_by_provider(current_user["id"])
-    return [JobDetail(**j) for j in jobs]
+    # Serialize in pydantic-core; response_model is kept for the OpenAPI schema
+    return Response(JobDetailList.dump_json(JobDetailList.validate_python(jobs)), media_type="application/json")
 
 
 @router.get("/feed", response_model=list[JobFeedItem])
@@ -71,7 +77,34 @@ async def get_job_feed(
     """Paginated feed of active job listings (public)."""
     job_svc = JobService(db=db)
     jobs = await job_svc.list_feed(skip=skip, limit=limit)
-    return [JobFeedItem(**j) for j in jobs]
+    # Rows are already projected to JobFeedItem's columns in JSON shape; skip
+    # re-validating them and encode straight to bytes. response_model documents it.
+    return ORJSONResponse(jobs)
+
+
+@router.get("/feed/recommended", response_model=list[JobFeedItem])
+async def get_recommended_feed(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: dict[str, Any] = Depends(get_current_user),
+    db: DatabasePort = Depends(get_db),
+):
+    """Active jobs ranked by semantic similarity to the caller's resume."""
+    if skip + limit > RANKED_FEED_MAX_DEPTH:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"skip + limit may not exceed {RANKED_FEED_MAX_DEPTH}.",
+        )
+    user = await db.get_user(current_user["id"])
+    if not user or not user.get("resume_embedding"):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="User has no resume embedding. Upload a resume first.",
+        )
+
+    job_svc = JobService(db=db)
+    jobs = await job_svc.list_recommended(user["resume_embedding"], skip=skip, limit=limit)
+    return ORJSONResponse(jobs)
 
 
 @router.get("/{job_id}/details", response_model=JobDetail)
@@ -89,4 +122,4 @@ async def get_job_details(
             detail="Job not found",
         )
 
-    return JobDetail(**job)
+    return Response(JobDetail(**job).model_dump_json(), media_type="application/json")
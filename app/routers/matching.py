@@ -2,9 +2,15 @@
 Matching endpoint — cosine similarity between user and job embeddings.
 """
 
+import asyncio
+import hashlib
+import logging
 from typing import Any
 
+import orjson  # type: ignore
+from cachetools import TTLCache  # type: ignore
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from app.dependencies import get_matching_service, get_db, get_ai_service
 from app.domain.models import MatchResult
@@ -13,8 +19,21 @@ from app.ports.ai_port import AIPort
 from app.services.auth_service import get_current_user
 from app.services.matching_service import MatchingService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/jobs", tags=["Matching"])
 
+# Tailored resumes keyed on (resume, job description, model), held in process
+# memory only: they carry the seeker's resume, so they expire with the TTL
+# rather than persisting in a shared table.
+_tailored_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+
+def _tailor_cache_key(resume_text: str, job_description: str, model: str) -> str:
+    resume_hash = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    jd_hash = hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"tailor|{resume_hash}|{jd_hash}|{model}".encode("utf-8")).hexdigest()
+
 
 @router.post("/{job_id}/match", response_model=MatchResult)
 async def match_user_to_job(
@@ -23,21 +42,15 @@ async def match_user_to_job(
     svc: MatchingService = Depends(get_matching_service),
 ):
     """Calculate semantic fit between the user's resume and a job posting."""
-    import asyncio
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
-        # Wrap in timeout to prevent hanging forever on slow AI/DB calls
-        result = await asyncio.wait_for(
-            svc.calculate_match(
+        # Timeout to prevent hanging forever on slow AI/DB calls. Runs in this
+        # task (no wait_for wrapper task) and cancels the in-flight calls on expiry.
+        async with asyncio.timeout(45.0):
+            result = await svc.calculate_match(
                 user_id=current_user["id"],
                 job_id=job_id,
-            ),
-            timeout=45.0,
-        )
-    except asyncio.TimeoutError:
+            )
+    except TimeoutError:
         logger.error(f"Match request timed out for job {job_id}")
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
@@ -68,20 +81,71 @@ async def tailor_resume(
     """
     Rewrites the user's resume bullet points to better match the job description.
     """
-    # 1. Get User Resume
-    user = await db.get_user(current_user["id"])
+    # 1 & 2. Get User Resume and Job Description (independent reads, in parallel)
+    user, job = await asyncio.gather(
+        db.get_user(current_user["id"]),
+        db.get_job(job_id),
+    )
     if not user or not user.get("resume_text"):
         raise HTTPException(status_code=400, detail="No resume found. Please upload one first.")
-
-    # 2. Get Job Description
-    job = await db.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
 
-    # 3. Call AI
+    # 3. Serve an identical (resume, JD) pair from cache
+    model = getattr(ai, "model", "")
+    key = _tailor_cache_key(user["resume_text"], job["description_raw"], model)
+    cached = _tailored_cache.get(key)
+    if cached is not None:
+        return {"tailored_resume": cached}
+
+    # 4. Call AI
     tailored_markdown = await ai.tailor_resume(
         resume_text=user["resume_text"],
         job_description=job["description_raw"]
     )
 
+    _tailored_cache[key] = tailored_markdown
+
     return {"tailored_resume": tailored_markdown}
+
+
+@router.post("/{job_id}/gap-analysis/stream")
+async def stream_gap_analysis(
+    job_id: str,
+    current_user: dict[str, Any] = Depends(get_current_user),
+    db: DatabasePort = Depends(get_db),
+    ai: AIPort = Depends(get_ai_service),
+):
+    """
+    Stream the resume-vs-job gap explanation as Server-Sent Events.
+
+    Emits `{"type": "gap_delta", "content": ...}` events as tokens arrive and a
+    final `{"type": "done"}` event, so the explanation renders while the
+    model is still writing it.
+    """
+    user, job = await asyncio.gather(
+        db.get_user(current_user["id"]),
+        db.get_job(job_id),
+    )
+    if not user or not user.get("resume_text"):
+        raise HTTPException(status_code=400, detail="No resume found. Please upload one first.")
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found.")
+
+    async def event_stream():
+        try:
+            async for delta in ai.analyze_gap_stream(
+                resume_text=user["resume_text"],
+                job_description=job.get("description_raw", ""),
+            ):
+                yield b"data: " + orjson.dumps({"type": "gap_delta", "content": delta}) + b"\n\n"
+        except Exception as e:
+            logger.error("Error streaming gap analysis for job %s: %s", job_id, e)
+            yield b"data: " + orjson.dumps({"type": "error", "content": "Gap analysis failed — please try again."}) + b"\n\n"
+        yield b"data: " + orjson.dumps({"type": "done"}) + b"\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -19,7 +19,11 @@ from app.services.user_service import UserService  # type: ignore
 router = APIRouter(prefix="/users", tags=["Users"])
 
 # Allowed resume file extensions
-_ALLOWED_EXTENSIONS = {".pdf", ".docx"}
+_ALLOWED_EXTENSIONS = frozenset({".pdf", ".docx"})
+
+# Resume upload cap, and the chunk size used while reading against it
+_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+_READ_CHUNK_BYTES = 1024 * 1024
 
 
 def _get_extension(filename: str | None) -> str:
@@ -29,16 +33,44 @@ def _get_extension(filename: str | None) -> str:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Filename is required",
         )
-    import os
-    ext = os.path.splitext(filename)[1].lower()
+    dot = filename.rfind(".")
+    ext = filename[dot:].lower() if dot >= 0 else ""
     if ext not in _ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Only {', '.join(_ALLOWED_EXTENSIONS)} files are accepted",
+            detail=f"Only {', '.join(sorted(_ALLOWED_EXTENSIONS))} files are accepted",
         )
     return ext
 
 
+async def _read_upload(file: UploadFile) -> bytes:
+    """
+    Read an upload in chunks from its spooled temp file, refusing it as soon
+    as it passes the size cap instead of buffering an oversized body first.
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds the {_MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit",
+    )
+    if file.size is not None and file.size > _MAX_UPLOAD_BYTES:
+        raise too_large
+
+    chunks: list[bytes] = []
+    size = 0
+    while chunk := await file.read(_READ_CHUNK_BYTES):
+        size += len(chunk)
+        if size > _MAX_UPLOAD_BYTES:
+            raise too_large
+        chunks.append(chunk)
+
+    if not size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Empty file uploaded",
+        )
+    return b"".join(chunks)
+
+
 @router.get("/me", response_model=UserProfile)
 async def get_my_profile(
     current_user: dict[str, Any] = Depends(get_current_user),
@@ -68,12 +100,7 @@ async def upload_resume(
 
     _get_extension(file.filename)  # validate extension
 
-    file_bytes = await file.read()
-    if not file_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Empty file uploaded",
-        )
+    file_bytes = await _read_upload(file)
 
     svc = UserService(db=db, doc_parser=doc_parser, embeddings=emb, storage=storage)
 
@@ -120,12 +147,7 @@ async def reupload_resume(
 
     _get_extension(file.filename)  # validate extension
 
-    file_bytes = await file.read()
-    if not file_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Empty file uploaded",
-        )
+    file_bytes = await _read_upload(file)
 
     svc = UserService(db=db, doc_parser=doc_parser, embeddings=emb, storage=storage)
 
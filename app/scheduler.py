@@ -1,20 +1,23 @@
 """
-Scheduler module for periodic background tasks.
-Uses APScheduler's AsyncIOScheduler.
+Ingestion entry points for the daily cron and manual triggers.
+
+The daily run is scheduled by Celery beat (see app/worker/celery_app.py) and
+executes on the ingest worker, so API processes never host a scrape.
 
 Production hardening:
-  - Supabase-backed distributed lock prevents duplicate cron runs
-    when multiple Uvicorn workers are active.
+  - A distributed lock prevents overlapping full runs (a beat tick racing
+    a manual /admin/ingest/all): a PostgreSQL advisory lock when
+    LOCK_DATABASE_URL is set, else the cron_locks RPC.
 """
 
+import asyncio
+import contextlib
+import functools
 import logging
-from datetime import datetime
-from zoneinfo import ZoneInfo
-from typing import Optional
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore
-from apscheduler.triggers.cron import CronTrigger  # type: ignore
+from collections.abc import AsyncIterator
+from typing import Any, Optional
 
+from app.config import settings  # type: ignore
 from app.dependencies import get_all_scrapers  # type: ignore
 from app.services.ingestion_service import IngestionService  # type: ignore
 from app.dependencies import (
@@ -23,74 +26,133 @@ from app.dependencies import (
     get_embedding_service, 
     get_job_service, 
     get_telegram_channel_service,
-    _get_supabase_client
+    _get_supabase_client,
 )  # type: ignore
 
 logger = logging.getLogger(__name__)
 
-# Global scheduler instance
-scheduler = AsyncIOScheduler()
+# Max scrapers running at once — each one drives its own headless browser,
+# so this bounds Playwright memory while still overlapping their network waits.
+_SCRAPER_CONCURRENCY = 3
+_scraper_sem = asyncio.Semaphore(_SCRAPER_CONCURRENCY)
+
 
-# Lock TTL in minutes — if a worker crashes mid-ingestion, the lock
-# auto-expires after this duration so another worker can pick it up.
+# TTL for the cron_locks RPC fallback: a crashed worker's lock expires after this
 _LOCK_TTL_MINUTES = 30
 
 
-async def _acquire_cron_lock(lock_name: str) -> bool:
-    """
-    Attempt to acquire a distributed lock via Supabase `cron_locks` table.
+@functools.cache
+def _lock_engine() -> Any:
+    """Engine for the advisory lock: autocommit, one unpooled connection per lock."""
+    from sqlalchemy import create_engine  # type: ignore
+    from sqlalchemy.pool import NullPool  # type: ignore
+
+    return create_engine(
+        settings.lock_database_url, poolclass=NullPool, isolation_level="AUTOCOMMIT"
+    )
 
-    Uses PostgreSQL's conflict-handling to guarantee exactly one winner:
-      - INSERT a new lock row if none exists.
-      - ON CONFLICT, UPDATE only if the existing lock has expired
-        (locked_until < NOW()).
 
-    Returns True if this worker acquired the lock, False otherwise.
+def _try_advisory_lock(lock_name: str) -> Any | None:
     """
-    client = _get_supabase_client()
+    Take a session-level advisory lock on a dedicated connection.
+
+    Returns the connection holding the lock, or None if another worker has
+    it. The lock lives as long as that connection, so a crashed worker's lock
+    is released by Postgres itself — no TTL or expiry sweep needed. The
+    connection is in autocommit mode, so it never sits idle in a transaction.
+    """
+    from sqlalchemy import text  # type: ignore
+
+    conn = _lock_engine().connect()
     try:
-        # Use raw SQL via Supabase RPC for atomic upsert with conditional update.
-        # This is the only way to atomically check locked_until < NOW() in one shot.
-        result = client.rpc("acquire_cron_lock", {
-            "p_lock_name": lock_name,
-            "p_ttl_minutes": _LOCK_TTL_MINUTES,
-        }).execute()
-
-        # The RPC returns true/false indicating whether the lock was acquired
-        acquired = result.data if result.data is not None else False
-        logger.info(
-            "Cron lock '%s': %s",
-            lock_name,
-            "ACQUIRED ✓" if acquired else "ALREADY HELD ✗",
-        )
-        return acquired
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": lock_name}
+        ).scalar()
+    except Exception:
+        conn.close()
+        raise
+    if not acquired:
+        conn.close()
+        return None
+    return conn
+
+
+def _advisory_unlock(conn: Any, lock_name: str) -> None:
+    from sqlalchemy import text  # type: ignore
+
+    try:
+        conn.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": lock_name})
+    finally:
+        conn.close()
+
+
+def _rpc_lock(lock_name: str) -> bool:
+    """TTL lock via the acquire_cron_lock RPC (used when no lock DSN is configured)."""
+    result = _get_supabase_client().rpc("acquire_cron_lock", {
+        "p_lock_name": lock_name,
+        "p_ttl_minutes": _LOCK_TTL_MINUTES,
+    }).execute()
+    return bool(result.data)
+
+
+def _rpc_unlock(lock_name: str) -> None:
+    """Release the RPC lock by setting locked_until to the past."""
+    _get_supabase_client().table("cron_locks_jobs").update({
+        "locked_until": "2000-01-01T00:00:00Z",
+    }).eq("lock_name", lock_name).execute()
+
+
+@contextlib.asynccontextmanager
+async def _cron_lock(lock_name: str) -> AsyncIterator[bool]:
+    """
+    Hold the named cron lock for the duration of the block; yields whether
+    this worker acquired it.
 
+    Uses a Postgres advisory lock when LOCK_DATABASE_URL is configured, else
+    the cron_locks RPC.
+    """
+    advisory = bool(settings.lock_database_url)
+    try:
+        if advisory:
+            conn = await asyncio.to_thread(_try_advisory_lock, lock_name)
+            acquired = conn is not None
+        else:
+            acquired = await asyncio.to_thread(_rpc_lock, lock_name)
     except Exception as exc:
-        # If the cron_locks table doesn't exist yet (migration not run),
-        # fall through and allow execution (single-worker backward compat).
-        logger.warning(
-            "Cron lock acquisition failed (table may not exist yet): %s. "
+        # Lock backend unreachable: allow execution (single-worker backward compat)
+        logger.error(
+            "Cron lock acquisition failed: %s. "
             "Proceeding without lock — safe only for single-worker deploys.",
             exc,
         )
-        return True
+        yield True
+        return
 
+    logger.info(
+        "Cron lock '%s': %s",
+        lock_name,
+        "ACQUIRED ✓" if acquired else "ALREADY HELD ✗",
+    )
+    if not acquired:
+        yield False
+        return
 
-async def _release_cron_lock(lock_name: str) -> None:
-    """Release a distributed lock by setting locked_until to the past."""
-    client = _get_supabase_client()
     try:
-        client.table("cron_locks_jobs").update({
-            "locked_until": "2000-01-01T00:00:00Z",  # Far past → effectively unlocked
-        }).eq("lock_name", lock_name).execute()
-        logger.info("Cron lock '%s' released.", lock_name)
-    except Exception as exc:
-        logger.warning("Failed to release cron lock '%s': %s", lock_name, exc)
+        yield True
+    finally:
+        try:
+            if advisory:
+                await asyncio.to_thread(_advisory_unlock, conn, lock_name)
+            else:
+                await asyncio.to_thread(_rpc_unlock, lock_name)
+            logger.info("Cron lock '%s' released.", lock_name)
+        except Exception as exc:
+            logger.warning("Failed to release cron lock '%s': %s", lock_name, exc)
 
 
 async def trigger_ingestion(scraper_name: Optional[str] = None):
     """
-    Core ingestion logic. Can be called by scheduler or manual API trigger.
+    Core ingestion logic. Can be called by the daily cron task or manual API trigger.
     Args:
         scraper_name: If provided, only run this specific scraper (case-insensitive).
                       If None or 'all', run all scrapers.
@@ -120,17 +182,34 @@ async def trigger_ingestion(scraper_name: Optional[str] = None):
     logger.info(f"Scrapers to run: {[s.COMPANY_NAME for s in scrapers]}")
 
     results = {}
-    for scraper in scrapers:
+
+    async def _run_one(scraper) -> None:
         source_name = scraper.COMPANY_NAME.lower()
-        logger.info(f"  ► Triggering scraper: {source_name}")
-        try:
-            stats = await service.ingest_jobs(scraper)
-            results[source_name] = stats
-            logger.info(f"  ✓ {source_name}: {stats}")
-        except Exception as e:
-            logger.error(f"  ✗ {source_name} failed: {e}")
-            results[source_name] = {"error": str(e)}
-            
+        async with _scraper_sem:
+            logger.info(f"  ► Triggering scraper: {source_name}")
+            try:
+                stats = await service.ingest_jobs(scraper)
+                results[source_name] = stats
+                logger.info(f"  ✓ {source_name}: {stats}")
+            except Exception as e:
+                logger.error(f"  ✗ {source_name} failed: {e}")
+                results[source_name] = {"error": str(e)}
+
+    # Imported here so crawl4ai stays a lazy import, like the scrapers themselves
+    from app.scraper.base_scraper import BaseScraper, shared_crawler  # type: ignore
+
+    # Scrapers are independent and I/O-bound: run them side by side. The
+    # crawl4ai-based ones share one browser instead of each launching Chromium.
+    async with contextlib.AsyncExitStack() as stack:
+        if any(isinstance(s, BaseScraper) for s in scrapers):
+            try:
+                await stack.enter_async_context(shared_crawler())
+            except Exception as e:
+                # Don't fail the HTTP-only scrapers with it: browser scrapers
+                # fall back to a crawler of their own (and fail individually)
+                logger.warning("Shared browser launch failed, using per-scraper crawlers: %s", e)
+        await asyncio.gather(*(_run_one(scraper) for scraper in scrapers))
+
     logger.info(f"🕒 Ingestion complete. Stats: {results}")
     return results
 
@@ -139,48 +218,14 @@ async def run_daily_ingestion():
     """
     Task wrapper for scheduled execution with distributed locking.
 
-    Only the worker that acquires the 'daily_ingestion' lock proceeds.
-    This prevents N workers from spawning N duplicate scraping runs.
+    Only the caller that acquires the 'daily_ingestion' lock proceeds, so a
+    beat tick and a manual full ingest never scrape side by side.
     """
     lock_name = "daily_ingestion"
 
-    if not await _acquire_cron_lock(lock_name):
-        logger.info("Another worker holds the ingestion lock — skipping this run.")
-        return
-
-    try:
+    # Released on exit even if ingestion fails, so the next scheduled run can proceed
+    async with _cron_lock(lock_name) as acquired:
+        if not acquired:
+            logger.info("Another worker holds the ingestion lock — skipping this run.")
+            return
         await trigger_ingestion(scraper_name="all")
-    finally:
-        # Always release the lock, even if ingestion fails,
-        # so the next scheduled run can proceed.
-        await _release_cron_lock(lock_name)
-
-
-def start_scheduler():
-    """Start the background scheduler."""
-    # Schedule ingest at 10:00 PM IST (Asia/Kolkata)
-    trigger = CronTrigger(
-        hour=22, 
-        minute=0, 
-        timezone=ZoneInfo("Asia/Kolkata")
-    )
-    
-    scheduler.add_job(
-        run_daily_ingestion, 
-        trigger, 
-        id="daily_ingestion",
-        replace_existing=True,
-    )
-    
-    scheduler.start()
-    
-    # Log next run time
-    job = scheduler.get_job("daily_ingestion")
-    if job:
-        logger.info(f"📅 Scheduler started. Next ingestion run at: {job.next_run_time}")
-
-
-def shutdown_scheduler():
-    """Stop the scheduler."""
-    scheduler.shutdown()
-    logger.info("Scheduler shut down.")
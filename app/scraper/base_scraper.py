@@ -13,6 +13,8 @@ from app.scraper.scraper_port import ScraperPort
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -23,6 +25,21 @@ from app.scraper.experience_filter import is_entry_level
 
 logger = logging.getLogger(__name__)
 
+# Browser shared by every crawl4ai scraper in one ingestion run. Set by
+# shared_crawler(); scrapers run outside it open their own.
+_shared_crawler: ContextVar[AsyncWebCrawler | None] = ContextVar("shared_crawler", default=None)
+
+
+@asynccontextmanager
+async def shared_crawler():
+    """Launch one browser for the enclosed block and let BaseScraper subclasses reuse it."""
+    async with AsyncWebCrawler(verbose=False) as crawler:
+        token = _shared_crawler.set(crawler)
+        try:
+            yield crawler
+        finally:
+            _shared_crawler.reset(token)
+
 
 class BaseScraper(ScraperPort):
     """
@@ -33,29 +50,39 @@ class BaseScraper(ScraperPort):
     COMPANY_NAME: str = ""
     CAREER_PAGE_URL: str = ""
 
+    @asynccontextmanager
+    async def _crawler(self):
+        """The run's shared crawler if there is one, else a private one for this call."""
+        crawler = _shared_crawler.get()
+        if crawler is not None:
+            yield crawler
+            return
+        async with AsyncWebCrawler(verbose=False) as own:
+            yield own
+
     async def fetch_jobs(self) -> list[dict[str, Any]]:
         """
         Fetches jobs from the career page, parses them, and filters for entry-level.
         """
-        logger.info(f"🕸️ Scraping {self.COMPANY_NAME} from {self.CAREER_PAGE_URL}...")
+        logger.info("🕸️ Scraping %s from %s...", self.COMPANY_NAME, self.CAREER_PAGE_URL)
         
         try:
-            # crawl4ai async context manager handles browser life-cycle
-            async with AsyncWebCrawler(verbose=True) as crawler:
+            # Reuses the ingestion run's browser when one is open
+            async with self._crawler() as crawler:
                 result = await crawler.arun(
                     url=self.CAREER_PAGE_URL,
                 )
                 
                 if not result.html:
-                    logger.warning(f"⚠️ No HTML returned for {self.COMPANY_NAME}")
+                    logger.warning("⚠️ No HTML returned for %s", self.COMPANY_NAME)
                     return []
 
                 # Parse HTML
-                soup = BeautifulSoup(result.html, "html.parser")
+                soup = BeautifulSoup(result.html, "lxml")
                 
                 # Extract raw job cards (implemented by subclasses)
                 raw_jobs = self.parse_jobs(soup)
-                logger.info(f"  ↳ Found {len(raw_jobs)} raw jobs for {self.COMPANY_NAME}")
+                logger.info("  ↳ Found %d raw jobs for %s", len(raw_jobs), self.COMPANY_NAME)
 
                 # Filter and normalize
                 valid_jobs = []
@@ -75,11 +102,11 @@ class BaseScraper(ScraperPort):
                         }
                         valid_jobs.append(normalized)
 
-                logger.info(f"  ✅ Filtered to {len(valid_jobs)} entry-level jobs")
+                logger.info("  ✅ Filtered to %d entry-level jobs", len(valid_jobs))
                 return valid_jobs
 
         except Exception as e:
-            logger.error(f"❌ Failed to scrape {self.COMPANY_NAME}: {e}")
+            logger.error("❌ Failed to scrape %s: %s", self.COMPANY_NAME, e)
             return []
 
     def parse_jobs(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
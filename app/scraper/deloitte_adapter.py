@@ -1,5 +1,8 @@
+import asyncio
 import logging
+import re
 from typing import Any
+import soupsieve  # type: ignore
 from bs4 import BeautifulSoup  # type: ignore
 from crawl4ai import AsyncWebCrawler  # type: ignore
 from app.scraper.base_scraper import BaseScraper  # type: ignore
@@ -7,6 +10,12 @@ from app.scraper.experience_filter import is_entry_level  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Detail pages fetched per run, and how many are in flight at once
+DETAIL_FETCH_LIMIT = 7
+DETAIL_FETCH_CONCURRENCY = 5
+
+_FALLBACK_DESCRIPTION = "Posted: Check official site."
+
 class DeloitteAdapter(BaseScraper):
     """Scrapes jobs from Deloitte's career page."""
 
@@ -16,111 +25,127 @@ class DeloitteAdapter(BaseScraper):
         "/?listFilterMode=1&jobRecordsPerPage=100&sort=relevancy"
     )
 
+    # CSS selectors compiled once instead of per select() call
+    # Search results page
+    _SEL_CARD = soupsieve.compile("article.article--result")
+    _SEL_CARD_TITLE = soupsieve.compile("h3.article__header__text__title a.link")
+    _SEL_CARD_SUBTITLE = soupsieve.compile(".article__header__text__subtitle")
+    _SEL_SPAN = soupsieve.compile("span")
+    # Detail page (Avature): rich-text parts, then older layouts, then the raw section
+    _SEL_RICH_TEXT = soupsieve.compile("div.article__view__item.view--rich-text span.field-value")
+    _SEL_DESC_FALLBACKS = tuple(
+        soupsieve.compile(sel)
+        for sel in (".job-description", ".article__content", ".cats-job-description", "article.article--details")
+    )
+    _SEL_MAIN_SECTION = soupsieve.compile("section.section")
+
+    # Job ID = last non-empty path segment of the detail URL (query string ignored)
+    _ID_RE = re.compile(r"/([^/?]+)/?(?:\?|$)")
+
     async def fetch_jobs(self) -> list[dict[str, Any]]:
         """Fetches jobs + details using crawl4ai."""
-        logger.info(f"🕸️ Scraping {self.COMPANY_NAME} from {self.CAREER_PAGE_URL}...")
+        logger.info("🕸️ Scraping %s from %s...", self.COMPANY_NAME, self.CAREER_PAGE_URL)
         
         try:
-            async with AsyncWebCrawler(verbose=True) as crawler:
+            async with self._crawler() as crawler:
                 # 1. Fetch Search Page
                 result = await crawler.arun(url=self.CAREER_PAGE_URL)
                 if not result.html:
                     return []
 
-                soup = BeautifulSoup(result.html, "html.parser")
+                soup = BeautifulSoup(result.html, "lxml")
                 raw_jobs = self.parse_jobs(soup)
-                logger.info(f"  ↳ Found {len(raw_jobs)} raw jobs (fetching details for top 15)")
+                logger.info("  ↳ Found %d raw jobs (fetching details for top %d)", len(raw_jobs), DETAIL_FETCH_LIMIT)
+
+                # Check entry level logic (borrowed from base scraper)
+                # We do it early to save detail fetch time
+                # But parse_jobs returns dict with 'experience_text' empty
+                # So we check title.
+                candidates = [job for job in raw_jobs if is_entry_level(job["title"], "")]
+                candidates = candidates[:DETAIL_FETCH_LIMIT]
+
+                # 2. Fetch Detail Pages concurrently (bounded)
+                sem = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+                results = await asyncio.gather(
+                    *(self._fetch_detail(crawler, job, sem) for job in candidates),
+                    return_exceptions=True,
+                )
 
                 valid_jobs = []
-                count = 0
-                
-                for job in raw_jobs:
-                    if count >= 7:
-                        break
-
-                    # Check entry level logic (borrowed from base scraper)
-                    # We do it early to save detail fetch time
-                    # But parse_jobs returns dict with 'experience_text' empty
-                    # So we check title.
-                    if not is_entry_level(job["title"], ""):
+                for job, res in zip(candidates, results):
+                    if isinstance(res, BaseException):
+                        logger.warning("    Failed to build job %s: %s", job['title'], res)
                         continue
+                    valid_jobs.append(res)
 
-                    # 2. Fetch Detail Page
-                    job_url = job["external_apply_url"]
-                    try:
-                        # logger.info(f"    Fetching details: {job['title'][:30]}")
-                        detail_res = await crawler.arun(url=job_url)
-                        
-                        if detail_res.html:
-                            d_soup = BeautifulSoup(detail_res.html, "html.parser")
-                            # Deloitte Careers (Avature) - Multiple possible structures
-                            # 1. Main detailed article content
-                            # The structure often has multiple 'view--rich-text' items containing parts of the description
-                            rich_text_items = d_soup.select("div.article__view__item.view--rich-text span.field-value")
-                            
-                            if rich_text_items:
-                                # Join all rich text parts (Summary, Responsibilities, Qualifications usually separated)
-                                html_parts = [str(item) for item in rich_text_items]
-                                job["description_raw"] = "<br/><hr/><br/>".join(html_parts)
-                            else:
-                                # Fallback old selectors
-                                desc_tag = (d_soup.select_one(".job-description") 
-                                            or d_soup.select_one(".article__content")
-                                            or d_soup.select_one(".cats-job-description")
-                                            or d_soup.select_one("article.article--details"))
-
-                                if desc_tag:
-                                    job["description_raw"] = str(desc_tag)
-                                else:
-                                    logger.warning(f"   ⚠️ Desc selectors failed for {job['title']}")
-                                    # Last resort: text dump of main section
-                                    main_section = d_soup.select_one("section.section")
-                                    if main_section:
-                                         job["description_raw"] = "RAW_SECTION: " + str(main_section)
-                                    else:
-                                        job["description_raw"] = "Posted: Check official site."
-                        else:
-                            job["description_raw"] = "Posted: Check official site."
-
-                    except Exception as e:
-                        logger.warning(f"    Failed detail fetch for {job['title']}: {e}")
-                        job["description_raw"] = "Posted: Check official site."
-
-                    # Standardize keys
-                    # parse_jobs returned partial structure, we assume BaseScraper normalization needed?
-                    # No, BaseScraper logic was: fetch -> parse -> filter -> normalize.
-                    # Here we do it all.
-                    
-                    normalized = {
-                        "external_id": job["external_id"],
-                        "title": job["title"],
-                        "company_name": self.COMPANY_NAME,
-                        "external_apply_url": job["external_apply_url"],
-                        "description_raw": job["description_raw"],
-                        "skills_required": [],
-                        "location": job["location"],
-                        "salary_range": None,
-                    }
-                    
-                    valid_jobs.append(normalized)
-                    count += 1
-
-                logger.info(f"  ✅ Deloitte: Total {len(valid_jobs)} enriched-ready jobs")
+                logger.info("  ✅ Deloitte: Total %d enriched-ready jobs", len(valid_jobs))
                 return valid_jobs
 
         except Exception as e:
-            logger.error(f"❌ Failed to scrape {self.COMPANY_NAME}: {e}")
+            logger.error("❌ Failed to scrape %s: %s", self.COMPANY_NAME, e)
             return []
             
         return []
 
+    async def _fetch_detail(
+        self, crawler: AsyncWebCrawler, job: dict[str, Any], sem: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """Fetch one detail page and return the normalized job dict."""
+        try:
+            async with sem:
+                detail_res = await crawler.arun(url=job["external_apply_url"])
+            description = (
+                self._extract_description(detail_res.html, job["title"])
+                if detail_res.html
+                else _FALLBACK_DESCRIPTION
+            )
+        except Exception as e:
+            logger.warning("    Failed detail fetch for %s: %s", job['title'], e)
+            description = _FALLBACK_DESCRIPTION
+
+        return {
+            "external_id": job["external_id"],
+            "title": job["title"],
+            "company_name": self.COMPANY_NAME,
+            "external_apply_url": job["external_apply_url"],
+            "description_raw": description,
+            "skills_required": [],
+            "location": job["location"],
+            "salary_range": None,
+        }
+
+    @classmethod
+    def _extract_description(cls, html: str, title: str) -> str:
+        d_soup = BeautifulSoup(html, "lxml")
+        # Deloitte Careers (Avature) - Multiple possible structures
+        # 1. Main detailed article content
+        # The structure often has multiple 'view--rich-text' items containing parts of the description
+        rich_text_items = cls._SEL_RICH_TEXT.select(d_soup)
+
+        if rich_text_items:
+            # Join all rich text parts (Summary, Responsibilities, Qualifications usually separated)
+            return "<br/><hr/><br/>".join(str(item) for item in rich_text_items)
+
+        # Fallback old selectors
+        for sel in cls._SEL_DESC_FALLBACKS:
+            desc_tag = sel.select_one(d_soup)
+            if desc_tag:
+                return str(desc_tag)
+
+        logger.warning("   ⚠️ Desc selectors failed for %s", title)
+        # Last resort: text dump of main section
+        main_section = cls._SEL_MAIN_SECTION.select_one(d_soup)
+        if main_section:
+            return "RAW_SECTION: " + str(main_section)
+        return _FALLBACK_DESCRIPTION
+
     def parse_jobs(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
         results = []
-        cards = soup.select("article.article--result")
+        cards = self._SEL_CARD.select(soup)
         
         for card in cards:
             try:
-                title_tag = card.select_one("h3.article__header__text__title a.link")
+                title_tag = self._SEL_CARD_TITLE.select_one(card)
                 if not title_tag:
                     continue
 
@@ -132,15 +157,13 @@ class DeloitteAdapter(BaseScraper):
                 full_url = relative_url if relative_url.startswith("http") else f"https://apply.deloitte.com{relative_url}"
 
                 # Extract ID
-                parts = full_url.split("/")
-                external_id = parts[-1].split("?")[0]
-                if not external_id or len(external_id) < 3:
-                     external_id = parts[-2].split("?")[0] if len(parts) > 1 else "unknown"
+                m = self._ID_RE.search(full_url)
+                external_id = m.group(1) if m else "unknown"
 
                 location = "India"
-                subtitle = card.select_one(".article__header__text__subtitle")
+                subtitle = self._SEL_CARD_SUBTITLE.select_one(card)
                 if subtitle:
-                    spans = subtitle.select("span")
+                    spans = self._SEL_SPAN.select(subtitle)
                     if spans and len(spans) > 0:
                         location = spans[-1].get_text(strip=True)
 
@@ -4,6 +4,7 @@ Filters jobs to include only fresher / 0-2 years experience roles.
 """
 
 import re
+from functools import lru_cache
 
 # Keywords that strongly indicate an entry-level role
 ENTRY_LEVEL_KEYWORDS = {
@@ -33,22 +34,33 @@ SENIOR_KEYWORDS = {
 }
 
 
+# Keyword sets folded into single case-insensitive alternations (same
+# substring semantics as `kw in title.lower()`), plus the experience-text
+# patterns, compiled once.
+_SENIOR_RE = re.compile("|".join(map(re.escape, sorted(SENIOR_KEYWORDS))), re.I)
+_ENTRY_RE = re.compile("|".join(map(re.escape, sorted(ENTRY_LEVEL_KEYWORDS))), re.I)
+_ZERO_TO_TWO_YEARS_RE = re.compile(r'\b0\s*[-–]\s*[0-2]\s*years?\b', re.I)
+_ONE_YEAR_RE = re.compile(r'\b1\s*[-–]?\s*[1-2]?\s*years?\b', re.I)
+_FRESHER_RE = re.compile(r'\bfresher|entry.?level\b', re.I)
+
+
+# Titles repeat heavily across cards and runs ("Analyst", "Consultant"),
+# so classifications are memoized on the (title, experience_text) pair.
+@lru_cache(maxsize=8192)
 def is_entry_level(title: str, experience_text: str = "") -> bool:
     """
     Returns True if the job is likley for a fresher or 0-2 years experience.
     Rejects senior roles based on title keywords.
     Accepts roles with 0-2 years experience mentioned or entry-level keywords.
     """
-    title_lower = title.lower()
-
     # 1. Reject if title contains senior keywords
     # Exception: "Senior Analyst" might be okay in some contexts, but usually >2 yrs.
     # For now, we'll be strict to avoid noise.
-    if any(kw in title_lower for kw in SENIOR_KEYWORDS):
+    if _SENIOR_RE.search(title):
         return False
 
     # 2. Accept if title contains entry-level keywords
-    if any(kw in title_lower for kw in ENTRY_LEVEL_KEYWORDS):
+    if _ENTRY_RE.search(title):
         return True
 
     # 3. Check experience text for 0-2 year range using regex
@@ -56,15 +68,15 @@ def is_entry_level(title: str, experience_text: str = "") -> bool:
     # Does NOT match: "3-5 years", "5+ years"
     
     # "0-X years" where X is 0, 1, or 2
-    if re.search(r'\b0\s*[-–]\s*[0-2]\s*years?\b', experience_text, re.I):
+    if _ZERO_TO_TWO_YEARS_RE.search(experience_text):
         return True
     
     # "1 year", "1-2 years"
-    if re.search(r'\b1\s*[-–]?\s*[1-2]?\s*years?\b', experience_text, re.I):
+    if _ONE_YEAR_RE.search(experience_text):
         return True
         
     # "Fresher" or "Entry Level" explicitly mentioned
-    if re.search(r'\bfresher|entry.?level\b', experience_text, re.I):
+    if _FRESHER_RE.search(experience_text):
         return True
 
     # Default to True to allow all jobs for now (User request: "display them")
@@ -1,13 +1,28 @@
+import asyncio
 import logging
 import re
 from typing import Any
 from bs4 import BeautifulSoup
-from crawl4ai import AsyncWebCrawler
+from crawl4ai import AsyncWebCrawler  # type: ignore
 from app.scraper.base_scraper import BaseScraper
 from app.scraper.experience_filter import is_entry_level
 
 logger = logging.getLogger(__name__)
 
+# Detail pages fetched per run, and how many are in flight at once
+DETAIL_FETCH_LIMIT = 7
+DETAIL_FETCH_CONCURRENCY = 5
+
+_FALLBACK_DESCRIPTION = "Posted: Check official site."
+
+# (lowercased needle, display name), checked in order: the first listed city
+# found anywhere in the card text wins
+_CITIES: tuple[tuple[str, str], ...] = tuple(
+    (city.lower(), city)
+    for city in ("Bangalore", "Bengaluru", "Mumbai", "Delhi", "Gurgaon", "Gurugram",
+                 "Hyderabad", "Chennai", "Kolkata", "Pune", "Noida", "Kochi", "Ahmedabad")
+)
+
 
 class EYAdapter(BaseScraper):
     """Scrapes jobs from EY's career page (PhenomPeople platform)."""
@@ -16,92 +31,106 @@ class EYAdapter(BaseScraper):
     # EY global search filtered for India
     CAREER_PAGE_URL = "https://careers.ey.com/ey/search/?createNewAlert=false&q=&locationsearch=India&optionsFacetsDD_country=IN"
 
+    # EY job detail links: /ey/job/<slug>/<id>
+    # or full URLs like https://careers.ey.com/ey/job/<slug>/<id>
+    _JOB_LINK_RE = re.compile(r'/ey/job/([^/]+)/(\d+)')
+
     async def fetch_jobs(self) -> list[dict[str, Any]]:
         """Fetches jobs + details using crawl4ai."""
-        logger.info(f"🕸️ Scraping {self.COMPANY_NAME} from {self.CAREER_PAGE_URL}...")
+        logger.info("🕸️ Scraping %s from %s...", self.COMPANY_NAME, self.CAREER_PAGE_URL)
         
         try:
-            async with AsyncWebCrawler(verbose=True) as crawler:
+            async with self._crawler() as crawler:
                 # 1. Fetch Search Page
                 result = await crawler.arun(url=self.CAREER_PAGE_URL)
                 if not result.html:
                     return []
 
-                soup = BeautifulSoup(result.html, "html.parser")
+                soup = BeautifulSoup(result.html, "lxml")
                 raw_jobs = self.parse_jobs(soup)
-                logger.info(f"  ↳ Found {len(raw_jobs)} raw jobs (fetching details for top 15)")
+                logger.info("  ↳ Found %d raw jobs (fetching details for top %d)", len(raw_jobs), DETAIL_FETCH_LIMIT)
 
-                valid_jobs = []
-                count = 0
-                
-                for job in raw_jobs:
-                    if count >= 7:
-                        break
+                candidates = [job for job in raw_jobs if is_entry_level(job["title"], "")]
+                candidates = candidates[:DETAIL_FETCH_LIMIT]
+
+                # 2. Fetch Detail Pages concurrently (bounded)
+                sem = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+                results = await asyncio.gather(
+                    *(self._fetch_detail(crawler, job, sem) for job in candidates),
+                    return_exceptions=True,
+                )
 
-                    # Check entry level logic (title-based)
-                    if not is_entry_level(job["title"], ""):
+                valid_jobs = []
+                for job, res in zip(candidates, results):
+                    if isinstance(res, BaseException):
+                        logger.warning("    Failed to build job %s: %s", job['title'], res)
                         continue
+                    valid_jobs.append(res)
 
-                    # 2. Fetch Detail Page
-                    job_url = job["external_apply_url"]
-                    try:
-                        # logger.info(f"    Fetching details: {job['title'][:30]}")
-                        # Wait for the description container to appear
-                        detail_res = await crawler.arun(url=job_url, wait_for="css:span[itemprop='description']")
-                        
-                        if detail_res.html:
-                            d_soup = BeautifulSoup(detail_res.html, "html.parser")
-                            # Selectors for PhenomPeople
-                            # 1. High precision: Semantic schema tag
-                            desc_tag = d_soup.select_one("span[itemprop='description']")
-                            
-                            # 2. Fallbacks
-                            if not desc_tag:
-                                 desc_tag = (d_soup.select_one(".job-description") 
-                                            or d_soup.select_one(".job-details-content")
-                                            or d_soup.select_one(".description")
-                                            or d_soup.select_one("#job-description")
-                                            or d_soup.select_one("div.job-overview"))
-
-                            if desc_tag:
-                                # Clean junk
-                                for tag in desc_tag(["script", "style", "iframe", "noscript"]):
-                                    tag.decompose()
-                                job["description_raw"] = str(desc_tag)
-                            else:
-                                logger.warning(f"   ⚠️ Desc selectors failed for {job['title']}. USING RAW BODY TEXT.")
-                                # Fallback: Get full text, remove huge empty spaces
-                                raw_text = d_soup.body.get_text(separator="\n", strip=True)
-                                # Limit to first 5000 chars to avoid token limits, but keep enough
-                                job["description_raw"] = "RAW_DUMP: " + raw_text[:5000]
-                        else:
-                            job["description_raw"] = "Posted: Check official site."
-
-                    except Exception as e:
-                        logger.warning(f"    Failed detail fetch for {job['title']}: {e}")
-                        job["description_raw"] = "Posted: Check official site."
-
-                    normalized = {
-                        "external_id": job["external_id"],
-                        "title": job["title"],
-                        "company_name": self.COMPANY_NAME,
-                        "external_apply_url": job["external_apply_url"],
-                        "description_raw": job["description_raw"],
-                        "skills_required": [],
-                        "location": job["location"],
-                        "salary_range": None,
-                    }
-                    
-                    valid_jobs.append(normalized)
-                    count += 1
-
-                logger.info(f"  ✅ EY: Total {len(valid_jobs)} enriched-ready jobs")
+                logger.info("  ✅ EY: Total %d enriched-ready jobs", len(valid_jobs))
                 return valid_jobs
 
         except Exception as e:
-            logger.error(f"❌ Failed to scrape {self.COMPANY_NAME}: {e}")
+            logger.error("❌ Failed to scrape %s: %s", self.COMPANY_NAME, e)
             return []
 
+    async def _fetch_detail(
+        self, crawler: AsyncWebCrawler, job: dict[str, Any], sem: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """Fetch one detail page and return the normalized job dict."""
+        try:
+            async with sem:
+                # Wait for the description container to appear
+                detail_res = await crawler.arun(
+                    url=job["external_apply_url"], wait_for="css:span[itemprop='description']"
+                )
+            description = (
+                self._extract_description(detail_res.html, job["title"])
+                if detail_res.html
+                else _FALLBACK_DESCRIPTION
+            )
+        except Exception as e:
+            logger.warning("    Failed detail fetch for %s: %s", job['title'], e)
+            description = _FALLBACK_DESCRIPTION
+
+        return {
+            "external_id": job["external_id"],
+            "title": job["title"],
+            "company_name": self.COMPANY_NAME,
+            "external_apply_url": job["external_apply_url"],
+            "description_raw": description,
+            "skills_required": [],
+            "location": job["location"],
+            "salary_range": None,
+        }
+
+    @staticmethod
+    def _extract_description(html: str, title: str) -> str:
+        d_soup = BeautifulSoup(html, "lxml")
+        # Selectors for PhenomPeople
+        # 1. High precision: Semantic schema tag
+        desc_tag = d_soup.select_one("span[itemprop='description']")
+
+        # 2. Fallbacks
+        if not desc_tag:
+            desc_tag = (d_soup.select_one(".job-description")
+                        or d_soup.select_one(".job-details-content")
+                        or d_soup.select_one(".description")
+                        or d_soup.select_one("#job-description")
+                        or d_soup.select_one("div.job-overview"))
+
+        if desc_tag:
+            # Clean junk
+            for tag in desc_tag(["script", "style", "iframe", "noscript"]):
+                tag.decompose()
+            return str(desc_tag)
+
+        logger.warning("   ⚠️ Desc selectors failed for %s. USING RAW BODY TEXT.", title)
+        # Fallback: Get full text, remove huge empty spaces
+        raw_text = d_soup.body.get_text(separator="\n", strip=True)
+        # Limit to first 5000 chars to avoid token limits, but keep enough
+        return "RAW_DUMP: " + raw_text[:5000]
+
     def parse_jobs(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
         """
         EY uses PhenomPeople platform. Job links follow the pattern:
@@ -110,19 +139,15 @@ class EYAdapter(BaseScraper):
         results = []
         seen_ids = set()
 
-        # Find all links that match EY job URL pattern
-        all_links = soup.find_all("a", href=True)
+        # Only links that match the EY job URL pattern (filtered inside
+        # find_all, so nav/footer anchors are never handed back)
+        job_links = soup.find_all("a", href=self._JOB_LINK_RE)
 
-        for a in all_links:
-            href = a.get("href", "")
+        for a in job_links:
+            href = a["href"]
             text = a.get_text(strip=True)
 
-            # Match EY job detail links: /ey/job/<slug>/<id>
-            # or full URLs like https://careers.ey.com/ey/job/<slug>/<id>
-            match = re.search(r'/ey/job/([^/]+)/(\d+)', href)
-            if not match:
-                continue
-
+            match = self._JOB_LINK_RE.search(href)
             slug = match.group(1)
             job_id = match.group(2)
 
@@ -144,10 +169,9 @@ class EYAdapter(BaseScraper):
             location = "India"  # Default since we filter for India
             parent = a.parent
             if parent:
-                parent_text = parent.get_text(" ", strip=True)
-                for city in ["Bangalore", "Bengaluru", "Mumbai", "Delhi", "Gurgaon", "Gurugram",
-                             "Hyderabad", "Chennai", "Kolkata", "Pune", "Noida", "Kochi", "Ahmedabad"]:
-                    if city.lower() in parent_text.lower():
+                parent_text = parent.get_text(" ", strip=True).lower()
+                for needle, city in _CITIES:
+                    if needle in parent_text:
                         location = f"{city}, India"
                         break
 
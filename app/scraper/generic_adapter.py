@@ -146,7 +146,7 @@ class GenericAdapter(ScraperPort):
                     detail_html = await detail_page.content()
                     await detail_page.close()
 
-                    d_soup = BeautifulSoup(detail_html, "html.parser")
+                    d_soup = BeautifulSoup(detail_html, "lxml")
                     raw_text = d_soup.body.get_text(separator="\n", strip=True) if d_soup.body else ""
 
                     # Content check
@@ -202,7 +202,7 @@ class GenericAdapter(ScraperPort):
             html = await page.content()
             await page.close()
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
 
             # Method A: Extract from JSON-LD structured data (schema.org JobPosting)
             for script in soup.find_all("script", type="application/ld+json"):
@@ -1,12 +1,16 @@
 """PwC career page scraper (Workday JSON API)."""
+import asyncio
 import logging
-import requests
+import httpx  # type: ignore
 from typing import Any
 from app.scraper.scraper_port import ScraperPort
 from app.scraper.experience_filter import is_entry_level
 
 logger = logging.getLogger(__name__)
 
+# Detail requests in flight at once against the Workday host
+DETAIL_FETCH_CONCURRENCY = 5
+
 
 class PwCAdapter(ScraperPort):
     """Scrapes jobs from PwC via Workday JSON API (no browser needed)."""
@@ -18,7 +22,7 @@ class PwCAdapter(ScraperPort):
 
     async def fetch_jobs(self) -> list[dict[str, Any]]:
         """Fetches jobs directly from the Workday API — no Playwright needed."""
-        logger.info(f"🕸️ Fetching {self.COMPANY_NAME} jobs from Workday API...")
+        logger.info("🕸️ Fetching %s jobs from Workday API...", self.COMPANY_NAME)
 
         headers = {
             "Content-Type": "application/json",
@@ -32,92 +36,110 @@ class PwCAdapter(ScraperPort):
         try:
             # Fetch up to 100 jobs (5 pages) but stop after 15 enriched entry-level jobs for speed
             desired_count = 7
+            sem = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+
+            # One pooled HTTP/2 client per run: list and detail requests share a
+            # multiplexed keep-alive connection (one TLS handshake per run), and
+            # nothing outlives the event loop that created it.
+            async with httpx.AsyncClient(
+                headers=headers,
+                http2=True,
+                limits=httpx.Limits(max_connections=DETAIL_FETCH_CONCURRENCY),
+                timeout=15,
+            ) as client:
+                for page in range(5):
+                    if len(all_jobs) >= desired_count:
+                        break
 
-            for page in range(5):
-                if len(all_jobs) >= desired_count:
-                    break
-
-                payload = {
-                    "appliedFacets": {},
-                    "limit": limit,
-                    "offset": offset,
-                    "searchText": "",
-                }
-
-                resp = requests.post(self.API_URL, json=payload, headers=headers, timeout=15)
-                if resp.status_code != 200:
-                    logger.warning(f"⚠️ PwC API returned {resp.status_code}")
-                    break
+                    payload = {
+                        "appliedFacets": {},
+                        "limit": limit,
+                        "offset": offset,
+                        "searchText": "",
+                    }
 
-                data = resp.json()
-                job_postings = data.get("jobPostings", [])
+                    resp = await client.post(self.API_URL, json=payload)
+                    if resp.status_code != 200:
+                        logger.warning("⚠️ PwC API returned %s", resp.status_code)
+                        break
 
-                if not job_postings:
-                    break
+                    data = resp.json()
+                    job_postings = data.get("jobPostings", [])
 
-                for job in job_postings:
-                    if len(all_jobs) >= desired_count:
+                    if not job_postings:
                         break
 
-                    title = job.get("title", "")
-                    ext_path = job.get("externalPath", "")
-                    location = job.get("locationsText", "India")
-                    posted = job.get("postedOn", "")
-                    bullet_fields = job.get("bulletFields", [])
-
-                    # ID for detail fetch: "job/..." -> "job/..." (slug)
-                    slug = ext_path.split("/")[-1] if ext_path else "" 
-                    if not slug:
-                        continue
-
-                    job_req_id = job.get("bulletFields", [""])[0] # Often the first bullet is the ID e.g. "366367WD"
-
-                    full_url = f"{self.BASE_URL}{ext_path}"
-                    external_id = slug
-
-                    # Check entry level
-                    experience_text = " ".join(bullet_fields) if bullet_fields else ""
-                    if not is_entry_level(title, experience_text):
-                         continue
-
-                    # --- Fetch Full Description ---
-                    # Detail API: https://pwc.wd3.myworkdayjobs.com/wday/cxs/pwc/Global_Experienced_Careers/job/{slug}
-                    detail_url = f"https://pwc.wd3.myworkdayjobs.com/wday/cxs/pwc/Global_Experienced_Careers/job/{slug}"
-                    
-                    try:
-                        desc_resp = requests.get(detail_url, headers=headers, timeout=10)
-                        if desc_resp.status_code == 200:
-                            desc_data = desc_resp.json()
-                            description = desc_data.get("jobPostingInfo", {}).get("jobDescription", "")
-                            # If we got a real description, use it (it's HTML, but AI handles HTML fine)
-                            # If empty, fallback to summary
-                            description_raw = description if description else f"Posted: {posted}. {' | '.join(bullet_fields)}"
-                        else:
-                             description_raw = f"Posted: {posted}. {' | '.join(bullet_fields)}"
-                    except Exception:
-                        description_raw = f"Posted: {posted}. {' | '.join(bullet_fields)}"
-
-                    all_jobs.append({
-                        "external_id": external_id,
-                        "title": self._clean_title(title),
-                        "company_name": self.COMPANY_NAME,
-                        "external_apply_url": full_url,
-                        "description_raw": description_raw,
-                        "skills_required": [],
-                        "location": location,
-                        "salary_range": None,
-                    })
-
-                offset += limit
-                logger.info(f"  ↳ Page {page+1}: fetched {len(job_postings)} postings, {len(all_jobs)} entry-level so far")
-
-            logger.info(f"  ✅ PwC: Total {len(all_jobs)} entry-level jobs with full details")
+                    candidates: list[dict[str, Any]] = []
+                    for job in job_postings:
+                        if len(all_jobs) + len(candidates) >= desired_count:
+                            break
+
+                        title = job.get("title", "")
+                        ext_path = job.get("externalPath", "")
+                        bullet_fields = job.get("bulletFields", [])
+
+                        # ID for detail fetch: "job/..." -> "job/..." (slug)
+                        slug = ext_path.split("/")[-1] if ext_path else ""
+                        if not slug:
+                            continue
+
+                        # Check entry level
+                        experience_text = " ".join(bullet_fields) if bullet_fields else ""
+                        if not is_entry_level(title, experience_text):
+                             continue
+
+                        candidates.append(job)
+
+                    # --- Fetch Full Descriptions concurrently (bounded) ---
+                    descriptions = await asyncio.gather(
+                        *(self._fetch_description(client, job, sem) for job in candidates)
+                    )
+
+                    for job, description_raw in zip(candidates, descriptions):
+                        ext_path = job["externalPath"]
+                        all_jobs.append({
+                            "external_id": ext_path.split("/")[-1],
+                            "title": self._clean_title(job["title"]),
+                            "company_name": self.COMPANY_NAME,
+                            "external_apply_url": f"{self.BASE_URL}{ext_path}",
+                            "description_raw": description_raw,
+                            "skills_required": [],
+                            "location": job.get("locationsText", "India"),
+                            "salary_range": None,
+                        })
+
+                    offset += limit
+                    logger.info("  ↳ Page %d: fetched %d postings, %d entry-level so far", page + 1, len(job_postings), len(all_jobs))
+
+            logger.info("  ✅ PwC: Total %d entry-level jobs with full details", len(all_jobs))
             return all_jobs
 
         except Exception as e:
-            logger.error(f"❌ Failed to fetch PwC jobs: {e}")
+            logger.error("❌ Failed to fetch PwC jobs: %s", e)
             return []
 
+    async def _fetch_description(
+        self, client: httpx.AsyncClient, job: dict[str, Any], sem: asyncio.Semaphore
+    ) -> str:
+        """Fetch one posting's full description, falling back to the list summary."""
+        slug = job["externalPath"].split("/")[-1]
+        fallback = f"Posted: {job.get('postedOn', '')}. {' | '.join(job.get('bulletFields', []))}"
+
+        # Detail API: https://pwc.wd3.myworkdayjobs.com/wday/cxs/pwc/Global_Experienced_Careers/job/{slug}
+        detail_url = f"https://pwc.wd3.myworkdayjobs.com/wday/cxs/pwc/Global_Experienced_Careers/job/{slug}"
+
+        try:
+            async with sem:
+                desc_resp = await client.get(detail_url, timeout=10)
+            if desc_resp.status_code != 200:
+                return fallback
+            description = desc_resp.json().get("jobPostingInfo", {}).get("jobDescription", "")
+            # If we got a real description, use it (it's HTML, but AI handles HTML fine)
+            # If empty, fallback to summary
+            return description if description else fallback
+        except Exception:
+            return fallback
+
     @staticmethod
     def _clean_title(raw: str) -> str:
         """
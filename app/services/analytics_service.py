@@ -1,24 +1,114 @@
 from datetime import datetime, timedelta
 from typing import Any, List
 from collections import Counter
+from functools import lru_cache
 import re
 
 from app.ports.database_port import DatabasePort
 
+_SALARY_NUM_RE = re.compile(r'(\d+)')
+_PAREN_RE = re.compile(r'\(.*?\)')
+
+# Title → role group, first matching rule wins (substring match on the
+# lowercased title with parenthesised parts removed)
+_TITLE_RULES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (('manager',), 'Manager'),
+    (('director',), 'Director'),
+    (('intern',), 'Intern'),
+    # Tech roles
+    (('full stack', 'full-stack'), 'Full Stack Developer'),
+    (('backend', 'back end'), 'Backend Engineer'),
+    (('frontend', 'front end'), 'Frontend Engineer'),
+    (('data scientist',), 'Data Scientist'),
+    (('data engineer',), 'Data Engineer'),
+    (('devops', 'sre'), 'DevOps / SRE'),
+    (('product',), 'Product Manager'),
+    (('sales',), 'Sales'),
+)
+
+# Lowercased title → experience bucket, first matching rule wins
+_EXPERIENCE_RULES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (('senior', 'sr.', 'lead', 'principal'), 'Senior/Lead'),
+    (('junior', 'jr.', 'entry', 'graduate'), 'Junior/Entry'),
+    (('mid', 'intermediate'), 'Mid-Level'),
+    (('intern',), 'Internship'),
+)
+
+
+@lru_cache(maxsize=4096)
+def _role_group(title: str) -> str:
+    t = _PAREN_RE.sub('', title.lower())
+    for needles, label in _TITLE_RULES:
+        if any(n in t for n in needles):
+            return label
+    return title.strip().title()
+
+
+@lru_cache(maxsize=4096)
+def _experience_level(title: str) -> str:
+    for needles, label in _EXPERIENCE_RULES:
+        if any(n in title for n in needles):
+            return label
+    return 'Not Specified'
+
+
 class AnalyticsService:
-    def __init__(self, db: DatabasePort):
+    def __init__(self, db: DatabasePort, server_side: bool = True):
         self.db = db
+        # When True, counting happens in Postgres (jobs_analytics RPC) and only
+        # small pre-rolled result sets cross the network.
+        self.server_side = server_side
 
     async def get_market_stats(self) -> dict[str, Any]:
         """
-        Aggregates market data from raw jobs.
+        Aggregates market data from jobs.
         Returns:
             - total_jobs: int
             - top_skills: list[dict] {name, count}
             - salary_trends: list[dict] {role, avg_min, avg_max, count}
             - top_companies: list[dict] {name, count}
+            - work_styles: list[dict] {name, value}
+            - experience_levels: list[dict] {subject, A, fullMark}
         """
-        jobs = await self.db.get_all_jobs_for_analytics()
+        if self.server_side:
+            return await self._get_market_stats_server_side()
+        return await self._get_market_stats_in_memory()
+
+    async def _get_market_stats_server_side(self) -> dict[str, Any]:
+        """Assemble the response from the database-side aggregation."""
+        stats = await self.db.get_jobs_analytics()
+        total_jobs = stats.get("total_jobs") or 0
+
+        if not total_jobs:
+            return {
+                "total_jobs": 0,
+                "top_skills": [],
+                "salary_trends": [],
+                "top_companies": []
+            }
+
+        top_skills = [
+            {"name": s["name"].title(), "count": s["count"]}
+            for s in stats.get("top_skills") or []
+        ]
+        experience_stats = [
+            {"subject": e["name"], "A": e["count"], "fullMark": total_jobs}
+            for e in stats.get("experience_levels") or []
+            if e["count"] > 0
+        ]
+
+        return {
+            "total_jobs": total_jobs,
+            "top_skills": top_skills,
+            "salary_trends": self._salary_trends(stats.get("salary_samples") or []),
+            "top_companies": stats.get("top_companies") or [],
+            "work_styles": stats.get("work_styles") or [],
+            "experience_levels": experience_stats
+        }
+
+    async def _get_market_stats_in_memory(self) -> dict[str, Any]:
+        """Fallback: pull every active job and aggregate in Python."""
+        jobs = await self.db.get_all_jobs_for_analytics_raw()
         
         if not jobs:
             return {
@@ -31,23 +121,57 @@ class AnalyticsService:
         # 1. Total Jobs
         total_jobs = len(jobs)
 
-        # 2. Extract Skills (Counter)
-        all_skills = []
+        # 2-5. Skills, companies, work styles and experience levels,
+        # counted in a single pass over the jobs
+        skill_counter: Counter[str] = Counter()
+        company_counter: Counter[str] = Counter()
+        work_styles: Counter[str] = Counter()
+        experience: Counter[str] = Counter()
         for j in jobs:
             if j.get('skills_required'):
                 # Normalize: lowercase, strip
-                skills = [s.lower().strip() for s in j['skills_required']]
-                all_skills.extend(skills)
-        
-        skill_counts = Counter(all_skills).most_common(10)
-        top_skills = [{"name": s[0].title(), "count": s[1]} for s in skill_counts]
+                skill_counter.update(s.lower().strip() for s in j['skills_required'])
 
-        # 3. Companies
-        companies = [j['company_name'] for j in jobs if j.get('company_name')]
-        company_counts = Counter(companies).most_common(5)
-        top_companies = [{"name": c[0], "count": c[1]} for c in company_counts]
+            if j.get('company_name'):
+                company_counter[j['company_name']] += 1
 
-        # 4. Salary & Roles (Simple grouping)
+            loc = (j.get('location') or '').lower()
+            title = (j.get('title') or '').lower()
+
+            # Work style
+            if 'remote' in loc or 'remote' in title:
+                work_styles['Remote'] += 1
+            elif 'hybrid' in loc or 'hybrid' in title:
+                work_styles['Hybrid'] += 1
+            else:
+                work_styles['On-site'] += 1
+
+            # Experience level
+            experience[_experience_level(title)] += 1
+
+        top_skills = [{"name": name.title(), "count": count} for name, count in skill_counter.most_common(10)]
+        top_companies = [{"name": name, "count": count} for name, count in company_counter.most_common(5)]
+        work_style_stats = [{"name": k, "value": v} for k, v in work_styles.items()]
+
+        # 6. Salary & Roles (Simple grouping)
+        salary_trends = self._salary_trends(jobs)
+
+        experience_stats = [{"subject": k, "A": v, "fullMark": total_jobs} for k, v in experience.items() if v > 0]
+
+        return {
+            "total_jobs": total_jobs,
+            "top_skills": top_skills,
+            "salary_trends": salary_trends,
+            "top_companies": top_companies,
+            "work_styles": work_style_stats,
+            "experience_levels": experience_stats
+        }
+
+    def _salary_trends(self, jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Average parsed salary ranges per normalized title (top 8 by count).
+        Accepts any rows with 'title' and 'salary_range' keys.
+        """
         # We'll group by "Normalized Title" to get averages
         role_stats = {} # { "Senior Engineer": [min_sals...] }
         
@@ -57,7 +181,7 @@ class AnalyticsService:
             s_min, s_max = None, None
             if j.get('salary_range'):
                 # Basic parsing: find all numbers, take first two
-                nums = re.findall(r'(\d+)', str(j['salary_range']).replace(',', ''))
+                nums = _SALARY_NUM_RE.findall(str(j['salary_range']).replace(',', ''))
                 if len(nums) >= 2:
                     try:
                         s_min = int(nums[0])
@@ -94,70 +218,12 @@ class AnalyticsService:
         # Sort by count desc
         salary_trends.sort(key=lambda x: x['count'], reverse=True)
         salary_trends = salary_trends[:8] # Top 8 roles
-
-        # 5. Work Style Distribution
-        work_styles = Counter()
-        for j in jobs:
-            loc = (j.get('location') or '').lower()
-            title = (j.get('title') or '').lower()
-            desc = (j.get('description') or '').lower()
-            
-            if 'remote' in loc or 'remote' in title:
-                work_styles['Remote'] += 1
-            elif 'hybrid' in loc or 'hybrid' in title:
-                work_styles['Hybrid'] += 1
-            else:
-                work_styles['On-site'] += 1
-        
-        work_style_stats = [{"name": k, "value": v} for k, v in work_styles.items()]
-
-        # 6. Experience Levels
-        experience = Counter()
-        for j in jobs:
-            title = (j.get('title') or '').lower()
-            if 'senior' in title or 'sr.' in title or 'lead' in title or 'principal' in title:
-                experience['Senior/Lead'] += 1
-            elif 'junior' in title or 'jr.' in title or 'entry' in title or 'graduate' in title:
-                experience['Junior/Entry'] += 1
-            elif 'mid' in title or 'intermediate' in title:
-                experience['Mid-Level'] += 1
-            elif 'intern' in title:
-                experience['Internship'] += 1
-            else:
-                experience['Not Specified'] += 1 # Or group into Mid? Let's keep distinct
-
-        experience_stats = [{"subject": k, "A": v, "fullMark": total_jobs} for k, v in experience.items() if v > 0]
-
-        return {
-            "total_jobs": total_jobs,
-            "top_skills": top_skills,
-            "salary_trends": salary_trends,
-            "top_companies": top_companies,
-            "work_styles": work_style_stats,
-            "experience_levels": experience_stats
-        }
+        return salary_trends
 
     def _normalize_title(self, title: str) -> str:
         """
         Simplifies job titles for grouping.
         E.g. "Senior Backend Engineer (Remote)" -> "Backend Engineer"
         """
-        t = title.lower()
-        # Remove contents in parens
-        t = re.sub(r'\(.*?\)', '', t)
-        
-        if 'manager' in t: return 'Manager'
-        if 'director' in t: return 'Director'
-        if 'intern' in t: return 'Intern'
-        
-        # Tech roles
-        if 'full stack' in t or 'full-stack' in t: return 'Full Stack Developer'
-        if 'backend' in t or 'back end' in t: return 'Backend Engineer'
-        if 'frontend' in t or 'front end' in t: return 'Frontend Engineer'
-        if 'data scientist' in t: return 'Data Scientist'
-        if 'data engineer' in t: return 'Data Engineer'
-        if 'devops' in t or 'sre' in t: return 'DevOps / SRE'
-        if 'product' in t: return 'Product Manager'
-        if 'sales' in t: return 'Sales'
-        
-        return title.strip().title()
+        # Titles repeat heavily across the table, so the grouping is memoized
+        return _role_group(title)
@@ -3,8 +3,13 @@ Authentication service.
 Decodes Supabase JWTs and resolves the current user.
 """
 
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import Any
 
+from cachetools import TTLCache  # type: ignore
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 import jwt
@@ -15,10 +20,24 @@ from app.ports.database_port import DatabasePort
 
 _bearer_scheme = HTTPBearer()
 
+# token digest → (user_id, exp). Entries also honour the token's own expiry,
+# so a cached token is never accepted past exp (+ the decode leeway).
+# The user row itself is cached (and invalidated on writes) by the DB adapter.
+_TOKEN_LEEWAY = 30
+_token_cache: TTLCache = TTLCache(maxsize=50_000, ttl=60)
+
 
 def _verify_token_locally(token: str) -> str:
     """
     Decode the Supabase JWT to extract the user_id (sub claim).
+    See _decode_token() for the verification approach.
+    """
+    return _decode_token(token)[0]
+
+
+def _decode_token(token: str) -> tuple[str, float]:
+    """
+    Decode the Supabase JWT to (user_id, exp).
 
     Approach: We decode without full signature verification because the
     JWT secret in .env uses the sb_secret_ format which doesn't match
@@ -38,7 +57,7 @@ def _verify_token_locally(token: str) -> str:
                 "verify_exp": True,         # still check expiry
                 "verify_iat": False,        # disabled — clock skew causes false rejections
             },
-            leeway=30,  # 30-second tolerance for clock drift
+            leeway=_TOKEN_LEEWAY,  # 30-second tolerance for clock drift
         )
 
         user_id = payload.get("sub")
@@ -48,7 +67,7 @@ def _verify_token_locally(token: str) -> str:
                 detail="Token missing user ID (sub claim)",
             )
 
-        return user_id
+        return user_id, float(payload.get("exp") or 0)
 
     except jwt.ExpiredSignatureError:
         raise HTTPException(
@@ -62,6 +81,19 @@ def _verify_token_locally(token: str) -> str:
         )
 
 
+def _cached_user_id(token: str) -> str:
+    """_verify_token_locally() with the result memoized per token until it expires."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    hit = _token_cache.get(key)
+    if hit is not None and hit[1] + _TOKEN_LEEWAY > time.time():
+        return hit[0]
+
+    user_id, exp = _decode_token(token)
+    if exp:
+        _token_cache[key] = (user_id, exp)
+    return user_id
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
     db: DatabasePort = Depends(get_db),
@@ -71,7 +103,7 @@ async def get_current_user(
     then fetches the full user row from the database.
     """
     token = credentials.credentials
-    user_id = _verify_token_locally(token)
+    user_id = _cached_user_id(token)
 
     # Fetch the app user profile — this also serves as authorization
     # since only real users have rows in public.users
@@ -83,3 +115,21 @@ async def get_current_user(
         )
 
     return user
+
+
+@lru_cache(maxsize=None)
+def require_role(*allowed: str) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """
+    Dependency factory: resolves the current user and rejects anyone whose
+    role is not in `allowed` with 403. Cached per role set so every endpoint
+    shares one dependency callable (and FastAPI's per-request dependency cache).
+    """
+    allowed_roles = frozenset(allowed)
+    detail = f"Requires role: {' or '.join(allowed)}"
+
+    async def _require_role(user: dict[str, Any] = Depends(get_current_user)) -> dict[str, Any]:
+        if user.get("role") not in allowed_roles:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+        return user
+
+    return _require_role
@@ -6,11 +6,13 @@ Production hardening:
   - get_recent_history() for WebSocket state recovery on reconnect.
 """
 
-import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson  # type: ignore
+
 from app.domain.models import ChatMessage
 from app.ports.ai_port import AIPort
 from app.ports.database_port import DatabasePort
@@ -39,8 +41,14 @@ class ChatService:
         session = await self._db.get_chat_session(session_id)
         if not session:
             return [], "closed"
+        return self.recent_history_from(session, count)
 
-        log = self._parse_log(session.get("conversation_log"))
+    @classmethod
+    def recent_history_from(
+        cls, session: dict[str, Any], count: int = 10
+    ) -> tuple[list[dict[str, Any]], str]:
+        """get_recent_history() for a session row the caller already holds."""
+        log = cls._parse_log(session.get("conversation_log"))
         # Filter out hidden system context entries (not for display)
         visible_log = [m for m in log if not m.get("hidden")]
         # active_human is deprecated; default to active_ai
@@ -57,19 +65,47 @@ class ChatService:
         Process an incoming user message and generate a PERSONALIZED AI reply.
         Human takeover mode is deprecated; all messages are handled by the AI mentor.
         """
+        log, history, user_context = await self._prepare_turn(session_id, user_message)
+
+        ai_reply = await self._ai.chat(history, user_context=user_context)
+
+        await self._save_reply(session_id, ai_reply)
+        return ai_reply
+
+    async def handle_message_stream(
+        self, session_id: str, user_message: str
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of handle_message(): yields reply deltas as the
+        model generates them, then persists the full turn once complete.
+        """
+        log, history, user_context = await self._prepare_turn(session_id, user_message)
+
+        parts: list[str] = []
+        async for delta in self._ai.chat_stream(history, user_context=user_context):
+            parts.append(delta)
+            yield delta
+
+        await self._save_reply(session_id, "".join(parts))
+
+    async def _prepare_turn(
+        self, session_id: str, user_message: str
+    ) -> tuple[list[dict[str, Any]], list[ChatMessage], str]:
+        """Append the user message to the log and build the AI history + context."""
         session = await self._db.get_chat_session(session_id)
         if not session:
             raise ValueError(f"Chat session {session_id} not found")
 
-        # Append user message to log
+        # Persist the user message server-side before the model call, so
+        # admin messages appended meanwhile are neither lost nor reordered
+        entry = {
+            "role": "user",
+            "content": user_message,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        await self._db.append_to_conversation_log(session_id, entry)
         log = self._parse_log(session.get("conversation_log"))
-        log.append(
-            {
-                "role": "user",
-                "content": user_message,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-        )
+        log.append(entry)
 
         # ── Build personalized context from user profile + job ──
         user_context = await self._build_user_context(
@@ -87,22 +123,19 @@ class ChatService:
             for m in log
             if not m.get("hidden")
         ]
+        return log, history, user_context
 
-        ai_reply = await self._ai.chat(history, user_context=user_context)
-
-        log.append(
+    async def _save_reply(self, session_id: str, ai_reply: str) -> None:
+        """Append the assistant reply to the conversation log server-side."""
+        await self._db.append_to_conversation_log(
+            session_id,
             {
                 "role": "assistant",
                 "content": ai_reply,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
+            },
         )
 
-        await self._db.update_chat_session(
-            session_id, {"conversation_log": log}
-        )
-        return ai_reply
-
     @staticmethod
     def _parse_log(raw: Any) -> list[dict[str, Any]]:
         """
@@ -115,9 +148,9 @@ class ChatService:
             return raw
         if isinstance(raw, str):
             try:
-                parsed = json.loads(raw)
+                parsed = orjson.loads(raw)
                 return parsed if isinstance(parsed, list) else []
-            except (json.JSONDecodeError, TypeError):
+            except (orjson.JSONDecodeError, TypeError):
                 return []
         return []
 
@@ -182,12 +215,11 @@ class ChatService:
             )
 
         # Save greeting to conversation log
-        log.append({
+        await self._db.append_to_conversation_log(session_id, {
             "role": "assistant",
             "content": greeting,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         })
-        await self._db.update_chat_session(session_id, {"conversation_log": log})
 
         return greeting
 
@@ -3,10 +3,17 @@ Enrichment service — async AI generation of resume guides + prep questions.
 Runs as a FastAPI BackgroundTask after job creation.
 
 Production hardening:
-  - Batch API stub for future 50% token cost savings on scraped jobs.
+  - OpenAI Batch API path (~50% token cost) for scraped jobs that don't
+    need instant availability: enrich_jobs_batch() + apply_batch_results(),
+    driven by the submit/apply tasks in app.worker.ingestion_tasks.
+  - Enrichment responses are cached in ai_response_cache_jobs keyed on a
+    hash of the prompt inputs + model, so re-enriching an unchanged job
+    description never reaches OpenAI.
 """
 
+import hashlib
 import logging
+from typing import Any
 
 from app.ports.ai_port import AIPort  # type: ignore
 from app.ports.database_port import DatabasePort  # type: ignore
@@ -16,6 +23,14 @@ from app.domain.models import AIEnrichment  # type: ignore
 logger = logging.getLogger(__name__)
 
 
+def _enrichment_cache_key(
+    description: str, skills: list[str], title: str, company: str, model: str
+) -> str:
+    """SHA-256 of the normalized enrichment inputs (skill order is irrelevant)."""
+    raw = f"{description}|{','.join(sorted(skills))}|{title}|{company}|{model}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 class EnrichmentService:
     """Orchestrates the AI enrichment pipeline for a job posting."""
 
@@ -29,12 +44,19 @@ class EnrichmentService:
         self._ai = ai
         self._emb = embeddings
 
-    async def enrich_job(self, job_id: str) -> AIEnrichment | None:
+    async def enrich_job(
+        self,
+        job_id: str,
+        embedding: list[float] | None = None,
+        enrichment: AIEnrichment | None = None,
+    ) -> AIEnrichment | None:
         """
         Synchronous (single-job) enrichment:
         1. Fetches the job record
         2. Calls AI for resume guide + prep questions
+           (skipped when the caller already batch-generated it)
         3. Generates a vector embedding of the job description
+           (skipped when the caller already batch-embedded it)
         4. Updates the job record with all enrichment data
         """
         try:
@@ -49,21 +71,129 @@ class EnrichmentService:
             company = job.get("company_name", "")
 
             # Step 1: AI enrichment (structured output via Instructor)
-            enrichment = await self._ai.generate_enrichment(
-                description, skills, title=title, company_name=company
-            )
+            if enrichment is None:
+                enrichment = await self._cached_enrichment(description, skills, title, company)
 
             # Step 2: Generate job embedding
-            embedding = await self._emb.encode(description)
+            if embedding is None:
+                embedding = await self._emb.encode(description)
 
             # Step 3: Persist results
-            # Ensure proper serialization of Pydantic models to list of dicts
-            prep_data = [q.model_dump() for q in enrichment.prep_questions]
-            
-            # Use extracted skills if the job has none (e.g. scraped jobs)
-            final_skills = skills if skills else enrichment.extracted_skills
+            await self._persist(job_id, enrichment, embedding, skills)
 
-            try:
+            logger.info("Enrichment complete for job %s", job_id)
+            return enrichment
+
+        except Exception:
+            logger.exception("Enrichment failed for job %s", job_id)
+            return None
+
+    async def generate_enrichments(self, jobs: list[dict[str, Any]]) -> dict[str, AIEnrichment]:
+        """
+        Enrichments for several jobs, keyed by job id: cache hits first, the
+        rest in one batch-prompted generate_enrichment_batch() call.
+
+        Never raises; jobs missing from the result (AI failure) are left for
+        enrich_job() to enrich individually.
+        Each job dict uses 'id', 'description_raw', 'skills_required', 'title', 'company_name'.
+        """
+        model = getattr(self._ai, "model", "")
+        keys = {
+            str(job["id"]): _enrichment_cache_key(
+                job.get("description_raw") or "",
+                job.get("skills_required") or [],
+                job.get("title") or "",
+                job.get("company_name") or "",
+                model,
+            )
+            for job in jobs
+        }
+
+        results: dict[str, AIEnrichment] = {}
+        misses = []
+        for job in jobs:
+            cached = await self._cache_get(keys[str(job["id"])])
+            if cached is not None:
+                results[str(job["id"])] = cached
+            else:
+                misses.append(job)
+        if not misses:
+            return results
+
+        try:
+            generated = await self._ai.generate_enrichment_batch(misses)
+        except Exception as e:
+            logger.warning("Batch enrichment of %d jobs failed; enriching individually: %s", len(misses), e)
+            return results
+
+        for job, enrichment in zip(misses, generated):
+            results[str(job["id"])] = enrichment
+            await self._cache_put(keys[str(job["id"])], enrichment, model)
+        return results
+
+    async def _cached_enrichment(
+        self, description: str, skills: list[str], title: str, company: str
+    ) -> AIEnrichment:
+        """Serve enrichment from the response cache, falling back to the AI call."""
+        model = getattr(self._ai, "model", "")
+        key = _enrichment_cache_key(description, skills, title, company, model)
+
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        enrichment = await self._ai.generate_enrichment(
+            description, skills, title=title, company_name=company
+        )
+        await self._cache_put(key, enrichment, model)
+        return enrichment
+
+    async def _cache_get(self, key: str) -> AIEnrichment | None:
+        try:
+            cached = await self._db.get_cached_ai_response(key)
+            if cached:
+                return AIEnrichment.model_validate(cached)
+        except Exception as e:
+            logger.warning("Enrichment cache lookup failed: %s", e)
+        return None
+
+    async def _cache_put(self, key: str, enrichment: AIEnrichment, model: str) -> None:
+        try:
+            await self._db.save_ai_response(key, enrichment.model_dump(mode="json"), model)
+        except Exception as e:
+            logger.warning("Enrichment cache write failed: %s", e)
+
+    async def _persist(
+        self,
+        job_id: str,
+        enrichment: AIEnrichment,
+        embedding: list[float],
+        skills: list[str],
+    ) -> None:
+        """Write enrichment + embedding onto the job row."""
+        # Ensure proper serialization of Pydantic models to list of dicts
+        prep_data = [q.model_dump() for q in enrichment.prep_questions]
+        
+        # Use extracted skills if the job has none (e.g. scraped jobs)
+        final_skills = skills if skills else enrichment.extracted_skills
+
+        try:
+            await self._db.update_job(
+                job_id,
+                {
+                    "resume_guide_generated": enrichment.resume_guide,
+                    "prep_guide_generated": prep_data,
+                    "skills_required": final_skills,
+                    "embedding": embedding,
+                    "salary_range": enrichment.estimated_salary_range,
+                    "qualification": enrichment.qualification,
+                    "experience": enrichment.experience,
+                },
+            )
+        except Exception as e:
+            # Fallback: if columns like 'experience' or 'qualification' don't exist, try updating without them
+            if "column" in str(e).lower() and ("experience" in str(e).lower() or "qualification" in str(e).lower()):
+                logger.warning(f"Database schema mismatch for {job_id}. Retrying without extra fields. Error: {e}")
                 await self._db.update_job(
                     job_id,
                     {
@@ -72,56 +202,70 @@ class EnrichmentService:
                         "skills_required": final_skills,
                         "embedding": embedding,
                         "salary_range": enrichment.estimated_salary_range,
-                        "qualification": enrichment.qualification,
-                        "experience": enrichment.experience,
                     },
                 )
-            except Exception as e:
-                # Fallback: if columns like 'experience' or 'qualification' don't exist, try updating without them
-                if "column" in str(e).lower() and ("experience" in str(e).lower() or "qualification" in str(e).lower()):
-                    logger.warning(f"Database schema mismatch for {job_id}. Retrying without extra fields. Error: {e}")
-                    await self._db.update_job(
-                        job_id,
-                        {
-                            "resume_guide_generated": enrichment.resume_guide,
-                            "prep_guide_generated": prep_data,
-                            "skills_required": final_skills,
-                            "embedding": embedding,
-                            "salary_range": enrichment.estimated_salary_range,
-                        },
-                    )
-                else:
-                    raise e
+            else:
+                raise e
 
-            logger.info("Enrichment complete for job %s", job_id)
-            return enrichment
+    async def enrich_jobs_batch(self, job_ids: list[str]) -> str | None:
+        """
+        Submit jobs to the OpenAI Batch API for offline enrichment.
 
-        except Exception:
-            logger.exception("Enrichment failed for job %s", job_id)
+        The Batch API offers ~50% cost reduction but has a 24-hour turnaround.
+        Use this for scraped jobs where instant availability is not critical;
+        call apply_batch_results() with the returned batch_id to persist results.
+        Returns None when none of the jobs exist or have a description.
+        """
+        jobs = []
+        for job_id in job_ids:
+            job = await self._db.get_job(job_id)
+            if not job:
+                logger.error("Batch enrichment: job %s not found", job_id)
+            elif not job.get("description_raw"):
+                logger.warning("Batch enrichment: job %s has no description, skipped", job_id)
+            else:
+                jobs.append(job)
+
+        if not jobs:
             return None
 
-    async def enrich_jobs_batch(self, job_ids: list[str]) -> str:
+        batch_id = await self._ai.submit_batch_enrichment(jobs)
+        logger.info("Submitted %d jobs for batch enrichment (batch %s)", len(jobs), batch_id)
+        return batch_id
+
+    async def apply_batch_results(self, batch_id: str) -> list[dict[str, Any]] | None:
         """
-        Batch enrichment stub — for future integration with OpenAI Batch API.
+        Persist the results of a finished enrichment batch.
 
-        The Batch API offers ~50% cost reduction but has a 24-hour turnaround.
-        Use this for scraped jobs where instant availability is not critical.
+        Returns None while the batch is still running, otherwise the job rows
+        (as read before the update) that were enriched. Embeddings for the batch are generated in one request.
+        """
+        results = await self._ai.poll_batch(batch_id)
+        if results is None:
+            return None
+
+        jobs = []
+        for job_id in results:
+            job = await self._db.get_job(job_id)
+            if job and job.get("description_raw"):
+                jobs.append(job)
+            else:
+                logger.warning("Batch %s: job %s is gone or has no description, skipped", batch_id, job_id)
 
-        TODO: Implement when a polling worker is built:
-          1. Build JSONL payloads for each job_id
-          2. Submit via openai.batches.create(input_file_id=..., endpoint="/v1/chat/completions")
-          3. Store batch_id for the polling worker to check status
-          4. On batch completion, parse results and update jobs
+        if not jobs:
+            return []
 
-        Returns:
-            A placeholder batch_id string.
-        """
-        logger.info(
-            "Batch enrichment requested for %d jobs (stub — falling back to sequential)",
-            len(job_ids),
-        )
-        # Fallback: process sequentially until batch worker is implemented
-        for job_id in job_ids:
-            await self.enrich_job(job_id)
+        embeddings = await self._emb.encode_many([job["description_raw"] for job in jobs])
+
+        updated: list[dict[str, Any]] = []
+        for job, embedding in zip(jobs, embeddings):
+            try:
+                await self._persist(
+                    job["id"], results[str(job["id"])], embedding, job.get("skills_required") or []
+                )
+                updated.append(job)
+            except Exception:
+                logger.exception("Failed to persist batch enrichment for job %s", job["id"])
 
-        return "batch_stub_sequential"
+        logger.info("Batch %s applied to %d/%d jobs", batch_id, len(updated), len(results))
+        return updated
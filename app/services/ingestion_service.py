@@ -12,9 +12,11 @@ import hashlib
 import logging
 import re
 import traceback
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
+from app.domain.models import AIEnrichment  # type: ignore
 from app.ports.ai_port import AIPort  # type: ignore
 from app.ports.database_port import DatabasePort  # type: ignore
 from app.ports.embedding_port import EmbeddingPort  # type: ignore
@@ -31,6 +33,30 @@ logger = logging.getLogger(__name__)
 # Must match the UUID inserted by external_ingestion_migration.sql.
 INGESTION_PROVIDER_ID = "00000000-0000-4000-a000-000000000001"
 
+# Limits per embeddings request when pre-embedding a scraped batch. OpenAI
+# caps a request at 300k input tokens in total, so chunks are cut on a
+# character budget: at >= 2 chars per token this stays under ~250k tokens.
+EMBED_BATCH_SIZE = 512
+EMBED_BATCH_MAX_CHARS = 500_000
+
+# New jobs per batch-prompted enrichment call (one prompt, one structured reply)
+ENRICH_PROMPT_BATCH_SIZE = 5
+
+
+def _embed_chunks(texts: list[tuple[str, str]]) -> Iterator[list[tuple[str, str]]]:
+    """Split (job_id, description) pairs into request-sized chunks, in order."""
+    chunk: list[tuple[str, str]] = []
+    chars = 0
+    for item in texts:
+        size = len(item[1])
+        if chunk and (len(chunk) == EMBED_BATCH_SIZE or chars + size > EMBED_BATCH_MAX_CHARS):
+            yield chunk
+            chunk, chars = [], 0
+        chunk.append(item)
+        chars += size
+    if chunk:
+        yield chunk
+
 
 class IngestionService:
     """
@@ -87,11 +113,19 @@ class IngestionService:
         enrichment_tasks = []
         enrichment_sem = asyncio.Semaphore(5)
 
-        async def _run_enrichment(job_id: str, company: str, ext_id: str):
+        async def _run_enrichment(
+            job_id: str,
+            company: str,
+            ext_id: str,
+            embedding: list[float] | None = None,
+            enrichment: AIEnrichment | None = None,
+        ):
             async with enrichment_sem:
                 enricher = EnrichmentService(db=self._db, ai=self._ai, embeddings=self._emb)
                 try:
-                    enrichment = await enricher.enrich_job(job_id)
+                    enrichment = await enricher.enrich_job(
+                        job_id, embedding=embedding, enrichment=enrichment
+                    )
                     logger.info("Background enrichment finished: %s / %s", company, ext_id)
 
                     # ── Queue for Telegram Channel ──────────────────
@@ -110,7 +144,37 @@ class IngestionService:
                 except Exception as e:
                     logger.warning("Background enrichment failed for %s: %s", job_id, e)
 
+        async def _enrich_group(
+            jobs: list[dict[str, Any]], embeddings: dict[str, list[float]]
+        ):
+            # One prompt for the group; jobs it fails for are enriched one by one
+            async with enrichment_sem:
+                enricher = EnrichmentService(db=self._db, ai=self._ai, embeddings=self._emb)
+                enrichments = await enricher.generate_enrichments(jobs)
+            await asyncio.gather(*(
+                _run_enrichment(
+                    job["id"], job["company_name"], job["external_id"],
+                    embeddings.get(job["id"]), enrichments.get(str(job["id"])),
+                )
+                for job in jobs
+            ))
+
         async def _process_job_batch(batch: Any):
+            # Resolve enrichment donors for the whole batch in one query
+            batch_hashes = [
+                hashlib.sha256(j["description_raw"].encode()).hexdigest()
+                for j in batch if j.get("description_raw")
+            ]
+            donors: dict[str, dict[str, Any]] = {}
+            if batch_hashes:
+                try:
+                    donors = await self._db.find_jobs_by_description_hashes(batch_hashes)
+                except Exception as e:
+                    logger.warning("Donor lookup failed; enriching batch without dedup: %s", e)
+
+            # New jobs that need enrichment (the enrichment prompt's inputs)
+            to_enrich: list[dict[str, Any]] = []
+
             for job_data in batch:
                 company = job_data["company_name"]
                 ext_id = job_data["external_id"]
@@ -188,7 +252,7 @@ class IngestionService:
 
                     # Dedup enrichment
                     if desc_hash:
-                        donor = await self._db.find_job_by_description_hash(desc_hash)
+                        donor = donors.get(desc_hash)
                         if donor:
                             await self._db.update_job(created["id"], {
                                 "resume_guide_generated": donor["resume_guide_generated"],
@@ -203,9 +267,14 @@ class IngestionService:
                                     telegram_queue.append(job_data)
                             continue
 
-                    # Run enrichment (updates the fields, status remains active)
-                    task = asyncio.create_task(_run_enrichment(created["id"], company, ext_id))
-                    enrichment_tasks.append(task)
+                    to_enrich.append({
+                        "id": created["id"],
+                        "company_name": company,
+                        "external_id": ext_id,
+                        "title": job_data["title"],
+                        "description_raw": desc_raw,
+                        "skills_required": job_data.get("skills_required") or [],
+                    })
 
                     stats["new"] += 1
                     logger.info("Ingested and active: %s / %s", company, ext_id)
@@ -214,6 +283,28 @@ class IngestionService:
                     logger.exception("Failed to ingest: %s / %s", company, ext_id)
                     stats["errors"] += 1
 
+            if not to_enrich:
+                return
+
+            # Embed the batch's descriptions up front in a few large requests
+            # instead of one embeddings call per job inside enrichment.
+            embeddings: dict[str, list[float]] = {}
+            texts = [(job["id"], job["description_raw"]) for job in to_enrich if job["description_raw"]]
+            for chunk in _embed_chunks(texts):
+                try:
+                    vectors = await self._emb.encode_many([desc for _, desc in chunk])
+                    embeddings.update(zip((job_id for job_id, _ in chunk), vectors))
+                except Exception as e:
+                    logger.warning("Batch embedding failed; jobs will embed individually: %s", e)
+
+            # Run enrichment (updates the fields, status remains active),
+            # ENRICH_PROMPT_BATCH_SIZE jobs per prompt
+            for i in range(0, len(to_enrich), ENRICH_PROMPT_BATCH_SIZE):
+                task = asyncio.create_task(
+                    _enrich_group(to_enrich[i:i + ENRICH_PROMPT_BATCH_SIZE], embeddings)
+                )
+                enrichment_tasks.append(task)
+
         try:
             # Note: Do NOT await here yet, as it might be an async generator
             fetch_result = scraper.fetch_jobs()
@@ -5,8 +5,16 @@ Single Responsibility: only handles job data operations.
 
 from typing import Any
 
+import orjson  # type: ignore
+
+from app.domain.models import JobDetail, JobFeedItem
 from app.ports.database_port import DatabasePort
 
+# List endpoints select only the columns their response models serialize,
+# leaving the embedding vector and other wide columns in the database.
+_FEED_COLUMNS = tuple(JobFeedItem.model_fields)
+_PROVIDER_COLUMNS = tuple(JobDetail.model_fields)
+
 
 class JobService:
     """Handles job CRUD operations."""
@@ -28,11 +36,22 @@ class JobService:
 
     async def list_by_provider(self, provider_id: str) -> list[dict[str, Any]]:
         """List all jobs created by a given provider."""
-        return await self._db.list_jobs_by_provider(provider_id)
+        return await self._db.list_jobs_by_provider(provider_id, columns=_PROVIDER_COLUMNS)
 
     async def list_feed(self, skip: int = 0, limit: int = 20) -> list[dict[str, Any]]:
         """Paginated list of active jobs for the job seeker feed."""
-        return await self._db.list_active_jobs(skip=skip, limit=limit)
+        return await self._db.list_active_jobs(skip=skip, limit=limit, columns=_FEED_COLUMNS)
+
+    async def list_recommended(
+        self, user_embedding: Any, skip: int = 0, limit: int = 20
+    ) -> list[dict[str, Any]]:
+        """Feed of active jobs ranked by similarity to the seeker's resume embedding."""
+        if isinstance(user_embedding, str):
+            # pgvector comes back from PostgREST as its text form
+            user_embedding = orjson.loads(user_embedding)
+        return await self._db.list_ranked_jobs(
+            user_embedding, skip=skip, limit=limit, columns=_FEED_COLUMNS
+        )
 
     async def get_details(self, job_id: str) -> dict[str, Any] | None:
         """Get full 4-Pillar job details."""
@@ -1,8 +1,14 @@
+import asyncio
 import feedparser
+import httpx  # type: ignore
 import urllib.parse
 from datetime import datetime
+from itertools import zip_longest
 from typing import List, Dict
 
+# Caps concurrent RSS requests across all digest runs in this process
+_FEED_SEMAPHORE = asyncio.Semaphore(8)
+
 class MarketNewsService:
     """
     Ingests real-time market news for Big 4 companies with a focus on 
@@ -28,31 +34,42 @@ class MarketNewsService:
         "tax audit", "lawsuit", "scandal", "merger", "acquisition"
     ]
 
-    def fetch_big4_career_news(self, limit: int = 5) -> List[Dict]:
+    def __init__(self) -> None:
+        # Shared keep-alive client, created lazily inside the running event loop
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=4, keepalive_expiry=90),
+                timeout=15.0,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called from the app lifespan)."""
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def fetch_big4_career_news(self, limit: int = 5) -> List[Dict]:
         """
         Fetches, filters, and standardizes news items.
         Returns a list of dicts with title, link, published, summary, source.
+
+        One feed per target company is fetched concurrently, so total latency
+        is that of the slowest feed; results are interleaved round-robin so
+        no single company crowds out the others.
         """
-        # Construct Query: (Deloitte OR PwC ...) AND (intern OR graduate ...)
-        companies_part = " OR ".join(self.TARGET_COMPANIES)
-        keywords_part = " OR ".join([f'"{k}"' for k in self.CAREER_KEYWORDS])
-        
-        # URL encode the query
-        raw_query = f"({companies_part}) AND ({keywords_part})"
-        encoded_query = urllib.parse.quote(raw_query)
-        
-        feed_url = self.GOOGLE_NEWS_RSS_URL.format(query=encoded_query)
-        
-        print(f"Fetching RSS feed from: {feed_url}")
-        feed = feedparser.parse(feed_url)
-        
-        if feed.bozo:
-            print(f"Warning: Feed parsing error: {feed.bozo_exception}")
+        feeds = await asyncio.gather(
+            *(self._fetch_feed(self._company_feed_url(c)) for c in self.TARGET_COMPANIES)
+        )
 
         articles = []
         seen_titles = set()
 
-        for entry in feed.entries:
+        # Round-robin across the per-company feeds
+        for entry in (e for group in zip_longest(*feeds) for e in group if e is not None):
             title = entry.title
             link = entry.link
             summary = getattr(entry, "summary", "")
@@ -79,6 +96,34 @@ class MarketNewsService:
         
         return articles
 
+    def _company_feed_url(self, company: str) -> str:
+        # Construct Query: Deloitte AND (intern OR graduate ...)
+        keywords_part = " OR ".join([f'"{k}"' for k in self.CAREER_KEYWORDS])
+        
+        # URL encode the query
+        raw_query = f"{company} AND ({keywords_part})"
+        encoded_query = urllib.parse.quote(raw_query)
+        
+        return self.GOOGLE_NEWS_RSS_URL.format(query=encoded_query)
+
+    async def _fetch_feed(self, feed_url: str) -> list:
+        """Fetch and parse one RSS feed; returns its entries ([] on failure)."""
+        async with _FEED_SEMAPHORE:
+            print(f"Fetching RSS feed from: {feed_url}")
+            try:
+                resp = await self._get_client().get(feed_url)
+                resp.raise_for_status()
+            except httpx.HTTPError as e:
+                print(f"Warning: Feed fetch failed: {e}")
+                return []
+
+        # feedparser is CPU-bound; parse off the event loop
+        feed = await asyncio.to_thread(feedparser.parse, resp.content)
+        
+        if feed.bozo:
+            print(f"Warning: Feed parsing error: {feed.bozo_exception}")
+        return feed.entries
+
     def _is_relevant(self, title: str, summary: str) -> bool:
         """
         Returns True if the article contains positive keywords and avoids negative ones.
@@ -2,17 +2,27 @@
 Matching service — cosine similarity between user and job embeddings.
 """
 
-import json
-import math
 import logging
 from typing import Any
 
+import numpy as np  # type: ignore
+import orjson  # type: ignore
+from cachetools import TTLCache  # type: ignore
+
 from app.domain.models import MatchResult
 from app.ports.database_port import DatabasePort
 from app.ports.ai_port import AIPort
 
 logger = logging.getLogger(__name__)
 
+# Unit-normalised float32 job vectors, keyed by job id. Job embeddings only
+# change on re-enrichment, so parsing + normalising is paid once per job.
+_job_vectors: TTLCache = TTLCache(maxsize=4096, ttl=600)
+
+# Same for resume vectors, keyed by (user id, stored resume path): every upload
+# gets a new path, so a re-upload never hits a stale entry.
+_user_vectors: TTLCache = TTLCache(maxsize=4096, ttl=600)
+
 
 class MatchingService:
     """Calculates semantic fit between a user's resume and a job posting."""
@@ -39,10 +49,18 @@ class MatchingService:
                 "Job has no embedding yet. AI enrichment may still be processing."
             )
 
-        user_vec = self._parse_vector(user["resume_embedding"])
-        job_vec = self._parse_vector(job["embedding"])
-
-        raw_score = self._cosine_similarity(user_vec, job_vec)
+        user_key = (user_id, user.get("resume_file_url"))
+        user_vec = _user_vectors.get(user_key)
+        if user_vec is None:
+            # Resumes uploaded since embeddings were normalised at upload are
+            # already unit length; this still covers older rows.
+            user_vec = _user_vectors[user_key] = self._unit_vector(user["resume_embedding"])
+        job_vec = _job_vectors.get(job_id)
+        if job_vec is None:
+            job_vec = _job_vectors[job_id] = self._unit_vector(job["embedding"])
+
+        # Both sides are unit length, so the dot product is the cosine similarity
+        raw_score = float(np.dot(user_vec, job_vec))
         
         # Artificial piecewise multiplier to boost embedding scores closer to 100%
         # because ~0.60 cosine similarity represents a highly tailored text match.
@@ -63,41 +81,15 @@ class MatchingService:
         learning_recommendations = []
 
         if gap_detected:
-            import asyncio
-            
             # 1 & 2. Generate analysis and extract skills in parallel
-            required = job.get("skills_required", [])
-            
-            tasks = [
-                self._ai.analyze_gap(
-                    resume_text=user.get("resume_text", ""),
-                    job_description=job.get("description_raw", "")
-                )
-            ]
-            
-            if required:
-                tasks.append(
-                    self._ai.extract_missing_skills(
-                        resume_text=user.get("resume_text", ""),
-                        required_skills=required
-                    )
-                )
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            if isinstance(results[0], str):
-                gap_analysis = results[0]
-            else:
-                logger.error(f"Gap analysis failed: {results[0]}")
+            missing_skills, gap_analysis, _ = await self._ai.analyze_bundle(
+                resume_text=user.get("resume_text", ""),
+                job_description=job.get("description_raw", ""),
+                required_skills=job.get("skills_required", []),
+            )
+            if gap_analysis is None:
                 gap_analysis = "Dynamic analysis stream interrupted."
-                
-            if len(results) > 1:
-                if isinstance(results[1], list):
-                    missing_skills = results[1]
-                else:
-                    logger.error(f"Skills extraction failed: {results[1]}")
-            
+
             # 3. Fetch learning resources for those skills
             if missing_skills:
                 learning_recommendations = await self._db.get_learning_resources(missing_skills)
@@ -112,18 +104,13 @@ class MatchingService:
         )
 
     @staticmethod
-    def _parse_vector(vec: Any) -> list[float]:
-        """Supabase may return pgvector embeddings as strings — parse them."""
+    def _unit_vector(vec: Any) -> np.ndarray:
+        """
+        Parse a pgvector embedding (Supabase may return it as a string) into
+        an L2-normalised float32 array. A zero vector stays zero.
+        """
         if isinstance(vec, str):
-            return json.loads(vec)
-        return vec
-
-    @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+            vec = orjson.loads(vec)
+        arr = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(arr)
+        return arr / norm if norm else arr
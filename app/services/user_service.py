@@ -8,6 +8,8 @@ import re
 import uuid
 from typing import Any
 
+import numpy as np  # type: ignore
+
 from app.ports.database_port import DatabasePort
 from app.ports.document_port import DocumentPort
 from app.ports.embedding_port import EmbeddingPort
@@ -80,8 +82,11 @@ class UserService:
                 "The document may be a scan or image-based. Please upload a text-based PDF or DOCX."
             )
 
-        # Step 3: Generate embedding
-        embedding = await self._emb.encode(text)
+        # Step 3: Generate embedding, stored L2-normalised so cosine
+        # similarity against it is a plain dot product
+        vec = np.asarray(await self._emb.encode(text), dtype=np.float32)
+        vec /= np.linalg.norm(vec) + 1e-12
+        embedding = vec.tolist()
 
         # Step 4: Persist everything
         await self._db.upsert_user(
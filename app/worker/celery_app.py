@@ -2,6 +2,7 @@
 Celery background worker application setup.
 """
 from celery import Celery
+from celery.schedules import crontab
 
 from app.config import settings
 
@@ -17,6 +18,22 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
-    # Ensure background tasks for RAG are registered
-    imports=("app.worker.tasks",)
+    # Ensure background tasks for RAG and ingestion are registered
+    imports=("app.worker.tasks", "app.worker.ingestion_tasks"),
+    # Scrapes and re-enrichment run on their own queue/worker (see ingestion_tasks)
+    task_routes={
+        "ingest_jobs": {"queue": "ingest"},
+        "daily_ingestion": {"queue": "ingest"},
+        "reenrich_unenriched": {"queue": "ingest"},
+        "reenrich_batch": {"queue": "ingest"},
+        "submit_enrichment_batch": {"queue": "ingest"},
+        "apply_enrichment_batch": {"queue": "ingest"},
+    },
+    # Periodic tasks, published by a single `celery beat` process
+    beat_schedule={
+        "daily-ingestion": {
+            "task": "daily_ingestion",
+            "schedule": crontab(hour=16, minute=30),  # 22:00 IST
+        },
+    },
 )
@@ -0,0 +1,224 @@
+"""
+Celery tasks for scraper ingestion and job re-enrichment.
+
+Admin triggers enqueue these instead of using FastAPI BackgroundTasks, so
+long scrapes don't hold API worker resources and survive API restarts.
+They are routed to the "ingest" queue; run a dedicated worker for it with
+bounded concurrency on the prefork pool:
+
+    celery -A app.worker.celery_app worker -Q ingest -P prefork -c 2
+
+Each task drives one event loop per worker process (see _get_loop), so green-
+thread and thread pools (gevent, eventlet, threads) are refused at startup.
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Optional
+
+from celery.signals import celeryd_init  # type: ignore
+
+from app.worker.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+# Worker concurrency for the ingest queue (the -c flag above)
+MAX_CONCURRENT_INGEST = 2
+
+REENRICH_BATCH_SIZE = 3      # Jobs enriched concurrently per task
+REENRICH_PAGE_SIZE = 1000    # Rows fetched per candidate query
+
+# OpenAI Batch API jobs complete within 24h; poll every 10 minutes until then
+BATCH_POLL_SECONDS = 600
+BATCH_POLL_MAX = 24 * 3600 // BATCH_POLL_SECONDS + 6
+
+# One event loop per worker process: the shared async HTTP clients in
+# app.dependencies keep pooled connections bound to the loop that opened them.
+# Only safe while tasks in a process run one at a time (prefork / solo pools).
+# Created lazily in the process that runs tasks, never at import: the prefork
+# parent imports this module before forking (and the API imports it too).
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_pid: int | None = None
+
+_CONCURRENT_POOLS = ("gevent", "eventlet", "threads")
+
+
+@celeryd_init.connect
+def _require_prefork_pool(sender=None, conf=None, options=None, **kwargs):
+    """Refuse to start an ingest-queue worker on a pool that runs tasks concurrently in-process."""
+    options = options or {}
+    queues = options.get("queues") or ()
+    if isinstance(queues, str):
+        queues = queues.split(",")
+    if queues and "ingest" not in queues:
+        return  # e.g. the RAG worker, which may use gevent
+
+    pool = options.get("pool_cls") or getattr(conf, "worker_pool", None) or "prefork"
+    name = pool if isinstance(pool, str) else f"{pool.__module__}.{pool.__name__}"
+    if any(p in name.lower() for p in _CONCURRENT_POOLS):
+        logger.critical("The ingest queue needs the prefork (or solo) pool, got %s", name)
+        # SystemExit, not an exception: celery logs and swallows handler errors
+        raise SystemExit(1)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """This process's event loop (a forked child gets its own, not the parent's)."""
+    global _loop, _loop_pid
+    if _loop is None or _loop_pid != os.getpid():
+        _loop = asyncio.new_event_loop()
+        _loop_pid = os.getpid()
+    return _loop
+
+
+def _run(coro):
+    loop = _get_loop()
+    if loop.is_running():
+        coro.close()
+        raise RuntimeError("Ingest tasks must run on the prefork (or solo) pool")
+    return loop.run_until_complete(coro)
+
+
+@celery_app.task(name="ingest_jobs", bind=True, max_retries=3)
+def ingest_jobs(self, scraper_name: Optional[str] = None):
+    """Run one scraper (or all of them) through the ingestion pipeline."""
+    from app.scheduler import trigger_ingestion
+
+    try:
+        return _run(trigger_ingestion(scraper_name))
+    except Exception as e:
+        logger.error(f"Ingestion task failed for {scraper_name or 'ALL'}: {e}")
+        raise self.retry(exc=e, countdown=60)
+
+
+@celery_app.task(name="daily_ingestion")
+def daily_ingestion():
+    """Full ingestion run under the shared cron lock (skips if one is already running)."""
+    from app.scheduler import run_daily_ingestion
+
+    return _run(run_daily_ingestion())
+
+
+@celery_app.task(name="reenrich_unenriched")
+def reenrich_unenriched(use_batch_api: bool = False):
+    """
+    Find all jobs missing enrichment and enqueue them in small batches.
+
+    With use_batch_api, each page of candidates is submitted as one OpenAI
+    Batch API job instead (~50% cheaper, results within 24h).
+    """
+    from app.dependencies import get_db
+
+    db = get_db()
+    queued = 0
+    last_id = None
+
+    # Filtered server-side; keyset pagination on id since rows drop out of
+    # the filter as batches complete, so an offset would skip jobs.
+    while True:
+        query = (
+            db._client.table("jobs_jobs")
+            .select("id")
+            .or_("prep_guide_generated.is.null,resume_guide_generated.is.null,embedding.is.null")
+            .order("id")
+            .limit(REENRICH_PAGE_SIZE)
+        )
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        page = query.execute().data or []
+        if not page:
+            break
+
+        last_id = page[-1]["id"]
+        ids = [row["id"] for row in page]
+        if use_batch_api:
+            submit_enrichment_batch.delay(ids)
+        else:
+            for start in range(0, len(ids), REENRICH_BATCH_SIZE):
+                reenrich_batch.delay(ids[start:start + REENRICH_BATCH_SIZE])
+        queued += len(ids)
+
+        if len(page) < REENRICH_PAGE_SIZE:
+            break
+
+    logger.info("Re-enrichment: queued %d jobs", queued)
+    return queued
+
+
+# rate_limit spaces batches out (~one every 3s per worker) to let the API breathe
+@celery_app.task(name="reenrich_batch", rate_limit="20/m")
+def reenrich_batch(job_ids: list[str]):
+    """Re-run enrichment for a few jobs concurrently."""
+    return _run(_reenrich_batch(job_ids))
+
+
+async def _reenrich_batch(job_ids: list[str]) -> dict[str, int]:
+    from app.dependencies import get_ai_service, get_db, get_embedding_service
+    from app.services.enrichment_service import EnrichmentService
+
+    db = get_db()
+    enricher = EnrichmentService(db=db, ai=get_ai_service(), embeddings=get_embedding_service())
+
+    # Jobs stuck in 'processing' that enriched fine; activated in one UPDATE below
+    to_activate: list[str] = []
+
+    async def _enrich_one(job_id: str) -> bool:
+        try:
+            job: dict[str, Any] | None = await db.get_job(job_id, columns=("title", "company_name", "status"))
+            if await enricher.enrich_job(job_id) is None:
+                return False
+            if job and job.get("status") == "processing":
+                to_activate.append(job_id)
+            logger.info("Re-enriched: %s (%s)", job and job.get("title"), job and job.get("company_name"))
+            return True
+        except Exception:
+            logger.exception("Re-enrichment failed for job %s", job_id)
+            return False
+
+    results = await asyncio.gather(*(_enrich_one(job_id) for job_id in job_ids))
+    if to_activate:
+        await db.bulk_update_job_status(to_activate, "active")
+    success = sum(results)
+    return {"success": success, "failed": len(results) - success}
+
+
+@celery_app.task(name="submit_enrichment_batch")
+def submit_enrichment_batch(job_ids: list[str]):
+    """Submit jobs to the OpenAI Batch API and schedule polling for the result."""
+    batch_id = _run(_submit_enrichment_batch(job_ids))
+    if batch_id:
+        apply_enrichment_batch.apply_async((batch_id,), countdown=BATCH_POLL_SECONDS)
+    return batch_id
+
+
+async def _submit_enrichment_batch(job_ids: list[str]) -> Optional[str]:
+    from app.dependencies import get_ai_service, get_db, get_embedding_service
+    from app.services.enrichment_service import EnrichmentService
+
+    enricher = EnrichmentService(db=get_db(), ai=get_ai_service(), embeddings=get_embedding_service())
+    return await enricher.enrich_jobs_batch(job_ids)
+
+
+@celery_app.task(name="apply_enrichment_batch", bind=True, max_retries=BATCH_POLL_MAX)
+def apply_enrichment_batch(self, batch_id: str):
+    """Persist a finished Batch API job; re-polls itself while the batch is still running."""
+    applied = _run(_apply_enrichment_batch(batch_id))
+    if applied is None:
+        raise self.retry(countdown=BATCH_POLL_SECONDS)
+    return applied
+
+
+async def _apply_enrichment_batch(batch_id: str) -> Optional[int]:
+    from app.dependencies import get_ai_service, get_db, get_embedding_service
+    from app.services.enrichment_service import EnrichmentService
+
+    db = get_db()
+    enricher = EnrichmentService(db=db, ai=get_ai_service(), embeddings=get_embedding_service())
+    updated = await enricher.apply_batch_results(batch_id)
+    if updated is None:
+        return None
+
+    # Same as reenrich_batch: jobs stuck in 'processing' go live once enriched
+    to_activate = [job["id"] for job in updated if job.get("status") == "processing"]
+    if to_activate:
+        await db.bulk_update_job_status(to_activate, "active")
+    return len(updated)
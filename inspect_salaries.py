@@ -12,7 +12,7 @@ async def inspect():
     client = _get_supabase_client()
     db = SupabaseAdapter(client)
     
-    jobs = await db.get_all_jobs_for_analytics()
+    jobs = await db.get_all_jobs_for_analytics_raw()
     print(f"Found {len(jobs)} jobs.")
     
     print("\n--- Salary Ranges ---")
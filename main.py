@@ -4,11 +4,14 @@ jobs.ottobon.cloud — FastAPI Application Entry Point
 Registers all routers, applies middleware, and serves the API.
 """
 
+import asyncio
 import logging
 import contextlib
+import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.routers import admin, auth, chat, ingestion, jobs, matching, users, blog, analytics, rag, resume_builder, mock_interviews
@@ -25,11 +28,22 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 jobs.ottobon.cloud is starting up")
-    from app.scheduler import start_scheduler, shutdown_scheduler
-    start_scheduler()
+    # Larger default executor for blocking work (document parsing, sync SDKs)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4)
+    )
+    from app.dependencies import (
+        close_db_pool,
+        close_document_pool,
+        close_http_clients,
+        open_db_pool,
+    )
+    await open_db_pool()
     yield
     # Shutdown
-    shutdown_scheduler()
+    await close_db_pool()
+    await close_http_clients()
+    close_document_pool()
     logger.info("🛑 jobs.ottobon.cloud is shutting down")
 
 
@@ -42,6 +56,8 @@ app = FastAPI(
     ),
     version="0.1.0",
     lifespan=lifespan,
+    # orjson for every endpoint that returns plain data
+    default_response_class=ORJSONResponse,
 )
 
 # ── CORS ──────────────────────────────────────────────────────
@@ -0,0 +1,25 @@
+-- ============================================================
+-- Migration 010: find_job_by_hash RPC
+-- ============================================================
+-- Used by: SupabaseAdapter.find_job_by_description_hash
+-- (ingestion dedup — reuse enrichment from an identical description).
+--
+-- Returns the first already-enriched job (embedding present) with a
+-- matching description_hash. Called via supabase.rpc() so the lookup
+-- is a single prepared statement rather than a PostgREST filter chain.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_jobs_jobs_description_hash
+    ON jobs_jobs (description_hash);
+
+CREATE OR REPLACE FUNCTION find_job_by_hash(h TEXT)
+RETURNS SETOF jobs_jobs
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT *
+    FROM jobs_jobs
+    WHERE description_hash = h
+      AND embedding IS NOT NULL
+    LIMIT 1;
+$$;
@@ -0,0 +1,105 @@
+-- ============================================================
+-- Migration 011: jobs_analytics RPC
+-- ============================================================
+-- Used by: SupabaseAdapter.get_jobs_analytics → GET /analytics/market
+--
+-- Problem: market stats pulled every active job into Python just
+-- to count skills, companies, work styles and experience levels.
+--
+-- Fix: aggregate in Postgres and return one small JSONB document.
+-- Salary ranges are free-text, so only the (title, salary_range)
+-- pairs that actually have a salary are returned for parsing in
+-- the service layer.
+--
+-- Keys returned:
+--   total_jobs        — count of active jobs
+--   top_skills        — [{name, count}] top 10, lower-cased + trimmed
+--   top_companies     — [{name, count}] top 5
+--   work_styles       — [{name, value}] Remote / Hybrid / On-site
+--   experience_levels — [{name, count}] title-keyword buckets
+--   salary_samples    — [{title, salary_range}]
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION jobs_analytics()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    WITH active AS (
+        SELECT title, company_name, location, salary_range, skills_required,
+               lower(coalesce(title, ''))    AS title_l,
+               lower(coalesce(location, '')) AS loc_l
+        FROM jobs_jobs
+        WHERE status = 'active'
+    )
+    SELECT jsonb_build_object(
+        'total_jobs', (SELECT count(*) FROM active),
+
+        'top_skills', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('name', s.name, 'count', s.cnt) ORDER BY s.cnt DESC)
+            FROM (
+                SELECT lower(trim(skill)) AS name, count(*) AS cnt
+                -- skills_required is JSONB; rows holding anything but an
+                -- array (NULL, legacy scalars) contribute no skills
+                FROM active,
+                     jsonb_array_elements_text(
+                         CASE WHEN jsonb_typeof(skills_required) = 'array'
+                              THEN skills_required ELSE '[]'::jsonb END
+                     ) AS skill
+                GROUP BY 1
+                ORDER BY cnt DESC
+                LIMIT 10
+            ) s
+        ), '[]'::jsonb),
+
+        'top_companies', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('name', c.company_name, 'count', c.cnt) ORDER BY c.cnt DESC)
+            FROM (
+                SELECT company_name, count(*) AS cnt
+                FROM active
+                WHERE company_name IS NOT NULL AND company_name <> ''
+                GROUP BY company_name
+                ORDER BY cnt DESC
+                LIMIT 5
+            ) c
+        ), '[]'::jsonb),
+
+        'work_styles', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('name', w.style, 'value', w.cnt))
+            FROM (
+                SELECT CASE
+                           WHEN loc_l LIKE '%remote%' OR title_l LIKE '%remote%' THEN 'Remote'
+                           WHEN loc_l LIKE '%hybrid%' OR title_l LIKE '%hybrid%' THEN 'Hybrid'
+                           ELSE 'On-site'
+                       END AS style,
+                       count(*) AS cnt
+                FROM active
+                GROUP BY 1
+            ) w
+        ), '[]'::jsonb),
+
+        'experience_levels', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('name', e.level, 'count', e.cnt))
+            FROM (
+                SELECT CASE
+                           WHEN title_l LIKE '%senior%' OR title_l LIKE '%sr.%'
+                             OR title_l LIKE '%lead%' OR title_l LIKE '%principal%' THEN 'Senior/Lead'
+                           WHEN title_l LIKE '%junior%' OR title_l LIKE '%jr.%'
+                             OR title_l LIKE '%entry%' OR title_l LIKE '%graduate%' THEN 'Junior/Entry'
+                           WHEN title_l LIKE '%mid%' OR title_l LIKE '%intermediate%' THEN 'Mid-Level'
+                           WHEN title_l LIKE '%intern%' THEN 'Internship'
+                           ELSE 'Not Specified'
+                       END AS level,
+                       count(*) AS cnt
+                FROM active
+                GROUP BY 1
+            ) e
+        ), '[]'::jsonb),
+
+        'salary_samples', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('title', title, 'salary_range', salary_range))
+            FROM active
+            WHERE salary_range IS NOT NULL AND salary_range <> ''
+        ), '[]'::jsonb)
+    );
+$$;
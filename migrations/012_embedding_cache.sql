@@ -0,0 +1,19 @@
+-- ============================================================
+-- Migration 012: embedding_cache_jobs table
+-- ============================================================
+-- Used by: BlogAgent (weekly digest article dedup) via
+--          SupabaseAdapter.get_cached_embeddings / save_cached_embeddings
+--
+-- Trending headlines recur across consecutive RSS polls; their
+-- title+summary embeddings are stored here keyed by a content hash
+-- so repeats survive restarts without another OpenAI round-trip.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS embedding_cache_jobs (
+    content_hash  TEXT PRIMARY KEY,
+    vector        vector(384) NOT NULL,
+    created_at    TIMESTAMPTZ DEFAULT now()
+);
+
+-- Server-side only (service role); no client access
+ALTER TABLE embedding_cache_jobs ENABLE ROW LEVEL SECURITY;
@@ -0,0 +1,34 @@
+-- ============================================================
+-- Migration 013: Blog post embeddings + match_blog_posts RPC
+-- ============================================================
+-- Used by: BlogAgent.generate_weekly_digest via
+--          SupabaseAdapter.find_similar_blog_post / create_blog_post
+--
+-- Problem: consecutive weekly digests on a similar news cycle
+-- publish near-duplicate posts.
+--
+-- Fix: store a 384-d embedding of each post's title + summary and,
+-- before publishing, look for a recent post within the cosine
+-- similarity threshold. A hit is returned instead of inserting.
+-- ============================================================
+
+ALTER TABLE blog_posts_jobs
+    ADD COLUMN IF NOT EXISTS embedding vector(384);
+
+CREATE OR REPLACE FUNCTION match_blog_posts(
+    query_embedding vector(384),
+    threshold FLOAT,
+    days INT
+)
+RETURNS SETOF blog_posts_jobs
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT *
+    FROM blog_posts_jobs
+    WHERE embedding IS NOT NULL
+      AND published_at >= NOW() - make_interval(days => days)
+      AND 1 - (embedding <=> query_embedding) >= threshold
+    ORDER BY embedding <=> query_embedding
+    LIMIT 1;
+$$;
@@ -0,0 +1,22 @@
+-- ============================================================
+-- Migration 014: ai_response_cache_jobs table
+-- ============================================================
+-- Used by: EnrichmentService (job enrichment) and BlogAgent
+--          (weekly digest) via SupabaseAdapter.get_cached_ai_response
+--          / save_ai_response
+--
+-- Structured LLM outputs are stored under a SHA-256 of their
+-- normalized inputs + model, so re-enriching an identical job
+-- description (admin re-enrich, scripts) or regenerating a digest
+-- from an identical news feed skips OpenAI entirely.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS ai_response_cache_jobs (
+    prompt_hash  TEXT PRIMARY KEY,
+    response     JSONB NOT NULL,
+    model        TEXT,
+    created_at   TIMESTAMPTZ DEFAULT now()
+);
+
+-- Server-side only (service role); no client access
+ALTER TABLE ai_response_cache_jobs ENABLE ROW LEVEL SECURITY;
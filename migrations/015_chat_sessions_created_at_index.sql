@@ -0,0 +1,10 @@
+-- ============================================================
+-- Migration 015: chat_sessions_jobs created_at index
+-- ============================================================
+-- Used by: SupabaseAdapter.get_all_chat_sessions (admin Control
+--          Tower list), which pages newest-first with a
+--          created_at < cursor keyset instead of reading every row.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_chat_sessions_jobs_created_at
+    ON chat_sessions_jobs (created_at DESC);
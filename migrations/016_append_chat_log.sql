@@ -0,0 +1,39 @@
+-- ============================================================
+-- Migration 016: append_chat_log RPC
+-- ============================================================
+-- Used by: SupabaseAdapter.append_to_conversation_log — admin
+--          intercept / admin message endpoints and ChatService
+--          (user messages, AI replies, greetings)
+--
+-- Problem: appending one entry meant reading the whole
+-- conversation_log, appending in Python and writing the full
+-- array back — O(N) payload per message and a read-modify-write
+-- race between the seeker's turn and admin messages.
+--
+-- Fix: append server-side in a single UPDATE. Legacy rows that
+-- hold the log as a JSON-encoded string are unwrapped first.
+-- Returns FALSE when the session does not exist.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION append_chat_log(
+    p_session_id UUID,
+    p_entry JSONB
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE chat_sessions_jobs
+    SET conversation_log = CASE jsonb_typeof(conversation_log)
+            WHEN 'array' THEN conversation_log
+            WHEN 'string' THEN CASE
+                WHEN left(conversation_log #>> '{}', 1) = '['
+                    THEN (conversation_log #>> '{}')::jsonb
+                ELSE '[]'::jsonb
+            END
+            ELSE '[]'::jsonb
+        END || jsonb_build_array(p_entry)
+    WHERE id = p_session_id;
+    RETURN FOUND;
+END;
+$$;
@@ -0,0 +1,16 @@
+-- ============================================================
+-- Migration 017: jobs_jobs.description_chat_context
+-- ============================================================
+-- Used by: POST /chat/sessions (seeds the coach's hidden job
+--          context) via SupabaseAdapter.get_job(columns=...)
+--
+-- Scraped descriptions can be very large; the chat context only
+-- ever uses the first 3000 characters. A stored generated column
+-- keeps that prefix bounded in the row itself, so session creation
+-- selects a small field instead of the full description_raw, and
+-- every writer (scrapers, providers, re-enrichment) stays in sync.
+-- ============================================================
+
+ALTER TABLE jobs_jobs
+    ADD COLUMN IF NOT EXISTS description_chat_context TEXT
+    GENERATED ALWAYS AS (left(description_raw, 3000)) STORED;
@@ -0,0 +1,47 @@
+-- ============================================================
+-- Migration 018: Ranked job feed (HNSW on jobs_jobs.embedding)
+-- ============================================================
+-- Used by: GET /jobs/feed/recommended via
+--          SupabaseAdapter.list_ranked_jobs
+--
+-- Problem: ranking the feed against a seeker's resume would mean
+-- scoring every active job in Python.
+--
+-- Fix: an RPC returning active jobs nearest to a query embedding,
+-- so the ORDER BY ... <=> ... LIMIT is served by the HNSW index
+-- org_schema_setup.sql already creates on jobs_jobs.embedding
+-- (idx_jobs_jobs_embedding_hnsw).
+--
+-- An HNSW scan yields at most hnsw.ef_search candidates (default
+-- 40), so deeper pages would come back short. The RPC raises it
+-- for its own transaction to cover skip + match_count, up to
+-- pgvector's maximum of 1000 (the endpoint caps skip + limit to
+-- match).
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+CREATE OR REPLACE FUNCTION match_jobs_for_embedding(
+    query_embedding vector(384),
+    match_count INT,
+    skip INT DEFAULT 0
+)
+RETURNS SETOF jobs_jobs
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config(
+        'hnsw.ef_search',
+        LEAST(1000, GREATEST(40, skip + match_count))::text,
+        true  -- transaction-local
+    );
+    RETURN QUERY
+    SELECT *
+    FROM jobs_jobs
+    WHERE status = 'active'
+      AND embedding IS NOT NULL
+    ORDER BY embedding <=> query_embedding
+    LIMIT match_count
+    OFFSET skip;
+END;
+$$;
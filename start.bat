@@ -1,3 +1,3 @@
 @echo off
 echo 🚀 Starting jobs.backend on port 8001...
-python -m uvicorn main:app --reload --port 8001
+python -m uvicorn main:app --reload --port 8001 --ws-ping-interval 20 --ws-ping-timeout 20
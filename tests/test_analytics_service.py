@@ -0,0 +1,109 @@
+"""
+jobs_analytics() (migration 011) against the in-memory fallback: both paths
+of AnalyticsService.get_market_stats must produce the same response.
+
+Needs a scratch Postgres: set TEST_DATABASE_URL (the function is created in
+a throwaway schema, so any database the role can create schemas in works).
+"""
+import asyncio
+import json
+import os
+import sys
+import uuid
+
+import pytest  # type: ignore
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+asyncpg = pytest.importorskip("asyncpg")
+DSN = os.environ.get("TEST_DATABASE_URL")
+if not DSN:
+    pytest.skip("TEST_DATABASE_URL not set", allow_module_level=True)
+
+from app.services.analytics_service import AnalyticsService  # type: ignore
+
+MIGRATION = os.path.join(os.path.dirname(__file__), "..", "migrations", "011_jobs_analytics.sql")
+
+# No ties in the top-N lists, so both paths must agree on order too
+JOBS = [
+    {"title": "Senior Backend Engineer", "company_name": "EY", "location": "Remote",
+     "salary_range": "$100k - $150k", "skills_required": ["Python", "SQL", "AWS"]},
+    {"title": "Junior Data Engineer", "company_name": "EY", "location": "Pune",
+     "salary_range": "60000-80000", "skills_required": ["python", " SQL"]},
+    {"title": "Data Scientist (Hybrid)", "company_name": "KPMG", "location": "Mumbai",
+     "salary_range": None, "skills_required": ["Python"]},
+    {"title": "Product Intern", "company_name": "KPMG", "location": "Delhi",
+     "salary_range": "", "skills_required": []},
+    {"title": "Frontend Engineer", "company_name": "EY", "location": "Hybrid - Noida",
+     "salary_range": "10-20 LPA", "skills_required": None},
+]
+
+
+class _FakeDB:
+    def __init__(self, analytics: dict, jobs: list[dict]) -> None:
+        self._analytics = analytics
+        self._jobs = jobs
+
+    async def get_jobs_analytics(self) -> dict:
+        return self._analytics
+
+    async def get_all_jobs_for_analytics_raw(self) -> list[dict]:
+        return self._jobs
+
+
+async def _run_rpc(extra_rows: list[tuple] = ()) -> dict:
+    schema = f"test_analytics_{uuid.uuid4().hex[:8]}"
+    conn = await asyncpg.connect(DSN)
+    try:
+        await conn.execute(f"CREATE SCHEMA {schema}; SET search_path TO {schema}")
+        await conn.execute(
+            """
+            CREATE TABLE jobs_jobs (
+                title TEXT NOT NULL, company_name TEXT, location TEXT,
+                salary_range TEXT, skills_required JSONB, status TEXT DEFAULT 'active'
+            )
+            """
+        )
+        rows = [
+            (j["title"], j["company_name"], j["location"], j["salary_range"],
+             None if j["skills_required"] is None else json.dumps(j["skills_required"]), "active")
+            for j in JOBS
+        ]
+        await conn.executemany(
+            "INSERT INTO jobs_jobs VALUES ($1, $2, $3, $4, $5::jsonb, $6)", [*rows, *extra_rows]
+        )
+        with open(MIGRATION) as f:
+            await conn.execute(f.read())
+        return json.loads(await conn.fetchval("SELECT jobs_analytics()"))
+    finally:
+        await conn.execute(f"DROP SCHEMA {schema} CASCADE")
+        await conn.close()
+
+
+def _normalized(stats: dict) -> dict:
+    # GROUP BY output order is unspecified for the unranked lists
+    for key, sort_key in (("work_styles", "name"), ("experience_levels", "subject")):
+        stats[key] = sorted(stats[key], key=lambda d: d[sort_key])
+    return stats
+
+
+def test_server_side_matches_in_memory():
+    analytics = asyncio.run(_run_rpc())
+    db = _FakeDB(analytics, JOBS)
+
+    server = asyncio.run(AnalyticsService(db, server_side=True).get_market_stats())  # type: ignore[arg-type]
+    memory = asyncio.run(AnalyticsService(db, server_side=False).get_market_stats())  # type: ignore[arg-type]
+
+    assert _normalized(server) == _normalized(memory)
+
+
+def test_non_array_skills_are_ignored():
+    # A legacy scalar / object in skills_required must not fail the RPC
+    legacy = [
+        ("Sales Lead", "EY", "Pune", None, json.dumps("python"), "active"),
+        ("Sales Lead", "EY", "Pune", None, json.dumps({"a": 1}), "active"),
+    ]
+    analytics = asyncio.run(_run_rpc(legacy))
+
+    assert analytics["total_jobs"] == len(JOBS) + 2
+    assert analytics["top_skills"][0] == {"name": "python", "count": 3}
@@ -0,0 +1,54 @@
+"""DocumentAdapter PDF extraction: scan probe and page ordering."""
+import os
+import sys
+
+import pytest  # type: ignore
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+fitz = pytest.importorskip("fitz")
+
+from app.adapters.document_adapter import _SCAN_PROBE_PAGES, DocumentAdapter  # type: ignore
+
+
+def _pdf(pages: list[str]) -> bytes:
+    """PDF with one page per entry; an empty string leaves the page blank."""
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _page_text(i: int) -> str:
+    return f"Page {i:03d} experience and skills section text"
+
+
+@pytest.mark.parametrize("page_count", [8, 30])  # sequential and process-pool paths
+def test_blank_first_page_does_not_duplicate_pages(page_count):
+    pages = [""] + [_page_text(i) for i in range(1, page_count)]
+
+    text = DocumentAdapter._extract_pdf(_pdf(pages))
+
+    found = [line for line in text.split("\n") if line.startswith("Page ")]
+    assert found == [_page_text(i) for i in range(1, page_count)]
+
+
+def test_image_cover_pages_before_text_are_accepted():
+    # Three blank (image-only) cover pages ahead of the text pages
+    pages = [""] * 3 + [_page_text(i) for i in range(3, 8)]
+
+    text = DocumentAdapter._extract_pdf(_pdf(pages))
+
+    found = [line for line in text.split("\n") if line.startswith("Page ")]
+    assert found == [_page_text(i) for i in range(3, 8)]
+
+
+def test_scanned_pdf_stops_after_probe_pages():
+    # No text within the probe window: parsing stops before the later page
+    pages = [""] * _SCAN_PROBE_PAGES + [_page_text(_SCAN_PROBE_PAGES)] + [""] * 5
+
+    assert DocumentAdapter._extract_pdf(_pdf(pages)) == ""
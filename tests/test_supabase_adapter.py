@@ -0,0 +1,65 @@
+"""SupabaseAdapter.upsert_user against a fake PostgREST (httpx.MockTransport)."""
+import asyncio
+import json
+import os
+import sys
+
+import httpx  # type: ignore
+import pytest  # type: ignore
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pytest.importorskip("supabase")
+
+from app.adapters.supabase_adapter import SupabaseAdapter  # type: ignore
+
+
+def _adapter(rows: dict[str, dict], calls: list[httpx.Request]) -> SupabaseAdapter:
+    """Adapter whose users_jobs table is `rows`, with email NOT NULL enforced."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.method == "PATCH":
+            user_id = request.url.params["id"].removeprefix("eq.")
+            if user_id not in rows:
+                return httpx.Response(200, json=[])
+            rows[user_id].update(json.loads(request.content))
+            return httpx.Response(200, json=[rows[user_id]])
+        if request.method == "POST":
+            row = json.loads(request.content)
+            if row.get("email") is None:
+                return httpx.Response(400, json={"code": "23502"})
+            rows[row["id"]] = row
+            return httpx.Response(201, json=[row])
+        return httpx.Response(405)
+
+    http = httpx.AsyncClient(base_url="http://postgrest", transport=httpx.MockTransport(handler))
+    return SupabaseAdapter(client=None, http=http)  # type: ignore[arg-type]
+
+
+def test_resume_upload_for_existing_user_keeps_email():
+    rows = {"u1": {"id": "u1", "email": "a@example.com", "role": "seeker"}}
+    calls: list[httpx.Request] = []
+    adapter = _adapter(rows, calls)
+
+    # Same shape as UserService.process_resume's payload: no email
+    asyncio.run(adapter.upsert_user("u1", {
+        "resume_text": "text",
+        "resume_file_url": "u1/resume.pdf",
+        "resume_file_name": "resume.pdf",
+    }))
+
+    assert [c.method for c in calls] == ["PATCH"]
+    assert rows["u1"]["email"] == "a@example.com"
+    assert rows["u1"]["resume_file_name"] == "resume.pdf"
+
+
+def test_upsert_inserts_missing_user():
+    rows: dict[str, dict] = {}
+    calls: list[httpx.Request] = []
+    adapter = _adapter(rows, calls)
+
+    asyncio.run(adapter.upsert_user("u2", {"email": "b@example.com", "role": "seeker"}))
+
+    assert [c.method for c in calls] == ["PATCH", "POST"]
+    assert rows["u2"] == {"email": "b@example.com", "role": "seeker", "id": "u2"}